@@ -0,0 +1,31 @@
+"""Media blobs
+
+Revision ID: 21b3af8e1cf4
+Revises: 409a5941af32
+Create Date: 2026-10-19 18:21:44.602913
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '21b3af8e1cf4'
+down_revision = '409a5941af32'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('media_blobs',
+    sa.Column('content_hash', sa.String(length=64), nullable=False),
+    sa.Column('storage_key', sa.String(), nullable=False),
+    sa.Column('size_bytes', sa.BigInteger(), nullable=True),
+    sa.Column('ref_count', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('content_hash')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('media_blobs')
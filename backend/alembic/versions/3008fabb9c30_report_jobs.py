@@ -0,0 +1,41 @@
+"""Report jobs
+
+Revision ID: 3008fabb9c30
+Revises: b9406755ffde
+Create Date: 2026-10-20 11:40:05.318862
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3008fabb9c30'
+down_revision = 'b9406755ffde'
+branch_labels = None
+depends_on = None
+
+report_status = sa.Enum('QUEUED', 'RUNNING', 'DONE', 'FAILED', name='reportstatus')
+
+
+def upgrade() -> None:
+    report_status.create(op.get_bind(), checkfirst=True)
+    # Existing reports were never computed, so they are queued for the workers
+    op.add_column('reports', sa.Column('status', report_status, server_default='QUEUED', nullable=False))
+    op.add_column('reports', sa.Column('progress', sa.Float(), server_default='0', nullable=False))
+    op.add_column('reports', sa.Column('started_at', sa.DateTime(), nullable=True))
+    op.add_column('reports', sa.Column('finished_at', sa.DateTime(), nullable=True))
+    op.add_column('reports', sa.Column('attempts', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('reports', sa.Column('error', sa.Text(), nullable=True))
+    op.create_index('ix_reports_status_created_at', 'reports', ['status', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_reports_status_created_at', table_name='reports')
+    op.drop_column('reports', 'error')
+    op.drop_column('reports', 'attempts')
+    op.drop_column('reports', 'finished_at')
+    op.drop_column('reports', 'started_at')
+    op.drop_column('reports', 'progress')
+    op.drop_column('reports', 'status')
+    report_status.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,53 @@
+"""Agency dashboard stats
+
+Revision ID: 302c176e8449
+Revises: 5d7d67d5cc4b
+Create Date: 2026-10-20 19:32:04.118702
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '302c176e8449'
+down_revision = '5d7d67d5cc4b'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('agency_dashboard_stats',
+    sa.Column('agency_id', sa.Integer(), nullable=False),
+    sa.Column('report_count', sa.Integer(), nullable=False),
+    sa.Column('content_count', sa.Integer(), nullable=False),
+    sa.Column('pending_report_count', sa.Integer(), nullable=False),
+    sa.Column('scheduled_report_count', sa.Integer(), nullable=False),
+    sa.Column('last_report_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['agency_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('agency_id')
+    )
+    op.create_index('ix_reports_agency_id_created_at', 'reports', ['agency_id', 'created_at'], unique=False)
+    # Seed counters from existing reports (see scripts/backfill_agency_stats.py)
+    op.execute("""
+        INSERT INTO agency_dashboard_stats (
+            agency_id, report_count, content_count, pending_report_count,
+            scheduled_report_count, last_report_at, updated_at
+        )
+        SELECT r.agency_id,
+               COUNT(*),
+               COUNT(DISTINCT r.content_id),
+               SUM(CASE WHEN r.status IN ('QUEUED', 'RUNNING') THEN 1 ELSE 0 END),
+               COUNT(s.id),
+               MAX(r.created_at),
+               CURRENT_TIMESTAMP
+        FROM reports r
+        LEFT JOIN report_schedules s ON s.report_id = r.id
+        GROUP BY r.agency_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_reports_agency_id_created_at', table_name='reports')
+    op.drop_table('agency_dashboard_stats')
@@ -0,0 +1,38 @@
+"""Content media metadata
+
+Revision ID: 409a5941af32
+Revises: aa74e0262bef
+Create Date: 2026-10-19 16:48:09.315562
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '409a5941af32'
+down_revision = 'aa74e0262bef'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('contents', sa.Column('mime_type', sa.String(), nullable=True))
+    op.add_column('contents', sa.Column('size_bytes', sa.BigInteger(), nullable=True))
+    op.add_column('contents', sa.Column('content_hash', sa.String(length=64), nullable=True))
+    op.add_column('contents', sa.Column('width', sa.Integer(), nullable=True))
+    op.add_column('contents', sa.Column('height', sa.Integer(), nullable=True))
+    op.add_column('contents', sa.Column('duration_seconds', sa.Float(), nullable=True))
+    op.add_column('contents', sa.Column('metadata_extracted_at', sa.DateTime(), nullable=True))
+    op.create_index(op.f('ix_contents_content_hash'), 'contents', ['content_hash'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_contents_content_hash'), table_name='contents')
+    op.drop_column('contents', 'metadata_extracted_at')
+    op.drop_column('contents', 'duration_seconds')
+    op.drop_column('contents', 'height')
+    op.drop_column('contents', 'width')
+    op.drop_column('contents', 'content_hash')
+    op.drop_column('contents', 'size_bytes')
+    op.drop_column('contents', 'mime_type')
@@ -0,0 +1,35 @@
+"""Report result cache
+
+Revision ID: 40da691300ae
+Revises: 3008fabb9c30
+Create Date: 2026-10-20 14:03:51.627094
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '40da691300ae'
+down_revision = '3008fabb9c30'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('contents', sa.Column('data_version', sa.Integer(), server_default='0', nullable=False))
+    op.create_table('report_result_cache',
+    sa.Column('cache_key', sa.String(length=64), nullable=False),
+    sa.Column('results', sa.JSON(), nullable=False),
+    sa.Column('size_bytes', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('last_used_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('cache_key')
+    )
+    op.create_index(op.f('ix_report_result_cache_last_used_at'), 'report_result_cache', ['last_used_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_report_result_cache_last_used_at'), table_name='report_result_cache')
+    op.drop_table('report_result_cache')
+    op.drop_column('contents', 'data_version')
@@ -0,0 +1,41 @@
+"""Report schedules
+
+Revision ID: 45672825ccf6
+Revises: 40da691300ae
+Create Date: 2026-10-20 16:25:12.904317
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '45672825ccf6'
+down_revision = '40da691300ae'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('report_schedules',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('report_id', sa.Integer(), nullable=False),
+    sa.Column('frequency', sa.Enum('WEEKLY', 'MONTHLY', name='reportfrequency'), nullable=False),
+    sa.Column('recipient_email', sa.String(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.Column('next_run_at', sa.DateTime(), nullable=False),
+    sa.Column('last_run_at', sa.DateTime(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['report_id'], ['reports.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('report_id')
+    )
+    op.create_index(op.f('ix_report_schedules_id'), 'report_schedules', ['id'], unique=False)
+    op.create_index('ix_report_schedules_active_next_run_at', 'report_schedules', ['is_active', 'next_run_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_report_schedules_active_next_run_at', table_name='report_schedules')
+    op.drop_index(op.f('ix_report_schedules_id'), table_name='report_schedules')
+    op.drop_table('report_schedules')
+    sa.Enum(name='reportfrequency').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,38 @@
+"""Subscription daily rollups
+
+Revision ID: 537b7380c6ec
+Revises: d206819da7bb
+Create Date: 2026-10-19 11:03:17.204857
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '537b7380c6ec'
+down_revision = 'd206819da7bb'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('subscriptions', sa.Column('canceled_at', sa.DateTime(), nullable=True))
+    op.create_table('subscription_daily_rollups',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('plan_id', sa.Integer(), nullable=False),
+    sa.Column('activations', sa.Integer(), nullable=False),
+    sa.Column('cancellations', sa.Integer(), nullable=False),
+    sa.Column('mrr_delta', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.ForeignKeyConstraint(['plan_id'], ['subscription_plans.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('day', 'plan_id', name='uq_subscription_daily_rollups_day_plan')
+    )
+    op.create_index(op.f('ix_subscription_daily_rollups_id'), 'subscription_daily_rollups', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_subscription_daily_rollups_id'), table_name='subscription_daily_rollups')
+    op.drop_table('subscription_daily_rollups')
+    op.drop_column('subscriptions', 'canceled_at')
@@ -0,0 +1,28 @@
+"""Content and report updated_at
+
+Revision ID: 54a0898aceaf
+Revises: 7eda12ee8ae2
+Create Date: 2026-10-20 22:03:19.847125
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '54a0898aceaf'
+down_revision = '7eda12ee8ae2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('contents', sa.Column('updated_at', sa.DateTime(), nullable=True))
+    op.add_column('reports', sa.Column('updated_at', sa.DateTime(), nullable=True))
+    op.execute("UPDATE contents SET updated_at = created_at")
+    op.execute("UPDATE reports SET updated_at = COALESCE(finished_at, created_at)")
+
+
+def downgrade() -> None:
+    op.drop_column('reports', 'updated_at')
+    op.drop_column('contents', 'updated_at')
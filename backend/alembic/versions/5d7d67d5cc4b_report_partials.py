@@ -0,0 +1,41 @@
+"""Report partials
+
+Revision ID: 5d7d67d5cc4b
+Revises: 45672825ccf6
+Create Date: 2026-10-20 18:47:30.551238
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d7d67d5cc4b'
+down_revision = '45672825ccf6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('report_partials',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('report_id', sa.Integer(), nullable=False),
+    sa.Column('content_id', sa.Integer(), nullable=False),
+    sa.Column('data_version', sa.Integer(), nullable=False),
+    sa.Column('parameters_hash', sa.String(length=64), nullable=False),
+    sa.Column('row_count', sa.Integer(), nullable=False),
+    sa.Column('partial', sa.JSON(), nullable=False),
+    sa.Column('computed_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['content_id'], ['contents.id'], ),
+    sa.ForeignKeyConstraint(['report_id'], ['reports.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('report_id', 'content_id', name='uq_report_partials_report_content')
+    )
+    op.create_index(op.f('ix_report_partials_content_id'), 'report_partials', ['content_id'], unique=False)
+    op.create_index(op.f('ix_report_partials_id'), 'report_partials', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_report_partials_id'), table_name='report_partials')
+    op.drop_index(op.f('ix_report_partials_content_id'), table_name='report_partials')
+    op.drop_table('report_partials')
@@ -0,0 +1,42 @@
+"""Content uploads
+
+Revision ID: 72af0474fa57
+Revises: 537b7380c6ec
+Create Date: 2026-10-19 13:27:52.918406
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '72af0474fa57'
+down_revision = '537b7380c6ec'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('content_uploads',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('creator_id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(), nullable=False),
+    sa.Column('filename', sa.String(), nullable=False),
+    sa.Column('storage_key', sa.String(), nullable=False),
+    sa.Column('total_size', sa.BigInteger(), nullable=False),
+    sa.Column('received_size', sa.BigInteger(), nullable=False),
+    sa.Column('checksum', sa.String(), nullable=True),
+    sa.Column('status', sa.Enum('PENDING', 'COMPLETED', name='uploadstatus'), nullable=False),
+    sa.Column('content_id', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['content_id'], ['contents.id'], ),
+    sa.ForeignKeyConstraint(['creator_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_content_uploads_creator_id'), 'content_uploads', ['creator_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_content_uploads_creator_id'), table_name='content_uploads')
+    op.drop_table('content_uploads')
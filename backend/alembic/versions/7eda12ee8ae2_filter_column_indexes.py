@@ -0,0 +1,37 @@
+"""Filter column indexes
+
+Revision ID: 7eda12ee8ae2
+Revises: 807877656f20
+Create Date: 2026-10-20 21:14:52.604417
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7eda12ee8ae2'
+down_revision = '807877656f20'
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ('ix_contents_creator_id_created_at', 'contents', ['creator_id', 'created_at']),
+    ('ix_subscriptions_user_id_status', 'subscriptions', ['user_id', 'status']),
+    ('ix_subscriptions_plan_id', 'subscriptions', ['plan_id']),
+    ('ix_users_role', 'users', ['role']),
+]
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction; building
+    # concurrently keeps these tables writable on PostgreSQL meanwhile
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,24 @@
+"""Reports content keyset index
+
+Revision ID: 807877656f20
+Revises: 302c176e8449
+Create Date: 2026-10-20 20:05:41.392716
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '807877656f20'
+down_revision = '302c176e8449'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_reports_content_id_created_at_id', 'reports', ['content_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_reports_content_id_created_at_id', table_name='reports')
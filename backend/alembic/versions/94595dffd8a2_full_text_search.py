@@ -0,0 +1,69 @@
+"""Full-text search over content titles and report names
+
+Revision ID: 94595dffd8a2
+Revises: 21b3af8e1cf4
+Create Date: 2026-10-20 09:37:15.118240
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '94595dffd8a2'
+down_revision = '21b3af8e1cf4'
+branch_labels = None
+depends_on = None
+
+SQLITE_FTS_TABLES = [
+    ('contents', 'title'),
+    ('reports', 'name'),
+]
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute(
+            "ALTER TABLE contents ADD COLUMN search_vector tsvector "
+            "GENERATED ALWAYS AS (to_tsvector('simple', coalesce(title, ''))) STORED"
+        )
+        op.execute(
+            "ALTER TABLE reports ADD COLUMN search_vector tsvector "
+            "GENERATED ALWAYS AS (to_tsvector('simple', coalesce(name, ''))) STORED"
+        )
+        op.create_index('ix_contents_search_vector', 'contents', ['search_vector'], postgresql_using='gin')
+        op.create_index('ix_reports_search_vector', 'reports', ['search_vector'], postgresql_using='gin')
+        return
+
+    for table, column in SQLITE_FTS_TABLES:
+        fts = f'{table}_fts'
+        op.execute(f"CREATE VIRTUAL TABLE {fts} USING fts5({column}, content='{table}', content_rowid='id')")
+        op.execute(
+            f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {table} BEGIN "
+            f"INSERT INTO {fts}(rowid, {column}) VALUES (new.id, new.{column}); END"
+        )
+        op.execute(
+            f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {table} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, {column}) VALUES ('delete', old.id, old.{column}); END"
+        )
+        op.execute(
+            f"CREATE TRIGGER {fts}_au AFTER UPDATE OF {column} ON {table} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, {column}) VALUES ('delete', old.id, old.{column}); "
+            f"INSERT INTO {fts}(rowid, {column}) VALUES (new.id, new.{column}); END"
+        )
+        op.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_index('ix_reports_search_vector', table_name='reports')
+        op.drop_index('ix_contents_search_vector', table_name='contents')
+        op.drop_column('reports', 'search_vector')
+        op.drop_column('contents', 'search_vector')
+        return
+
+    for table, _ in SQLITE_FTS_TABLES:
+        fts = f'{table}_fts'
+        for suffix in ('ai', 'ad', 'au'):
+            op.execute(f"DROP TRIGGER IF EXISTS {fts}_{suffix}")
+        op.execute(f"DROP TABLE IF EXISTS {fts}")
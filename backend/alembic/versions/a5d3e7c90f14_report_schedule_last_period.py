@@ -0,0 +1,30 @@
+"""Report schedule last period
+
+Revision ID: a5d3e7c90f14
+Revises: e83f1c5a9b27
+Create Date: 2026-10-21 14:26:08.402913
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a5d3e7c90f14'
+down_revision = 'e83f1c5a9b27'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('report_schedules', sa.Column('last_period_start', sa.DateTime(), nullable=True))
+    op.add_column('report_schedules', sa.Column('last_period_end', sa.DateTime(), nullable=True))
+    op.add_column('report_schedules', sa.Column('last_results', sa.JSON(), nullable=True))
+    op.add_column('report_schedules', sa.Column('last_error', sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('report_schedules', 'last_error')
+    op.drop_column('report_schedules', 'last_results')
+    op.drop_column('report_schedules', 'last_period_end')
+    op.drop_column('report_schedules', 'last_period_start')
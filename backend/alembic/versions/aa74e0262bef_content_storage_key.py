@@ -0,0 +1,24 @@
+"""Content storage key
+
+Revision ID: aa74e0262bef
+Revises: 72af0474fa57
+Create Date: 2026-10-19 15:02:36.774120
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'aa74e0262bef'
+down_revision = '72af0474fa57'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('contents', sa.Column('storage_key', sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('contents', 'storage_key')
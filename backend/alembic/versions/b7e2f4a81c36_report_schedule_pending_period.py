@@ -0,0 +1,26 @@
+"""Report schedule pending period
+
+Revision ID: b7e2f4a81c36
+Revises: a5d3e7c90f14
+Create Date: 2026-10-21 16:48:51.730264
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7e2f4a81c36'
+down_revision = 'a5d3e7c90f14'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('report_schedules', sa.Column('pending_period_start', sa.DateTime(), nullable=True))
+    op.add_column('report_schedules', sa.Column('pending_period_end', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('report_schedules', 'pending_period_end')
+    op.drop_column('report_schedules', 'pending_period_start')
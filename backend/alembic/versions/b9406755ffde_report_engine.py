@@ -0,0 +1,47 @@
+"""Report engine
+
+Revision ID: b9406755ffde
+Revises: 94595dffd8a2
+Create Date: 2026-10-20 09:12:37.184526
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b9406755ffde'
+down_revision = '94595dffd8a2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('content_metrics',
+    sa.Column('id', sa.BigInteger().with_variant(sa.Integer(), 'sqlite'), nullable=False),
+    sa.Column('content_id', sa.Integer(), nullable=False),
+    sa.Column('recorded_at', sa.DateTime(), nullable=False),
+    sa.Column('platform', sa.String(), nullable=True),
+    sa.Column('country', sa.String(length=2), nullable=True),
+    sa.Column('views', sa.BigInteger(), nullable=False),
+    sa.Column('likes', sa.BigInteger(), nullable=False),
+    sa.Column('comments', sa.BigInteger(), nullable=False),
+    sa.Column('shares', sa.BigInteger(), nullable=False),
+    sa.Column('watch_time_seconds', sa.BigInteger(), nullable=False),
+    sa.Column('revenue', sa.Numeric(precision=14, scale=4), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['content_id'], ['contents.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_content_metrics_content_id_recorded_at', 'content_metrics', ['content_id', 'recorded_at'], unique=False)
+    op.add_column('reports', sa.Column('parameters', sa.JSON(), nullable=True))
+    op.add_column('reports', sa.Column('results', sa.JSON(), nullable=True))
+    op.add_column('reports', sa.Column('computed_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('reports', 'computed_at')
+    op.drop_column('reports', 'results')
+    op.drop_column('reports', 'parameters')
+    op.drop_index('ix_content_metrics_content_id_recorded_at', table_name='content_metrics')
+    op.drop_table('content_metrics')
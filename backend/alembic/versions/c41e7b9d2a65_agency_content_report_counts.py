@@ -0,0 +1,38 @@
+"""Agency content report counts
+
+Revision ID: c41e7b9d2a65
+Revises: 54a0898aceaf
+Create Date: 2026-10-21 10:14:52.630417
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c41e7b9d2a65'
+down_revision = '54a0898aceaf'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('agency_content_report_counts',
+    sa.Column('agency_id', sa.Integer(), nullable=False),
+    sa.Column('content_id', sa.Integer(), nullable=False),
+    sa.Column('report_count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['agency_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['content_id'], ['contents.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('agency_id', 'content_id')
+    )
+    # Seed from existing reports (see scripts/backfill_agency_stats.py)
+    op.execute("""
+        INSERT INTO agency_content_report_counts (agency_id, content_id, report_count)
+        SELECT agency_id, content_id, COUNT(*)
+        FROM reports
+        GROUP BY agency_id, content_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('agency_content_report_counts')
@@ -0,0 +1,49 @@
+"""One active subscription per user
+
+Revision ID: d206819da7bb
+Revises: 83ba08c75991
+Create Date: 2026-10-19 09:12:41.530218
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd206819da7bb'
+down_revision = '83ba08c75991'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Past races left some users with several ACTIVE rows; keep the newest
+    # and cancel the rest, or the unique index can't be built
+    op.execute(sa.text("""
+        UPDATE subscriptions SET status = 'CANCELED'
+        WHERE status = 'ACTIVE' AND EXISTS (
+            SELECT 1 FROM subscriptions AS newer
+            WHERE newer.user_id = subscriptions.user_id
+              AND newer.status = 'ACTIVE'
+              AND (
+                  newer.started_at > subscriptions.started_at
+                  OR (newer.started_at = subscriptions.started_at AND newer.id > subscriptions.id)
+                  OR (subscriptions.started_at IS NULL AND newer.started_at IS NOT NULL)
+                  OR (newer.started_at IS NULL AND subscriptions.started_at IS NULL AND newer.id > subscriptions.id)
+              )
+        )
+    """))
+
+    # Enum columns store the member name, so the predicate matches 'ACTIVE'
+    op.create_index(
+        'uq_subscriptions_user_id_active',
+        'subscriptions',
+        ['user_id'],
+        unique=True,
+        postgresql_where=sa.text("status = 'ACTIVE'"),
+        sqlite_where=sa.text("status = 'ACTIVE'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_subscriptions_user_id_active', table_name='subscriptions')
@@ -0,0 +1,24 @@
+"""Report job heartbeat
+
+Revision ID: e83f1c5a9b27
+Revises: c41e7b9d2a65
+Create Date: 2026-10-21 11:02:37.915284
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e83f1c5a9b27'
+down_revision = 'c41e7b9d2a65'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('reports', sa.Column('heartbeat_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('reports', 'heartbeat_at')
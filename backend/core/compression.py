@@ -0,0 +1,168 @@
+import gzip
+import zlib
+from typing import List, Optional, Tuple
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # gzip only
+    brotli = None
+
+COMPRESSIBLE_TYPES = ("text/", "application/json", "application/x-ndjson", "application/xml", "application/javascript")
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """Pick br or gzip from an Accept-Encoding header, by q-value then our preference"""
+    offered = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        offered[coding.strip().lower()] = q
+
+    preference = ["br", "gzip"] if brotli is not None else ["gzip"]
+    candidates = [
+        (offered.get(coding, offered.get("*", 0.0)), -rank, coding)
+        for rank, coding in enumerate(preference)
+    ]
+    q, _, coding = max(candidates)
+    return coding if q > 0 else None
+
+class _Compressor:
+    """Incremental gzip or brotli stream; ``flush`` emits what a client can
+    decode so far, so streamed chunks aren't held back"""
+
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        if encoding == "br":
+            self._br = brotli.Compressor(quality=brotli_quality)
+            self._zlib = None
+        else:
+            self._br = None
+            self._zlib = zlib.compressobj(gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes, flush: bool = False, finish: bool = False) -> bytes:
+        if self._br is not None:
+            out = self._br.process(data)
+            if finish:
+                return out + self._br.finish()
+            return out + self._br.flush() if flush else out
+
+        out = self._zlib.compress(data)
+        if finish:
+            return out + self._zlib.flush(zlib.Z_FINISH)
+        return out + self._zlib.flush(zlib.Z_SYNC_FLUSH) if flush else out
+
+def compress_body(body: bytes, encoding: str, gzip_level: int, brotli_quality: int) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=brotli_quality)
+    return gzip.compress(body, compresslevel=gzip_level, mtime=0)
+
+class CompressionMiddleware:
+    """gzip/brotli response compression negotiated from Accept-Encoding.
+
+    Whole responses smaller than ``minimum_size`` go out as-is; streamed
+    responses are compressed chunk by chunk. Responses that are already
+    encoded, not text-like (media files) or partial (Range) pass through
+    untouched, zero-copy file sends included.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 4):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+class _CompressionResponder:
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self.downstream = send
+        self.start_message: Optional[Message] = None
+        self.compressor: Optional[_Compressor] = None
+        self.passthrough = False
+
+    def _compressible(self, headers: Headers, status: int) -> bool:
+        if status in (204, 206, 304) or "content-encoding" in headers:
+            return False
+        if "accept-ranges" in headers:
+            # Byte ranges address the identity encoding (core.responses.file_response)
+            return False
+        return headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES)
+
+    def _encoded_headers(self, content_length: Optional[int]) -> List[Tuple[bytes, bytes]]:
+        headers = MutableHeaders(raw=list(self.start_message["headers"]))
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        if content_length is None:
+            del headers["Content-Length"]
+        else:
+            headers["Content-Length"] = str(content_length)
+        return headers.raw
+
+    async def send(self, message: Message) -> None:
+        if self.passthrough:
+            await self.downstream(message)
+            return
+
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            if not self._compressible(headers, message["status"]):
+                self.passthrough = True
+                await self.downstream(message)
+                return
+            # Held until the first body chunk shows whether to compress
+            self.start_message = message
+            return
+
+        if message["type"] != "http.response.body":
+            if self.compressor is None:
+                self.passthrough = True
+                await self.downstream(self.start_message)
+            await self.downstream(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        middleware = self.middleware
+
+        if self.compressor is None and not more_body:
+            # Whole response in one message
+            if len(body) < middleware.minimum_size:
+                self.passthrough = True
+                await self.downstream(self.start_message)
+                await self.downstream(message)
+                return
+
+            compressed = compress_body(body, self.encoding, middleware.gzip_level, middleware.brotli_quality)
+            await self.downstream({**self.start_message, "headers": self._encoded_headers(len(compressed))})
+            await self.downstream({"type": "http.response.body", "body": compressed, "more_body": False})
+            return
+
+        if self.compressor is None:
+            # Streaming: length unknown, so compress every chunk as it comes
+            self.compressor = _Compressor(self.encoding, middleware.gzip_level, middleware.brotli_quality)
+            await self.downstream({**self.start_message, "headers": self._encoded_headers(None)})
+
+        await self.downstream({
+            "type": "http.response.body",
+            "body": self.compressor.compress(body, flush=more_body, finish=not more_body),
+            "more_body": more_body,
+        })
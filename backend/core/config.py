@@ -1,4 +1,4 @@
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import field_validator
 from typing import List
 
@@ -17,6 +17,51 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
 
+    # Content
+    CONTENT_BULK_MAX_ITEMS: int = 500
+    CONTENT_METRICS_MAX_ITEMS: int = 10000  # Metric rows per ingest request
+
+    # File storage & uploads
+    STORAGE_BACKEND: str = "local"  # local, s3
+    STORAGE_LOCAL_ROOT: str = "media"
+    STORAGE_PUBLIC_BASE_URL: str = "/media"
+    STORAGE_SIGNED_URL_BASE: str = "/api/v1/content/storage"  # local backend presigned URLs
+    STORAGE_PRESIGN_EXPIRES_SECONDS: int = 3600
+    STORAGE_ACCEL_REDIRECT: bool = False  # Let nginx serve local files via X-Accel-Redirect
+    STORAGE_ACCEL_REDIRECT_PREFIX: str = "/protected-media"
+    S3_BUCKET: str = ""
+    S3_ENDPOINT_URL: str = ""  # e.g. http://minio:9000 for a local MinIO
+    S3_REGION: str = "us-east-1"
+    S3_ACCESS_KEY_ID: str = ""
+    S3_SECRET_ACCESS_KEY: str = ""
+    S3_PUBLIC_BASE_URL: str = ""
+
+    # Media processing
+    MEDIA_WORKERS: int = 0  # 0 = one worker process per CPU core
+    RENDITION_SIZES: List[int] = [128, 320, 640]  # Max thumbnail edge in pixels
+    RENDITION_CACHE_MAX_AGE: int = 31536000  # Renditions never change once written
+    UPLOAD_CHUNK_SIZE: int = 1024 * 1024  # 1 MiB
+    UPLOAD_MAX_SIZE: int = 10 * 1024 * 1024 * 1024  # 10 GiB
+
+    # Report jobs
+    REPORT_WORKERS: int = 2  # Worker processes started by scripts/report_worker.py
+    REPORT_MAX_RUNNING_PER_AGENCY: int = 1
+    REPORT_POLL_INTERVAL_SECONDS: float = 2.0
+    REPORT_JOB_TIMEOUT_SECONDS: int = 1800  # Running jobs without a heartbeat for this long are requeued
+    REPORT_JOB_HEARTBEAT_SECONDS: int = 30  # A running job's heartbeat is refreshed at least this often
+    REPORT_MAX_ATTEMPTS: int = 3
+    REPORT_EXPORT_BATCH_SIZE: int = 5000  # Rows fetched per server-side cursor batch
+    REPORT_CACHE_MAX_BYTES: int = 256 * 1024 * 1024  # Result cache budget before LRU eviction
+    REPORT_SCHEDULER_TICK_SECONDS: int = 60
+    REPORT_SCHEDULE_BATCH_SIZE: int = 200  # Due schedules claimed per tick
+    REPORT_SCHEDULE_JITTER_SECONDS: int = 900  # Spread runs that share a period boundary
+    REPORT_SCHEDULE_RETRY_SECONDS: int = 900  # Reclaim a period whose run never finished after this
+
+    # Response compression
+    COMPRESSION_MINIMUM_SIZE: int = 1024  # Smaller whole responses aren't worth the CPU
+    COMPRESSION_GZIP_LEVEL: int = 6  # 1-9
+    COMPRESSION_BROTLI_QUALITY: int = 4  # 0-11; used when the brotli package is installed
+
     # CORS
     ALLOWED_HOSTS: List[str] = ["*"]
 
@@ -50,10 +95,11 @@ class Settings(BaseSettings):
             return [i.strip() for i in v.split(",")]
         return v
 
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
-        extra = "ignore"  # ✅ Prevents errors from extra env keys
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        case_sensitive=True,
+        extra="ignore"  # ✅ Prevents errors from extra env keys
+    )
 
 
 settings = Settings()
@@ -0,0 +1,242 @@
+import hashlib
+import os
+import re
+from datetime import datetime
+from email.utils import formatdate
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+import anyio
+import orjson
+from pydantic import BaseModel, ConfigDict, TypeAdapter, create_model, field_validator
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+
+RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+def make_weak_etag(stat_result: os.stat_result) -> str:
+    """Weak ETag from a file's mtime and size"""
+    return f'W/"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+
+def make_row_etag(*parts: Any) -> str:
+    """Weak ETag from a row's version columns (and those of rows embedded in
+    its response), so it can be checked without loading the row"""
+    digest = hashlib.blake2b("|".join(map(str, parts)).encode(), digest_size=8).hexdigest()
+    return f'W/"{digest}"'
+
+# Clients may keep a copy but must revalidate it on every use
+REVALIDATE_HEADERS = {"Cache-Control": "private, no-cache"}
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={**REVALIDATE_HEADERS, "ETag": etag})
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+def parse_range(range_header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """Parse a single-range ``Range`` header into inclusive (start, end).
+
+    Returns None when the whole file should be sent (no header, or a
+    multi-range request we answer in full) and raises ValueError when the
+    range can't be satisfied.
+    """
+    if not range_header:
+        return None
+
+    match = RANGE_RE.match(range_header.strip())
+    if not match:
+        return None
+
+    start, end = match.groups()
+    if not start and not end:
+        raise ValueError("Empty range")
+    if size == 0:
+        # No byte of an empty file can be addressed, suffix ranges included
+        raise ValueError("Range not satisfiable")
+
+    if not start:
+        # Suffix range: the last N bytes
+        length = int(end)
+        if length == 0:
+            raise ValueError("Empty suffix range")
+        return max(size - length, 0), size - 1
+
+    start = int(start)
+    end = min(int(end), size - 1) if end else size - 1
+    if start >= size or start > end:
+        raise ValueError("Range not satisfiable")
+
+    return start, end
+
+class RangeFileResponse(Response):
+    """Streams a byte range of a file, using the ASGI zero-copy send
+    extension (sendfile) when the server offers it."""
+
+    chunk_size = 64 * 1024
+
+    def __init__(
+        self,
+        path: str,
+        start: int,
+        end: int,
+        status_code: int = 200,
+        media_type: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None
+    ):
+        self.path = path
+        self.start = start
+        self.length = end - start + 1
+        self.status_code = status_code
+        self.media_type = media_type
+        self.background = None
+        self.init_headers({**(headers or {}), "Content-Length": str(self.length)})
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send({
+            "type": "http.response.start",
+            "status": self.status_code,
+            "headers": self.raw_headers,
+        })
+
+        if scope["method"].upper() == "HEAD" or self.length == 0:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+
+        if "http.response.zerocopysend" in scope.get("extensions", {}):
+            with open(self.path, "rb") as f:
+                await send({
+                    "type": "http.response.zerocopysend",
+                    "file": f,
+                    "offset": self.start,
+                    "count": self.length,
+                    "more_body": False,
+                })
+            return
+
+        remaining = self.length
+        async with await anyio.open_file(self.path, "rb") as f:
+            await f.seek(self.start)
+            while remaining > 0:
+                chunk = await f.read(min(self.chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                await send({
+                    "type": "http.response.body",
+                    "body": chunk,
+                    "more_body": remaining > 0,
+                })
+
+        if remaining > 0:
+            # File shrank underneath us; end the body rather than hang
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+def file_response(
+    path: str,
+    request: Request,
+    media_type: Optional[str] = None,
+    headers: Optional[Dict[str, str]] = None
+) -> Response:
+    """Serve a file honouring Range, If-Range and If-None-Match"""
+    stat_result = os.stat(path)
+    size = stat_result.st_size
+    etag = make_weak_etag(stat_result)
+    base_headers = {
+        **(headers or {}),
+        "ETag": etag,
+        "Last-Modified": formatdate(stat_result.st_mtime, usegmt=True),
+        "Accept-Ranges": "bytes",
+    }
+
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=base_headers)
+
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if if_range and if_range.strip() not in (etag, base_headers["Last-Modified"]):
+        # The client's copy is stale, so a partial response would corrupt it
+        range_header = None
+
+    try:
+        byte_range = parse_range(range_header, size)
+    except ValueError:
+        return Response(
+            status_code=416,
+            headers={**base_headers, "Content-Range": f"bytes */{size}"}
+        )
+
+    if byte_range is None:
+        return RangeFileResponse(path, 0, size - 1, 200, media_type, base_headers)
+
+    start, end = byte_range
+    return RangeFileResponse(
+        path,
+        start,
+        end,
+        206,
+        media_type,
+        {**base_headers, "Content-Range": f"bytes {start}-{end}/{size}"}
+    )
+
+def subset_schema(schema: Type[BaseModel], fields: Sequence[str]) -> Type[BaseModel]:
+    """A from_attributes model with only ``fields`` of ``schema``, in schema
+    order, keeping the field validators that apply to them"""
+    validators = {}
+    for name, decorator in schema.__pydantic_decorators__.field_validators.items():
+        targets = [field for field in decorator.info.fields if field in fields]
+        if targets:
+            validators[name] = field_validator(*targets, mode=decorator.info.mode)(classmethod(decorator.func.__func__))
+
+    return create_model(
+        f"{schema.__name__}Fields",
+        __config__=ConfigDict(from_attributes=True),
+        __validators__=validators,
+        **{
+            name: (field.annotation, field)
+            for name, field in schema.model_fields.items() if name in fields
+        }
+    )
+
+class PageSerializer:
+    """Renders a paginated envelope of ORM rows straight to JSON bytes.
+
+    The item serializer is compiled once per schema, and once per sparse
+    fieldset requested. Rows are read by attribute and dumped by
+    pydantic-core, so list endpoints skip jsonable_encoder and the
+    intermediate dicts entirely.
+    """
+
+    def __init__(self, schema: Type[BaseModel]):
+        self.schema = schema
+        self.adapter = TypeAdapter(List[schema])
+        self._subset_adapters: Dict[frozenset, TypeAdapter] = {}
+
+    def _adapter_for(self, fields: Optional[Sequence[str]]) -> TypeAdapter:
+        if not fields:
+            return self.adapter
+        key = frozenset(fields)
+        if key not in self._subset_adapters:
+            self._subset_adapters[key] = TypeAdapter(List[subset_schema(self.schema, fields)])
+        return self._subset_adapters[key]
+
+    def render(self, page: Dict[str, Any], message: str, fields: Optional[Sequence[str]] = None) -> bytes:
+        adapter = self._adapter_for(fields)
+        items = adapter.dump_json(adapter.validate_python(page["items"], from_attributes=True))
+        meta = orjson.dumps({key: value for key, value in page.items() if key != "items"})
+        data = b'{"items":' + items + (b"," + meta[1:] if len(meta) > 2 else b"}")
+
+        # Same envelope as core.utils.create_response
+        envelope = orjson.dumps({
+            "success": True,
+            "message": message,
+            "timestamp": datetime.utcnow().isoformat()
+        })
+        return envelope[:-1] + b',"data":' + data + b"}"
+
+    def response(self, page: Dict[str, Any], message: str, fields: Optional[Sequence[str]] = None) -> Response:
+        return Response(self.render(page, message, fields), media_type="application/json")
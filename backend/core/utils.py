@@ -1,7 +1,8 @@
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Optional, List, Sequence
 import uuid
 from datetime import datetime
-from sqlalchemy.orm import Query
+from fastapi import HTTPException, status
+from sqlalchemy.orm import Query, Session, load_only
 
 def generate_uuid() -> str:
     """Generate a unique UUID string"""
@@ -40,6 +41,44 @@ def paginate_query(
         "pages": (total + per_page - 1) // per_page if total > 0 else 0
     }
 
+def parse_fields(fields: Optional[str], allowed: Sequence[str]) -> Optional[List[str]]:
+    """Validate a comma-separated ``fields`` (sparse fieldset) parameter
+    against a resource's whitelist; None means every field"""
+    if fields is None:
+        return None
+
+    requested = list(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+    unknown = [name for name in requested if name not in allowed]
+    if not requested or unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(unknown) or '(none given)'}. Allowed: {', '.join(allowed)}"
+        )
+    return requested
+
+def load_fields(query, model, fields: Optional[Sequence[str]], always: Sequence[str] = ()):
+    """Restrict a Query or select() to the columns behind a sparse fieldset;
+    the primary key is always loaded so rows keep their identity"""
+    if not fields:
+        return query
+    names = list(dict.fromkeys([*fields, *always]))
+    unknown = [name for name in names if name not in model.__table__.columns]
+    if unknown:
+        # A whitelist naming something that isn't a column is a client-visible 400, not a crash
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(unknown)}"
+        )
+    return query.options(load_only(*(getattr(model, name) for name in names)))
+
+def dialect_insert(db: Session):
+    """Return the dialect-specific insert() supporting ON CONFLICT upserts"""
+    if db.get_bind().dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert
+
 class APIException(Exception):
     """Custom API exception"""
     def __init__(self, status_code: int, detail: str):
@@ -1,12 +1,15 @@
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from sqlalchemy.exc import SQLAlchemyError
 from core.config import settings
+from core.compression import CompressionMiddleware
 from core.utils import APIException, create_response
 from routes.api import api_router
 from database import engine
+from services.media_metadata_service import shutdown_media_executor
+from services.search_service import ensure_search_index
 from models import Base
 import logging
 
@@ -16,6 +19,7 @@ logger = logging.getLogger(__name__)
 
 # Create database tables
 Base.metadata.create_all(bind=engine)
+ensure_search_index(engine)
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -25,6 +29,15 @@ app = FastAPI(
     debug=settings.DEBUG,
     docs_url="/docs" if settings.DEBUG else None,
     redoc_url="/redoc" if settings.DEBUG else None,
+    default_response_class=ORJSONResponse,
+)
+
+# Compress JSON and text responses for clients that accept gzip or brotli
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+    gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+    brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
 )
 
 # Add CORS middleware
@@ -111,8 +124,12 @@ async def startup_event():
     logger.info("   - /api/v1/content - Content management endpoints")
     logger.info("   - /api/v1/reports - Report management endpoints")
     logger.info("   - /api/v1/subscriptions - Subscription management endpoints")
+    logger.info("   - /api/v1/search - Search endpoints")
+    logger.info("   - /api/v1/agency - Agency dashboard endpoints")
+    logger.info("   - /api/v1/admin - Admin dashboard endpoints")
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Shutdown event handler"""
     logger.info(f"🛑 {settings.PROJECT_NAME} is shutting down...")
+    shutdown_media_executor()
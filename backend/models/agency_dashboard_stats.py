@@ -0,0 +1,25 @@
+from sqlalchemy import Column, Integer, DateTime, ForeignKey
+from datetime import datetime
+from models.base import Base
+
+class AgencyDashboardStats(Base):
+    """Per-agency counters for the dashboard, updated in the same
+    transaction as the writes they count"""
+    __tablename__ = "agency_dashboard_stats"
+
+    agency_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    report_count = Column(Integer, nullable=False, default=0)
+    content_count = Column(Integer, nullable=False, default=0)  # Distinct content with a report
+    pending_report_count = Column(Integer, nullable=False, default=0)  # Queued or running
+    scheduled_report_count = Column(Integer, nullable=False, default=0)
+    last_report_at = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
+class AgencyContentReportCount(Base):
+    """Reports an agency has on each content item; content_count moves only
+    when one of these crosses between 0 and 1"""
+    __tablename__ = "agency_content_report_counts"
+
+    agency_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    content_id = Column(Integer, ForeignKey("contents.id", ondelete="CASCADE"), primary_key=True)
+    report_count = Column(Integer, nullable=False, default=0)
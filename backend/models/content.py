@@ -1,16 +1,32 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, BigInteger, String, Float, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from models.base import Base
 
 class Content(Base):
     __tablename__ = "contents"
+    __table_args__ = (
+        # A creator's content listing
+        Index("ix_contents_creator_id_created_at", "creator_id", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
     file_url = Column(String, nullable=False)
+    storage_key = Column(String, nullable=True)  # Set when the file is hosted by our storage backend
     creator_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    data_version = Column(Integer, nullable=False, default=0)  # Bumped whenever the content's metrics change
+
+    # Media metadata, filled in by the background extraction stage
+    mime_type = Column(String, nullable=True)
+    size_bytes = Column(BigInteger, nullable=True)
+    content_hash = Column(String(64), nullable=True, index=True)  # SHA-256
+    width = Column(Integer, nullable=True)
+    height = Column(Integer, nullable=True)
+    duration_seconds = Column(Float, nullable=True)
+    metadata_extracted_at = Column(DateTime, nullable=True)
 
     # Relationships
     creator = relationship("User", back_populates="contents")
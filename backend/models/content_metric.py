@@ -0,0 +1,27 @@
+from sqlalchemy import Column, Integer, BigInteger, String, Numeric, DateTime, ForeignKey, Index
+from sqlalchemy.orm import relationship
+from datetime import datetime
+from models.base import Base
+
+class ContentMetric(Base):
+    """One observation of a content item's performance, reported by an agency or platform sync"""
+    __tablename__ = "content_metrics"
+    __table_args__ = (
+        Index("ix_content_metrics_content_id_recorded_at", "content_id", "recorded_at"),
+    )
+
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True)
+    content_id = Column(Integer, ForeignKey("contents.id"), nullable=False)
+    recorded_at = Column(DateTime, nullable=False)
+    platform = Column(String, nullable=True)
+    country = Column(String(2), nullable=True)
+    views = Column(BigInteger, nullable=False, default=0)
+    likes = Column(BigInteger, nullable=False, default=0)
+    comments = Column(BigInteger, nullable=False, default=0)
+    shares = Column(BigInteger, nullable=False, default=0)
+    watch_time_seconds = Column(BigInteger, nullable=False, default=0)
+    revenue = Column(Numeric(14, 4), nullable=False, default=0)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    # Relationships
+    content = relationship("Content")
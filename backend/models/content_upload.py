@@ -0,0 +1,30 @@
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, ForeignKey, Enum
+from sqlalchemy.orm import relationship
+from datetime import datetime
+import enum
+from models.base import Base
+
+class UploadStatus(enum.Enum):
+    PENDING = "pending"
+    COMPLETED = "completed"
+
+class ContentUpload(Base):
+    """A resumable upload session; becomes a Content row once all bytes arrive"""
+    __tablename__ = "content_uploads"
+
+    id = Column(String, primary_key=True)  # UUID, handed to the client
+    creator_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    title = Column(String, nullable=False)
+    filename = Column(String, nullable=False)
+    storage_key = Column(String, nullable=False)
+    total_size = Column(BigInteger, nullable=False)
+    received_size = Column(BigInteger, nullable=False, default=0)
+    checksum = Column(String, nullable=True)  # SHA-256, set on completion
+    status = Column(Enum(UploadStatus), nullable=False, default=UploadStatus.PENDING)
+    content_id = Column(Integer, ForeignKey("contents.id"), nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Relationships
+    creator = relationship("User")
+    content = relationship("Content")
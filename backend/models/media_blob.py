@@ -0,0 +1,13 @@
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime
+from datetime import datetime
+from models.base import Base
+
+class MediaBlob(Base):
+    """One stored file per distinct content hash, shared by every Content row with those bytes"""
+    __tablename__ = "media_blobs"
+
+    content_hash = Column(String(64), primary_key=True)  # SHA-256
+    storage_key = Column(String, nullable=False)
+    size_bytes = Column(BigInteger, nullable=True)
+    ref_count = Column(Integer, nullable=False, default=1)
+    created_at = Column(DateTime, default=datetime.utcnow)
@@ -1,16 +1,46 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, Float, DateTime, ForeignKey, JSON, Enum, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
+import enum
 from models.base import Base
 
+class ReportStatus(enum.Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
 class Report(Base):
     __tablename__ = "reports"
+    __table_args__ = (
+        # Workers claim the oldest queued job per agency
+        Index("ix_reports_status_created_at", "status", "created_at"),
+        # Recent reports on the agency dashboard
+        Index("ix_reports_agency_id_created_at", "agency_id", "created_at"),
+        # Keyset pagination of reports by content
+        Index("ix_reports_content_id_created_at_id", "content_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False)
     agency_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     content_id = Column(Integer, ForeignKey("contents.id"), nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)  # Also bumped by job progress
+
+    # Report engine: what to compute and the stored result
+    parameters = Column(JSON, nullable=True)
+    results = Column(JSON, nullable=True)
+    computed_at = Column(DateTime, nullable=True)
+
+    # Background job state, advanced by the report workers
+    status = Column(Enum(ReportStatus), nullable=False, default=ReportStatus.QUEUED)
+    progress = Column(Float, nullable=False, default=0.0)
+    started_at = Column(DateTime, nullable=True)
+    heartbeat_at = Column(DateTime, nullable=True)  # Refreshed while a worker is computing
+    finished_at = Column(DateTime, nullable=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    error = Column(Text, nullable=True)
 
     # Relationships
     agency = relationship("User", back_populates="agency_reports")
@@ -0,0 +1,20 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON, UniqueConstraint
+from datetime import datetime
+from models.base import Base
+
+class ReportPartial(Base):
+    """A report's aggregate over a single content item, reused on refresh
+    while the content's data_version and the report parameters are unchanged"""
+    __tablename__ = "report_partials"
+    __table_args__ = (
+        UniqueConstraint("report_id", "content_id", name="uq_report_partials_report_content"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    report_id = Column(Integer, ForeignKey("reports.id"), nullable=False)
+    content_id = Column(Integer, ForeignKey("contents.id"), nullable=False, index=True)
+    data_version = Column(Integer, nullable=False)
+    parameters_hash = Column(String(64), nullable=False)
+    row_count = Column(Integer, nullable=False)
+    partial = Column(JSON, nullable=False)
+    computed_at = Column(DateTime, default=datetime.utcnow)
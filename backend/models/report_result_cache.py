@@ -0,0 +1,13 @@
+from sqlalchemy import Column, Integer, String, DateTime, JSON
+from datetime import datetime
+from models.base import Base
+
+class ReportResultCache(Base):
+    """Computed report results keyed by content data versions and parameters"""
+    __tablename__ = "report_result_cache"
+
+    cache_key = Column(String(64), primary_key=True)  # SHA-256, see ReportCacheService.build_key
+    results = Column(JSON, nullable=False)
+    size_bytes = Column(Integer, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    last_used_at = Column(DateTime, default=datetime.utcnow, index=True)
@@ -0,0 +1,37 @@
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Enum, Index, JSON
+from sqlalchemy.orm import relationship
+from datetime import datetime
+import enum
+from models.base import Base
+
+class ReportFrequency(enum.Enum):
+    WEEKLY = "weekly"
+    MONTHLY = "monthly"
+
+class ReportSchedule(Base):
+    """Regenerates a report every week or month and emails it to the agency"""
+    __tablename__ = "report_schedules"
+    __table_args__ = (
+        # The scheduler's due query: active schedules by next_run_at
+        Index("ix_report_schedules_active_next_run_at", "is_active", "next_run_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    report_id = Column(Integer, ForeignKey("reports.id"), unique=True, nullable=False)
+    frequency = Column(Enum(ReportFrequency), nullable=False)
+    recipient_email = Column(String, nullable=True)  # Defaults to the agency's email
+    is_active = Column(Boolean, nullable=False, default=True)
+    next_run_at = Column(DateTime, nullable=False)
+    last_run_at = Column(DateTime, nullable=True)  # When a period was last claimed
+    # A claimed period that hasn't finished yet; cleared once it is stored and sent
+    pending_period_start = Column(DateTime, nullable=True)
+    pending_period_end = Column(DateTime, nullable=True)
+    # The latest scheduled period and its outcome; the report keeps its own saved window and results
+    last_period_start = Column(DateTime, nullable=True)
+    last_period_end = Column(DateTime, nullable=True)
+    last_results = Column(JSON, nullable=True)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    # Relationships
+    report = relationship("Report")
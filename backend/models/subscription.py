@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum, Index, text
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
@@ -10,12 +10,25 @@ class SubscriptionStatus(enum.Enum):
 
 class Subscription(Base):
     __tablename__ = "subscriptions"
+    __table_args__ = (
+        # At most one ACTIVE subscription per user, enforced by the database
+        Index(
+            "uq_subscriptions_user_id_active",
+            "user_id",
+            unique=True,
+            postgresql_where=text("status = 'ACTIVE'"),
+            sqlite_where=text("status = 'ACTIVE'"),
+        ),
+        # Subscription history and status lookups per user
+        Index("ix_subscriptions_user_id_status", "user_id", "status"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    plan_id = Column(Integer, ForeignKey("subscription_plans.id"), nullable=False)
+    plan_id = Column(Integer, ForeignKey("subscription_plans.id"), nullable=False, index=True)
     status = Column(Enum(SubscriptionStatus), nullable=False, default=SubscriptionStatus.ACTIVE)
     started_at = Column(DateTime, default=datetime.utcnow)
+    canceled_at = Column(DateTime, nullable=True)
     stripe_subscription_id = Column(String, nullable=True, index=True)  # New field for Stripe integration
 
     # Relationships
@@ -0,0 +1,20 @@
+from sqlalchemy import Column, Integer, Date, Numeric, ForeignKey, UniqueConstraint
+from sqlalchemy.orm import relationship
+from models.base import Base
+
+class SubscriptionDailyRollup(Base):
+    """Per-day, per-plan subscription deltas maintained on every status change"""
+    __tablename__ = "subscription_daily_rollups"
+    __table_args__ = (
+        UniqueConstraint("day", "plan_id", name="uq_subscription_daily_rollups_day_plan"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    day = Column(Date, nullable=False)
+    plan_id = Column(Integer, ForeignKey("subscription_plans.id"), nullable=False)
+    activations = Column(Integer, nullable=False, default=0)
+    cancellations = Column(Integer, nullable=False, default=0)
+    mrr_delta = Column(Numeric(12, 2), nullable=False, default=0)
+
+    # Relationships
+    plan = relationship("SubscriptionPlan")
@@ -0,0 +1,51 @@
+from datetime import date, timedelta
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.orm import Session
+from database import get_db
+from services.subscription_rollup_service import SubscriptionRollupService
+from services.media_blob_service import MediaBlobService
+from core.security import get_admin_user
+from core.utils import create_response
+
+router = APIRouter()
+
+@router.get("/revenue", response_model=dict)
+async def get_revenue_metrics(
+    start: Optional[date] = Query(None),
+    end: Optional[date] = Query(None),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_admin_user)
+):
+    """Get MRR, active subscribers and churn per day and plan (Admin only)"""
+    end = end or date.today()
+    start = start or end - timedelta(days=30)
+
+    if start > end:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start must not be after end"
+        )
+
+    rollup_service = SubscriptionRollupService(db)
+    metrics = rollup_service.get_daily_metrics(start, end)
+
+    return create_response(
+        success=True,
+        message="Revenue metrics retrieved successfully",
+        data={"start": start.isoformat(), "end": end.isoformat(), "days": metrics}
+    )
+
+@router.get("/storage-savings", response_model=dict)
+async def get_storage_savings(
+    db: Session = Depends(get_db),
+    current_user = Depends(get_admin_user)
+):
+    """Get storage saved by content deduplication (Admin only)"""
+    blob_service = MediaBlobService(db)
+
+    return create_response(
+        success=True,
+        message="Storage savings retrieved successfully",
+        data=blob_service.get_storage_savings()
+    )
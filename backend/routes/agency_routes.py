@@ -0,0 +1,23 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+from database import get_db
+from services.agency_stats_service import AgencyStatsService
+from core.security import require_roles
+from core.utils import create_response
+
+router = APIRouter()
+
+@router.get("/dashboard", response_model=dict)
+async def get_agency_dashboard(
+    db: Session = Depends(get_db),
+    current_user = Depends(require_roles(["agency", "admin"]))
+):
+    """Report counts, recent reports and subscription state for the current agency"""
+    stats_service = AgencyStatsService(db)
+    dashboard = stats_service.get_dashboard(current_user.id)
+
+    return create_response(
+        success=True,
+        message="Dashboard retrieved successfully",
+        data=dashboard
+    )
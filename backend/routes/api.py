@@ -5,6 +5,9 @@ from .report_routes import router as report_router
 from .subscription_routes import router as subscription_router
 from .test_email_routes import router as test_email_router
 from .health_routes import router as health_router
+from .admin_routes import router as admin_router
+from .search_routes import router as search_router
+from .agency_routes import router as agency_router
 
 api_router = APIRouter()
 
@@ -13,4 +16,7 @@ api_router.include_router(auth_router, prefix="/auth", tags=["Auth"])
 api_router.include_router(content_router, prefix="/content", tags=["Content"])
 api_router.include_router(report_router, prefix="/reports", tags=["Reports"])
 api_router.include_router(subscription_router, prefix="/subscriptions", tags=["Subscriptions"])
+api_router.include_router(search_router, prefix="/search", tags=["Search"])
+api_router.include_router(agency_router, prefix="/agency", tags=["Agency"])
+api_router.include_router(admin_router, prefix="/admin", tags=["Admin"])
 api_router.include_router(test_email_router, prefix="/test", tags=["Test Email"])
@@ -1,9 +1,9 @@
 from datetime import timedelta
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Request, Response
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 from database import get_db
-from services.user_service import UserService
+from services.user_service import UserService, user_etag
 from schemas.relations import UserWithRelations
 from schemas.auth import LoginRequest, TokenResponse, RefreshTokenRequest, UserProfile
 from schemas.user import UserOut
@@ -12,9 +12,11 @@ from core.security import (
     create_access_token,
     create_refresh_token,
     decode_token,
-    get_current_user
+    get_current_user,
+    get_current_user_id
 )
 from core.utils import create_response
+from core.responses import etag_matches, not_modified, REVALIDATE_HEADERS
 from core.config import settings
 
 router = APIRouter()
@@ -140,9 +142,31 @@ async def refresh_token(
     )
 
 @router.get("/me", response_model=UserOut)
-async def get_current_user_info(current_user = Depends(get_current_user)):
-    """Get current user information"""
-    return current_user
+async def get_current_user_info(
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+    current_user_id: int = Depends(get_current_user_id)
+):
+    """Get current user information (conditional on If-None-Match)"""
+    user_service = UserService(db)
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        etag = user_service.get_user_etag(current_user_id)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
+    user = user_service.get_by_id(current_user_id)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
+
+    response.headers.update(REVALIDATE_HEADERS)
+    response.headers["ETag"] = user_etag(user.id, user.updated_at)
+    return user
 
 @router.get("/profile", response_model=UserProfile)
 async def get_user_profile(current_user = Depends(get_current_user)):
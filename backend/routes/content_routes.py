@@ -1,16 +1,36 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+import os
+import re
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Header
+import mimetypes
+from fastapi.responses import FileResponse, StreamingResponse, RedirectResponse, Response
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
+from pydantic import TypeAdapter, ValidationError
 from database import get_db
-from services.content_service import ContentService
-from schemas.content import ContentCreate, ContentOut, ContentOutWithCreator
+from services.content_service import ContentService, content_etag
+from services.upload_service import ContentUploadService
+from services.content_metric_service import ContentMetricService
+from services.storage_service import get_storage_backend, LocalStorageBackend, verify_storage_signature
+from services.rendition_service import get_rendition
+from schemas.content import (
+    ContentCreate, ContentBulkCreate, ContentBulkDelete, ContentOut, ContentOutWithCreator, CONTENT_LIST_FIELDS
+)
 from schemas.base import PaginatedResponse
+from schemas.upload import UploadCreate, UploadOut
+from schemas.content_metric import ContentMetricBatch
 from core.security import get_current_user, get_admin_user, require_roles
-from core.utils import create_response
+from core.utils import create_response, parse_fields
+from core.responses import file_response, etag_matches, not_modified, PageSerializer, REVALIDATE_HEADERS
+from core.config import settings
 from models.user import UserRole
 
 router = APIRouter()
 
+content_page = PageSerializer(ContentOut)
+content_list = TypeAdapter(List[ContentOut])
+
+CONTENT_RANGE_RE = re.compile(r"^bytes (\d+)-(\d+)/(\d+|\*)$")
+
 @router.post("/", response_model=ContentOut, status_code=status.HTTP_201_CREATED)
 async def create_content(
     content_data: ContentCreate,
@@ -31,48 +51,294 @@ async def create_content(
             detail="Failed to create content"
         )
 
+@router.post("/bulk", response_model=dict, status_code=status.HTTP_201_CREATED)
+async def bulk_create_content(
+    bulk_data: ContentBulkCreate,
+    db: Session = Depends(get_db),
+    current_user = Depends(require_roles(["creator", "admin"]))
+):
+    """Create many content items in one transaction (Creator/Admin only)"""
+    if len(bulk_data.items) > settings.CONTENT_BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {settings.CONTENT_BULK_MAX_ITEMS} items per batch"
+        )
+
+    results: List[dict] = [None] * len(bulk_data.items)
+    valid_items: List[ContentCreate] = []
+    valid_indexes: List[int] = []
+
+    for index, raw_item in enumerate(bulk_data.items):
+        try:
+            item = ContentCreate.model_validate(raw_item)
+        except ValidationError as e:
+            results[index] = {"index": index, "success": False, "errors": e.errors(include_url=False)}
+            continue
+
+        if item.creator_id != current_user.id:
+            results[index] = {
+                "index": index,
+                "success": False,
+                "errors": [{"msg": "Cannot create content for another user"}]
+            }
+            continue
+
+        valid_items.append(item)
+        valid_indexes.append(index)
+
+    content_service = ContentService(db)
+
+    try:
+        created = content_service.bulk_create_content(valid_items, current_user.id)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to create content"
+        )
+
+    created_out = content_list.dump_python(content_list.validate_python(created, from_attributes=True))
+    for index, content in zip(valid_indexes, created_out):
+        results[index] = {"index": index, "success": True, "content": content}
+
+    return create_response(
+        success=True,
+        message=f"{len(created)} of {len(results)} content items created",
+        data={"created": len(created), "failed": len(results) - len(created), "results": results}
+    )
+
+@router.post("/bulk-delete", response_model=dict)
+async def bulk_delete_content(
+    bulk_data: ContentBulkDelete,
+    db: Session = Depends(get_db),
+    current_user = Depends(require_roles(["creator", "admin"]))
+):
+    """Delete many content items and their reports (Creator: own content, Admin: any)"""
+    if len(bulk_data.ids) > settings.CONTENT_BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {settings.CONTENT_BULK_MAX_ITEMS} items per batch"
+        )
+
+    content_service = ContentService(db)
+
+    try:
+        result = content_service.bulk_delete_content(
+            bulk_data.ids, current_user.id, current_user.role
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to delete content"
+        )
+
+    return create_response(
+        success=True,
+        message=f"{result['deleted_content']} content items and {result['deleted_reports']} reports deleted",
+        data=result
+    )
+
+@router.post("/upload", response_model=dict, status_code=status.HTTP_201_CREATED)
+async def upload_content(
+    request: Request,
+    title: str = Query(..., min_length=1),
+    filename: str = Query(..., min_length=1),
+    db: Session = Depends(get_db),
+    current_user = Depends(require_roles(["creator", "admin"]))
+):
+    """Upload a file as the raw request body and create content for it (Creator/Admin only)"""
+    upload_service = ContentUploadService(db)
+    result = await upload_service.upload_file(
+        request.stream(), title, filename, current_user.id
+    )
+
+    return create_response(
+        success=True,
+        message="Content uploaded successfully",
+        data={
+            "content": ContentOut.model_validate(result["content"]).model_dump(),
+            "size": result["size"],
+            "checksum": result["checksum"]
+        }
+    )
+
+@router.post("/uploads", response_model=UploadOut, status_code=status.HTTP_201_CREATED)
+async def create_upload(
+    upload_data: UploadCreate,
+    db: Session = Depends(get_db),
+    current_user = Depends(require_roles(["creator", "admin"]))
+):
+    """Start a resumable upload (Creator/Admin only)"""
+    upload_service = ContentUploadService(db)
+    return upload_service.create_upload(upload_data, current_user.id)
+
+@router.get("/uploads/{upload_id}", response_model=UploadOut)
+async def get_upload(
+    upload_id: str,
+    db: Session = Depends(get_db),
+    current_user = Depends(require_roles(["creator", "admin"]))
+):
+    """Get upload progress; resume by sending the next chunk at received_size"""
+    upload_service = ContentUploadService(db)
+    return upload_service.get_user_upload(upload_id, current_user.id)
+
+@router.put("/uploads/{upload_id}", response_model=UploadOut)
+async def upload_chunk(
+    upload_id: str,
+    request: Request,
+    content_range: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+    current_user = Depends(require_roles(["creator", "admin"]))
+):
+    """Send the next chunk of a resumable upload with a Content-Range header"""
+    upload_service = ContentUploadService(db)
+    upload = upload_service.get_user_upload(upload_id, current_user.id)
+
+    match = CONTENT_RANGE_RE.match(content_range or "")
+    if not match:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Content-Range header of the form 'bytes start-end/total' is required"
+        )
+
+    start, end, total = match.groups()
+    if int(end) < int(start) or (total != "*" and int(total) != upload.total_size):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Content-Range does not match this upload"
+        )
+
+    return await upload_service.receive_chunk(upload, request.stream(), int(start))
+
+@router.post("/uploads/{upload_id}/complete", response_model=UploadOut)
+async def complete_upload(
+    upload_id: str,
+    db: Session = Depends(get_db),
+    current_user = Depends(require_roles(["creator", "admin"]))
+):
+    """Confirm a presigned upload finished; creates the content once the object exists"""
+    upload_service = ContentUploadService(db)
+    upload = upload_service.get_user_upload(upload_id, current_user.id)
+    return await upload_service.complete_upload(upload)
+
+@router.post("/presigned-uploads", response_model=dict, status_code=status.HTTP_201_CREATED)
+async def create_presigned_upload(
+    upload_data: UploadCreate,
+    db: Session = Depends(get_db),
+    current_user = Depends(require_roles(["creator", "admin"]))
+):
+    """Get a presigned URL to PUT a file directly to storage (Creator/Admin only)"""
+    upload_service = ContentUploadService(db)
+    result = upload_service.create_presigned_upload(upload_data, current_user.id)
+
+    return create_response(
+        success=True,
+        message="Presigned upload created successfully",
+        data={
+            "upload": UploadOut.model_validate(result["upload"]).model_dump(mode="json"),
+            "upload_url": result["upload_url"],
+            "method": result["method"],
+            "expires_in": result["expires_in"]
+        }
+    )
+
+@router.put("/storage/{key:path}", response_model=dict)
+async def put_signed_object(
+    key: str,
+    request: Request,
+    expires: int = Query(...),
+    signature: str = Query(...)
+):
+    """Target of local-backend presigned PUT URLs"""
+    storage = get_storage_backend()
+    if not isinstance(storage, LocalStorageBackend) or not verify_storage_signature("PUT", key, expires, signature):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Invalid or expired signature"
+        )
+
+    try:
+        stored = await storage.save_stream(key, request.stream(), max_size=settings.UPLOAD_MAX_SIZE)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    return create_response(
+        success=True,
+        message="Object stored successfully",
+        data=stored
+    )
+
+@router.get("/storage/{key:path}")
+async def get_signed_object(
+    key: str,
+    expires: int = Query(...),
+    signature: str = Query(...)
+):
+    """Target of local-backend presigned GET URLs"""
+    storage = get_storage_backend()
+    if not isinstance(storage, LocalStorageBackend) or not verify_storage_signature("GET", key, expires, signature):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Invalid or expired signature"
+        )
+
+    if not storage.exists(key):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Object not found"
+        )
+
+    return FileResponse(storage.path(key))
+
 @router.get("/my-content", response_model=dict)
 async def get_my_content(
     page: int = Query(1, ge=1),
     per_page: int = Query(10, ge=1, le=100),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. id,title"),
     db: Session = Depends(get_db),
     current_user = Depends(require_roles(["creator", "admin"]))
 ):
     """Get current user's content"""
+    selected = parse_fields(fields, CONTENT_LIST_FIELDS)
     content_service = ContentService(db)
-    result = content_service.get_user_content(current_user.id, page, per_page)
+    result = content_service.get_user_content(current_user.id, page, per_page, fields=selected)
 
-    return create_response(
-        success=True,
-        message="Content retrieved successfully",
-        data=result
-    )
+    return content_page.response(result, "Content retrieved successfully", fields=selected)
 
 @router.get("/", response_model=dict)
 async def get_all_content(
     page: int = Query(1, ge=1),
     per_page: int = Query(10, ge=1, le=100),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. id,title"),
     db: Session = Depends(get_db),
     current_user = Depends(get_admin_user)
 ):
     """Get all content (Admin only)"""
+    selected = parse_fields(fields, CONTENT_LIST_FIELDS)
     content_service = ContentService(db)
-    result = content_service.get_all_content(page, per_page)
+    result = content_service.get_all_content(page, per_page, fields=selected)
 
-    return create_response(
-        success=True,
-        message="All content retrieved successfully",
-        data=result
-    )
+    return content_page.response(result, "All content retrieved successfully", fields=selected)
 
 @router.get("/{content_id}", response_model=ContentOutWithCreator)
 async def get_content(
     content_id: int,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
-    """Get specific content by ID"""
+    """Get specific content by ID (conditional on If-None-Match)"""
     content_service = ContentService(db)
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        etag = content_service.get_content_etag(content_id, current_user.id, current_user.role)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
     content = content_service.get_content_with_creator(content_id)
 
     if not content:
@@ -89,8 +355,134 @@ async def get_content(
             detail="Not authorized to view this content"
         )
 
+    response.headers.update(REVALIDATE_HEADERS)
+    response.headers["ETag"] = content_etag(
+        content.id, content.data_version, content.updated_at, content.creator.updated_at
+    )
     return content
 
+@router.get("/{content_id}/download-url", response_model=dict)
+async def get_content_download_url(
+    content_id: int,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user)
+):
+    """Get a presigned URL to download hosted content directly from storage"""
+    content_service = ContentService(db)
+    content = content_service.get_content_for_user(content_id, current_user.id, current_user.role)
+
+    if not content.storage_key:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Content file is not hosted by this service"
+        )
+
+    expires_in = settings.STORAGE_PRESIGN_EXPIRES_SECONDS
+    download_url = get_storage_backend().presigned_get_url(content.storage_key, expires_in)
+
+    return create_response(
+        success=True,
+        message="Download URL created successfully",
+        data={"download_url": download_url, "expires_in": expires_in}
+    )
+
+@router.get("/{content_id}/file")
+async def download_content_file(
+    content_id: int,
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user)
+):
+    """Download hosted content, with Range and If-None-Match support"""
+    content_service = ContentService(db)
+    content = content_service.get_content_for_user(content_id, current_user.id, current_user.role)
+
+    if not content.storage_key:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Content file is not hosted by this service"
+        )
+
+    storage = get_storage_backend()
+    if not isinstance(storage, LocalStorageBackend):
+        # Remote objects are downloaded straight from the object store
+        expires_in = settings.STORAGE_PRESIGN_EXPIRES_SECONDS
+        return RedirectResponse(storage.presigned_get_url(content.storage_key, expires_in))
+
+    media_type = content.mime_type or mimetypes.guess_type(content.storage_key)[0] or "application/octet-stream"
+    headers = {"Cache-Control": "private, no-cache"}
+
+    if settings.STORAGE_ACCEL_REDIRECT:
+        # nginx streams the file with sendfile and handles Range/ETag itself
+        return Response(
+            media_type=media_type,
+            headers={
+                **headers,
+                "X-Accel-Redirect": f"{settings.STORAGE_ACCEL_REDIRECT_PREFIX}/{content.storage_key}"
+            }
+        )
+
+    path = storage.path(content.storage_key)
+    if not os.path.exists(path):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Content file not found"
+        )
+
+    return file_response(path, request, media_type=media_type, headers=headers)
+
+@router.post("/{content_id}/metrics", response_model=dict, status_code=status.HTTP_201_CREATED)
+async def ingest_content_metrics(
+    content_id: int,
+    batch: ContentMetricBatch,
+    db: Session = Depends(get_db),
+    current_user = Depends(require_roles(["creator", "admin"]))
+):
+    """Record performance metrics for content (Creator: own content, Admin: any)"""
+    if len(batch.items) > settings.CONTENT_METRICS_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {settings.CONTENT_METRICS_MAX_ITEMS} metric rows per request"
+        )
+
+    content_service = ContentService(db)
+    content_service.get_content_for_user(content_id, current_user.id, current_user.role)
+
+    try:
+        stored = ContentMetricService(db).ingest(content_id, batch.items)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to store metrics"
+        )
+
+    return create_response(
+        success=True,
+        message=f"{stored} metric rows stored",
+        data={"content_id": content_id, "stored": stored}
+    )
+
+@router.get("/{content_id}/thumbnail/{size}")
+async def get_content_thumbnail(
+    content_id: int,
+    size: int,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user)
+):
+    """Get a resized JPEG preview of image content, generated on first request"""
+    content_service = ContentService(db)
+    content = content_service.get_content_for_user(content_id, current_user.id, current_user.role)
+
+    key = await get_rendition(content, size)
+    storage = get_storage_backend()
+    # Rendition keys never change content, so clients may cache them for good
+    headers = {"Cache-Control": f"private, max-age={settings.RENDITION_CACHE_MAX_AGE}, immutable"}
+
+    if isinstance(storage, LocalStorageBackend):
+        return FileResponse(storage.path(key), media_type="image/jpeg", headers=headers)
+
+    return StreamingResponse(storage.iter_chunks(key), media_type="image/jpeg", headers=headers)
+
 @router.delete("/{content_id}", response_model=dict)
 async def delete_content(
     content_id: int,
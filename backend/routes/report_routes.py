@@ -1,21 +1,33 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from datetime import datetime
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
 from database import get_db
-from services.report_service import ReportService
-from schemas.report import ReportCreate, ReportOut, ReportOutWithRelations
+from services.report_service import ReportService, report_etag
+from services.report_schedule_service import ReportScheduleService
+from services.report_export_service import stream_report_export, EXPORT_MEDIA_TYPES
+from schemas.report import (
+    ReportCreate, ReportParameters, ReportOut, ReportOutWithRelations, ReportJobStatus,
+    ReportScheduleCreate, ReportScheduleOut, REPORT_LIST_FIELDS
+)
 from core.security import get_current_user, get_admin_user, require_roles
-from core.utils import create_response
+from core.utils import create_response, parse_fields
+from core.responses import etag_matches, not_modified, PageSerializer, REVALIDATE_HEADERS
 from models.user import UserRole
 
 router = APIRouter()
 
-@router.post("/", response_model=ReportOut, status_code=status.HTTP_201_CREATED)
+report_page = PageSerializer(ReportOut)
+
+@router.post("/", response_model=ReportOut, status_code=status.HTTP_202_ACCEPTED)
 async def create_report(
     report_data: ReportCreate,
     db: Session = Depends(get_db),
     current_user = Depends(require_roles(["agency", "admin"]))
 ):
-    """Create new report (Agency/Admin only)"""
+    """Queue a new report for the report workers (Agency/Admin only)"""
     report_service = ReportService(db)
 
     try:
@@ -33,44 +45,49 @@ async def create_report(
 async def get_my_reports(
     page: int = Query(1, ge=1),
     per_page: int = Query(10, ge=1, le=100),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. id,name,status"),
     db: Session = Depends(get_db),
     current_user = Depends(require_roles(["agency", "admin"]))
 ):
     """Get current agency's reports"""
+    selected = parse_fields(fields, REPORT_LIST_FIELDS)
     report_service = ReportService(db)
-    result = report_service.get_agency_reports(current_user.id, page, per_page)
+    result = report_service.get_agency_reports(current_user.id, page, per_page, fields=selected)
 
-    return create_response(
-        success=True,
-        message="Reports retrieved successfully",
-        data=result
-    )
+    return report_page.response(result, "Reports retrieved successfully", fields=selected)
 
 @router.get("/", response_model=dict)
 async def get_all_reports(
     page: int = Query(1, ge=1),
     per_page: int = Query(10, ge=1, le=100),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. id,name,status"),
     db: Session = Depends(get_db),
     current_user = Depends(get_admin_user)
 ):
     """Get all reports (Admin only)"""
+    selected = parse_fields(fields, REPORT_LIST_FIELDS)
     report_service = ReportService(db)
-    result = report_service.get_all_reports(page, per_page)
+    result = report_service.get_all_reports(page, per_page, fields=selected)
 
-    return create_response(
-        success=True,
-        message="All reports retrieved successfully",
-        data=result
-    )
+    return report_page.response(result, "All reports retrieved successfully", fields=selected)
 
 @router.get("/{report_id}", response_model=ReportOutWithRelations)
 async def get_report(
     report_id: int,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
-    """Get specific report by ID"""
+    """Get specific report by ID (conditional on If-None-Match)"""
     report_service = ReportService(db)
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        etag = report_service.get_report_etag(report_id, current_user.id, current_user.role)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
     report = report_service.get_report_with_relations(report_id)
 
     if not report:
@@ -87,8 +104,106 @@ async def get_report(
             detail="Not authorized to view this report"
         )
 
+    response.headers.update(REVALIDATE_HEADERS)
+    response.headers["ETag"] = report_etag(
+        report.id, report.updated_at, report.agency.updated_at, report.content.updated_at
+    )
     return report
 
+@router.get("/{report_id}/status", response_model=ReportJobStatus)
+async def get_report_status(
+    report_id: int,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user)
+):
+    """Poll a report's job status and progress"""
+    report_service = ReportService(db)
+    return report_service.get_report_status(report_id, current_user.id, current_user.role)
+
+@router.post("/{report_id}/refresh", response_model=ReportOut, status_code=status.HTTP_202_ACCEPTED)
+async def refresh_report(
+    report_id: int,
+    force: bool = Query(False, description="Recompute even if cached results exist"),
+    db: Session = Depends(get_db),
+    current_user = Depends(require_roles(["agency", "admin"]))
+):
+    """Recompute a report, reusing cached results unless forced"""
+    report_service = ReportService(db)
+    return report_service.refresh_report(report_id, current_user.id, current_user.role, force)
+
+@router.put("/{report_id}/schedule", response_model=ReportScheduleOut)
+async def set_report_schedule(
+    report_id: int,
+    schedule_data: ReportScheduleCreate,
+    db: Session = Depends(get_db),
+    current_user = Depends(require_roles(["agency", "admin"]))
+):
+    """Regenerate and email a report every week or month"""
+    report_service = ReportService(db)
+    report = report_service.get_report_for_user(report_id, current_user.id, current_user.role)
+
+    schedule_service = ReportScheduleService(db)
+    return schedule_service.set_schedule(report, schedule_data)
+
+@router.get("/{report_id}/schedule", response_model=ReportScheduleOut)
+async def get_report_schedule(
+    report_id: int,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user)
+):
+    """Get a report's schedule"""
+    report_service = ReportService(db)
+    report = report_service.get_report_for_user(report_id, current_user.id, current_user.role)
+
+    schedule_service = ReportScheduleService(db)
+    return schedule_service.get_report_schedule(report.id)
+
+@router.delete("/{report_id}/schedule", response_model=dict)
+async def delete_report_schedule(
+    report_id: int,
+    db: Session = Depends(get_db),
+    current_user = Depends(require_roles(["agency", "admin"]))
+):
+    """Stop regenerating a report"""
+    report_service = ReportService(db)
+    report = report_service.get_report_for_user(report_id, current_user.id, current_user.role)
+
+    schedule_service = ReportScheduleService(db)
+    schedule_service.delete_schedule(report)
+
+    return create_response(
+        success=True,
+        message="Report schedule deleted successfully",
+        data={"report_id": report.id}
+    )
+
+@router.get("/{report_id}/export")
+async def export_report(
+    report_id: int,
+    format: str = Query("csv", pattern="^(csv|ndjson|pdf)$"),
+    start: Optional[datetime] = Query(None, description="Override the report's window start (e.g. a scheduled period)"),
+    end: Optional[datetime] = Query(None, description="Override the report's window end"),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user)
+):
+    """Stream a report's metric rows as CSV, NDJSON or PDF"""
+    try:
+        window = ReportParameters(start=start, end=end)  # Naive UTC, start before end
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="; ".join(error["msg"] for error in e.errors())
+        )
+
+    report_service = ReportService(db)
+    report = report_service.get_report_for_user(report_id, current_user.id, current_user.role)
+
+    return StreamingResponse(
+        stream_report_export(report.id, format, window.start, window.end),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="report-{report.id}.{format}"'}
+    )
+
 @router.delete("/{report_id}", response_model=dict)
 async def delete_report(
     report_id: int,
@@ -116,14 +231,20 @@ async def delete_report(
             detail="Failed to delete report"
         )
 
-@router.get("/content/{content_id}", response_model=list[ReportOut])
+@router.get("/content/{content_id}", response_model=dict)
 async def get_reports_by_content(
     content_id: int,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. id,name,status"),
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
-    """Get all reports for specific content"""
+    """Get the reports on specific content visible to the current user"""
+    selected = parse_fields(fields, REPORT_LIST_FIELDS)
     report_service = ReportService(db)
-    reports = report_service.get_reports_by_content(content_id)
+    result = report_service.get_reports_by_content(
+        content_id, current_user.id, current_user.role, limit=limit, cursor=cursor, fields=selected
+    )
 
-    return reports
+    return report_page.response(result, "Reports retrieved successfully", fields=selected)
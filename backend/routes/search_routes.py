@@ -0,0 +1,36 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.orm import Session
+from database import get_db
+from services.search_service import SearchService
+from core.security import get_current_user
+from core.utils import create_response
+
+router = APIRouter()
+
+@router.get("/", response_model=dict)
+async def search(
+    q: str = Query(..., min_length=1, max_length=200),
+    type: Optional[str] = Query(None, pattern="^(content|report)$"),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user)
+):
+    """Search content titles and report names visible to the current user"""
+    if not q.strip():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Search query must not be blank"
+        )
+
+    search_service = SearchService(db)
+    result = search_service.search(
+        q.strip(), current_user.id, current_user.role, kind=type, limit=limit, cursor=cursor
+    )
+
+    return create_response(
+        success=True,
+        message="Search results retrieved successfully",
+        data=result
+    )
@@ -1,16 +1,21 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from database import get_db
 from services.subscription_service import SubscriptionService, SubscriptionPlanService
-from schemas.subscription import SubscriptionCreate, SubscriptionOut, SubscriptionOutWithRelations
+from schemas.subscription import (
+    SubscriptionCreate, SubscriptionOut, SubscriptionOutWithRelations, SUBSCRIPTION_LIST_FIELDS
+)
 from schemas.subscription_plan import SubscriptionPlanCreate, SubscriptionPlanOut
 from core.security import get_current_user, get_admin_user, require_roles
-from core.utils import create_response
+from core.utils import create_response, parse_fields
+from core.responses import PageSerializer
 from models.user import UserRole
 
 router = APIRouter()
 
+subscription_page = PageSerializer(SubscriptionOut)
+
 # Subscription Plan endpoints
 @router.get("/plans", response_model=List[SubscriptionPlanOut])
 async def get_subscription_plans(db: Session = Depends(get_db)):
@@ -141,18 +146,16 @@ async def cancel_subscription(
 async def get_all_subscriptions(
     page: int = Query(1, ge=1),
     per_page: int = Query(10, ge=1, le=100),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. id,status"),
     db: Session = Depends(get_db),
     current_user = Depends(get_admin_user)
 ):
     """Get all subscriptions (Admin only)"""
+    selected = parse_fields(fields, SUBSCRIPTION_LIST_FIELDS)
     subscription_service = SubscriptionService(db)
-    result = subscription_service.get_all_subscriptions(page, per_page)
+    result = subscription_service.get_all_subscriptions(page, per_page, fields=selected)
 
-    return create_response(
-        success=True,
-        message="All subscriptions retrieved successfully",
-        data=result
-    )
+    return subscription_page.response(result, "All subscriptions retrieved successfully", fields=selected)
 
 @router.get("/{subscription_id}", response_model=SubscriptionOutWithRelations)
 async def get_subscription(
@@ -3,7 +3,7 @@ from .base import BaseSchema, TimestampMixin, IDMixin, PaginationParams, Paginat
 # Import specific schemas
 from schemas.relations import UserWithRelations
 
-from .content import ContentCreate, ContentOut, ContentOutWithCreator, ContentOutWithReports, ContentOutFull
+from .content import ContentCreate, ContentBulkCreate, ContentOut, ContentOutWithCreator, ContentOutWithReports, ContentOutFull
 from .report import ReportCreate, ReportOut, ReportOutWithRelations
 from .subscription_plan import SubscriptionPlanCreate, SubscriptionPlanOut, SubscriptionPlanOutWithSubscriptions
 from .subscription import SubscriptionCreate, SubscriptionOut, SubscriptionOutWithRelations
@@ -26,7 +26,7 @@ __all__ = [
     # User schemas
     "UserCreate", "UserOut", "UserWithRelations",
     # Content schemas
-    "ContentCreate", "ContentOut", "ContentOutWithCreator",
+    "ContentCreate", "ContentBulkCreate", "ContentOut", "ContentOutWithCreator",
     "ContentOutWithReports", "ContentOutFull",
     # Report schemas
     "ReportCreate", "ReportOut", "ReportOutWithRelations",
@@ -1,12 +1,10 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
 from datetime import datetime
 
 class BaseSchema(BaseModel):
     """Base schema with common configuration"""
-    class Config:
-        orm_mode = True
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class TimestampMixin(BaseModel):
     """Mixin for models with timestamps"""
@@ -19,17 +17,16 @@ class IDMixin(BaseModel):
 
 class PaginationParams(BaseModel):
     """Schema for pagination parameters"""
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "page": 1,
+            "per_page": 10
+        }
+    })
+
     page: int = 1
     per_page: int = 10
 
-    class Config:
-        schema_extra = {
-            "example": {
-                "page": 1,
-                "per_page": 10
-            }
-        }
-
 class PaginatedResponse(BaseModel):
     """Schema for paginated responses"""
     items: list
@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional, List
+from pydantic import BaseModel, ConfigDict
+from typing import Optional, List, Dict, Any
 from .user import UserOut  # Needed for creator relations
 
 class ContentBase(BaseModel):
@@ -7,17 +7,27 @@ class ContentBase(BaseModel):
     description: Optional[str] = None
 
 class ContentCreate(ContentBase):
-    pass
+    file_url: str
+    creator_id: int
+
+class ContentBulkCreate(BaseModel):
+    # Items are validated one by one so a bad item doesn't fail the batch
+    items: List[Dict[str, Any]]
+
+class ContentBulkDelete(BaseModel):
+    ids: List[int]
 
 class ContentUpdate(ContentBase):
     title: Optional[str] = None
     description: Optional[str] = None
 
 class ContentOut(ContentBase):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
 
-    class Config:
-        from_attributes = True
+# Columns a list request may select with ?fields=
+CONTENT_LIST_FIELDS = ("id", "title")
 
 # ✅ Advanced schemas
 class ContentOutWithCreator(ContentOut):
@@ -0,0 +1,17 @@
+from pydantic import BaseModel, Field
+from typing import Optional, List
+from datetime import datetime
+
+class ContentMetricCreate(BaseModel):
+    recorded_at: datetime
+    platform: Optional[str] = None
+    country: Optional[str] = Field(None, min_length=2, max_length=2)
+    views: int = Field(0, ge=0)
+    likes: int = Field(0, ge=0)
+    comments: int = Field(0, ge=0)
+    shares: int = Field(0, ge=0)
+    watch_time_seconds: int = Field(0, ge=0)
+    revenue: float = 0
+
+class ContentMetricBatch(BaseModel):
+    items: List[ContentMetricCreate]
@@ -1,12 +1,48 @@
-from pydantic import BaseModel, ConfigDict
-from datetime import datetime
+from pydantic import BaseModel, ConfigDict, EmailStr, field_validator, model_validator
+from typing import Optional, List, Literal, Dict, Any
+from datetime import datetime, timezone
+from enum import Enum
 from .user import UserOut  # Adjust the import path as needed
 from .content import ContentOut  # Adjust the import path as needed
 
+class ReportStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+class ReportFrequency(str, Enum):
+    WEEKLY = "weekly"
+    MONTHLY = "monthly"
+
+class ReportParameters(BaseModel):
+    """What the report engine aggregates; stored with the report"""
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
+    granularity: Literal["day", "week", "month"] = "day"
+    group_by: Optional[Literal["platform", "country", "content"]] = None
+    content_ids: List[int] = []  # Extra content beyond the report's own content_id
+
+    @field_validator("start", "end")
+    @classmethod
+    def to_naive_utc(cls, v):
+        # Metric timestamps are naive UTC; an offset would make them incomparable
+        if v is not None and v.tzinfo is not None:
+            return v.astimezone(timezone.utc).replace(tzinfo=None)
+        return v
+
+    @model_validator(mode="after")
+    def check_window(self):
+        if self.start and self.end and self.start >= self.end:
+            raise ValueError("start must be before end")
+        return self
+
 class ReportCreate(BaseModel):
     name: str
     agency_id: int
     content_id: int
+    parameters: ReportParameters = ReportParameters()
+    refresh: bool = False  # Recompute even if cached results exist
 
 class ReportOut(BaseModel):
     model_config = ConfigDict(from_attributes=True)
@@ -16,7 +52,68 @@ class ReportOut(BaseModel):
     agency_id: int
     content_id: int
     created_at: datetime
+    parameters: Optional[Dict[str, Any]] = None
+    results: Optional[Dict[str, Any]] = None
+    computed_at: Optional[datetime] = None
+    status: ReportStatus
+    progress: float
+
+    @field_validator("status", mode="before")
+    @classmethod
+    def unwrap_model_enum(cls, v):
+        # ORM rows carry models.report.ReportStatus members
+        return getattr(v, "value", v)
+
+# Columns a list request may select with ?fields=
+REPORT_LIST_FIELDS = (
+    "id", "name", "agency_id", "content_id", "created_at",
+    "parameters", "results", "computed_at", "status", "progress"
+)
+
+class ReportJobStatus(BaseModel):
+    id: int
+    status: ReportStatus
+    progress: float
+    attempts: int
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    queued_seconds: float
+    run_seconds: Optional[float] = None
+
+    @field_validator("status", mode="before")
+    @classmethod
+    def unwrap_model_enum(cls, v):
+        return getattr(v, "value", v)
 
 class ReportOutWithRelations(ReportOut):
     agency: 'UserOut'
     content: 'ContentOut'
+
+class ReportScheduleCreate(BaseModel):
+    frequency: ReportFrequency
+    recipient_email: Optional[EmailStr] = None  # Defaults to the agency's email
+
+class ReportScheduleOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    report_id: int
+    frequency: ReportFrequency
+    recipient_email: Optional[str] = None
+    is_active: bool
+    next_run_at: datetime
+    last_run_at: Optional[datetime] = None
+    pending_period_start: Optional[datetime] = None
+    pending_period_end: Optional[datetime] = None
+    last_period_start: Optional[datetime] = None
+    last_period_end: Optional[datetime] = None
+    last_results: Optional[Dict[str, Any]] = None
+    last_error: Optional[str] = None
+
+    @field_validator("frequency", mode="before")
+    @classmethod
+    def unwrap_model_enum(cls, v):
+        # ORM rows carry models.report_schedule.ReportFrequency members
+        return getattr(v, "value", v)
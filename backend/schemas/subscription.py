@@ -1,4 +1,4 @@
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, field_validator
 from typing import Optional
 from datetime import datetime
 from enum import Enum
@@ -21,6 +21,15 @@ class SubscriptionOut(BaseModel):
     status: SubscriptionStatus
     started_at: datetime
 
+    @field_validator("status", mode="before")
+    @classmethod
+    def unwrap_model_enum(cls, v):
+        # ORM rows carry models.subscription.SubscriptionStatus members
+        return getattr(v, "value", v)
+
+# Columns a list request may select with ?fields=
+SUBSCRIPTION_LIST_FIELDS = ("id", "user_id", "plan_id", "status", "started_at")
+
 class SubscriptionUpdate(BaseModel):
     status: Optional[SubscriptionStatus] = None
 
@@ -0,0 +1,32 @@
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from typing import Optional
+from datetime import datetime
+from enum import Enum
+
+class UploadStatus(str, Enum):
+    PENDING = "pending"
+    COMPLETED = "completed"
+
+class UploadCreate(BaseModel):
+    title: str
+    filename: str
+    total_size: int = Field(gt=0)
+
+class UploadOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str
+    title: str
+    filename: str
+    total_size: int
+    received_size: int
+    status: UploadStatus
+    checksum: Optional[str] = None
+    content_id: Optional[int] = None
+    created_at: datetime
+
+    @field_validator("status", mode="before")
+    @classmethod
+    def unwrap_model_enum(cls, v):
+        # ORM rows carry models.content_upload.UploadStatus members
+        return getattr(v, "value", v)
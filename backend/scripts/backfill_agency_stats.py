@@ -0,0 +1,30 @@
+"""Rebuild agency_dashboard_stats from the reports and report_schedules tables.
+
+Usage (from the backend directory):
+    python scripts/backfill_agency_stats.py
+"""
+import os
+import sys
+
+# Add parent directory to path to import app modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import core  # noqa: F401 - core.security imports database, so core loads first
+from database import SessionLocal
+from models.user import User  # noqa: F401 - registers relationship targets
+from models.content import Content  # noqa: F401
+from models.report import Report  # noqa: F401
+from services.agency_stats_service import AgencyStatsService
+
+
+def main() -> None:
+    db = SessionLocal()
+    try:
+        written = AgencyStatsService(db).backfill()
+        print(f"✅ Wrote dashboard stats for {written} agencies")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
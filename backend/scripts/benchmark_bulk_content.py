@@ -0,0 +1,71 @@
+"""Rows per second: POST /content/ one item at a time versus POST /content/bulk.
+
+Runs both endpoints in-process (TestClient) against the configured
+database as a throwaway creator, then deletes everything it created.
+
+Usage (from the backend directory):
+    python scripts/benchmark_bulk_content.py [--items 500]
+"""
+import argparse
+import os
+import sys
+import time
+import uuid
+
+# Add parent directory to path to import app modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import core  # noqa: F401 - core.security imports database, so core loads first
+from fastapi.testclient import TestClient
+from core.config import settings
+from core.security import create_access_token
+from database import SessionLocal
+from main import app
+from models.content import Content
+from models.user import User, UserRole
+
+
+def items(creator_id: int, count: int, prefix: str) -> list:
+    return [
+        {"title": f"{prefix} {index}", "file_url": f"https://cdn.example.com/{prefix}-{index}.mp4", "creator_id": creator_id}
+        for index in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=settings.CONTENT_BULK_MAX_ITEMS)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    creator = User(email=f"bulk-benchmark-{uuid.uuid4().hex[:8]}@example.com", password_hash="-", role=UserRole.CREATOR)
+    db.add(creator)
+    db.commit()
+
+    client = TestClient(app)
+    headers = {"Authorization": f"Bearer {create_access_token(creator.id)}"}
+
+    try:
+        started = time.perf_counter()
+        for item in items(creator.id, args.items, "single"):
+            client.post("/api/v1/content/", json=item, headers=headers).raise_for_status()
+        single = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for offset in range(0, args.items, settings.CONTENT_BULK_MAX_ITEMS):
+            batch = items(creator.id, min(settings.CONTENT_BULK_MAX_ITEMS, args.items - offset), f"bulk-{offset}")
+            client.post("/api/v1/content/bulk", json={"items": batch}, headers=headers).raise_for_status()
+        bulk = time.perf_counter() - started
+
+        print(f"{'endpoint':<20} {'seconds':>8} {'rows/s':>10}   ({args.items} rows)")
+        print(f"{'POST /content/':<20} {single:8.3f} {args.items / single:10,.0f}")
+        print(f"{'POST /content/bulk':<20} {bulk:8.3f} {args.items / bulk:10,.0f}   {single / bulk:.1f}x")
+    finally:
+        db.query(Content).filter(Content.creator_id == creator.id).delete(synchronize_session=False)
+        db.query(User).filter(User.id == creator.id).delete(synchronize_session=False)
+        db.commit()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
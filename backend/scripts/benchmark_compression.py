@@ -0,0 +1,51 @@
+"""CPU cost versus bytes saved when compressing a 100-item list page.
+
+Renders the same report page as benchmark_serialization.py and times
+gzip and brotli (when installed) at several levels, as the compression
+middleware would apply them.
+
+Usage (from the backend directory):
+    python scripts/benchmark_compression.py [--items 100] [--rounds 100]
+"""
+import argparse
+import os
+import sys
+import timeit
+
+# Add parent directory to path to import app modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import core  # noqa: F401 - core.security imports database, so core loads first
+from benchmark_serialization import make_page
+from core.compression import brotli, compress_body
+from core.responses import PageSerializer
+from schemas.report import ReportOut
+
+GZIP_LEVELS = [1, 6, 9]
+BROTLI_QUALITIES = [1, 4, 11]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=100)
+    args = parser.parse_args()
+
+    body = PageSerializer(ReportOut).render(make_page(args.items), "Reports retrieved successfully")
+    print(f"{'encoding':<12} {'ms/page':>9} {'bytes':>9} {'saved':>7}   (uncompressed {len(body):,} bytes)")
+
+    runs = [("gzip", level, level, 0) for level in GZIP_LEVELS]
+    if brotli is not None:
+        runs += [("br", quality, 0, quality) for quality in BROTLI_QUALITIES]
+    else:
+        print("(brotli not installed; gzip only)")
+
+    for encoding, level, gzip_level, brotli_quality in runs:
+        compress = lambda: compress_body(body, encoding, gzip_level, brotli_quality)
+        seconds = min(timeit.repeat(compress, number=args.rounds, repeat=3)) / args.rounds
+        size = len(compress())
+        print(f"{encoding + '-' + str(level):<12} {seconds * 1000:9.3f} {size:9,} {1 - size / len(body):7.1%}")
+
+
+if __name__ == "__main__":
+    main()
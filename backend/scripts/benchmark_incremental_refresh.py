@@ -0,0 +1,113 @@
+"""Report refresh cost versus the share of content whose data changed.
+
+Seeds an in-memory SQLite database with one multi-content report and
+synthetic metric rows, computes it once to store the per-content partials,
+then bumps data_version on a growing number of content items and times a
+refresh through ReportPartialService, as the report workers run it.
+
+Usage (from the backend directory):
+    python scripts/benchmark_incremental_refresh.py [--contents 40] [--rows-per-content 10000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+# Add parent directory to path to import app modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import core  # noqa: F401 - core.security imports database, so core loads first
+from sqlalchemy import create_engine, insert, update
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from models.base import Base
+from models.content import Content
+from models.content_metric import ContentMetric
+from models.report import Report
+from models.subscription import Subscription  # noqa: F401 - registers relationship targets
+from models.subscription_plan import SubscriptionPlan  # noqa: F401
+from models.user import User, UserRole
+from services.report_partial_service import ReportPartialService
+from services.report_service import report_content_ids
+
+
+def seed(db, contents: int, rows_per_content: int) -> Report:
+    random.seed(0)
+    agency = User(email="refresh-benchmark@example.com", password_hash="-", role=UserRole.AGENCY)
+    db.add(agency)
+    db.flush()
+
+    content_ids = []
+    for index in range(contents):
+        content = Content(title=f"Video {index}", file_url="-", creator_id=agency.id)
+        db.add(content)
+        db.flush()
+        content_ids.append(content.id)
+
+    start = datetime(2024, 1, 1)
+    for content_id in content_ids:
+        db.execute(insert(ContentMetric), [
+            {
+                "content_id": content_id,
+                "recorded_at": start + timedelta(minutes=random.randint(0, 365 * 24 * 60)),
+                "platform": random.choice(["youtube", "tiktok", "instagram"]),
+                "country": random.choice(["US", "GB", "DE", "BR"]),
+                "views": random.randint(0, 10000),
+                "likes": random.randint(0, 500),
+                "comments": random.randint(0, 50),
+                "shares": random.randint(0, 50),
+                "watch_time_seconds": random.randint(0, 100000),
+                "revenue": round(random.uniform(0, 20), 2),
+            }
+            for _ in range(rows_per_content)
+        ])
+
+    report = Report(
+        name="Refresh benchmark",
+        agency_id=agency.id,
+        content_id=content_ids[0],
+        parameters={"granularity": "day", "group_by": "platform", "content_ids": content_ids[1:]}
+    )
+    db.add(report)
+    db.commit()
+    return report
+
+
+def refresh(db, report: Report) -> tuple:
+    started = time.perf_counter()
+    results = ReportPartialService(db).compute(report, report_content_ids(report))
+    db.commit()
+    return time.perf_counter() - started, results["recomputed_partials"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--contents", type=int, default=40)
+    parser.add_argument("--rows-per-content", type=int, default=10000)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    report = seed(db, args.contents, args.rows_per_content)
+    content_ids = report_content_ids(report)
+
+    seconds, recomputed = refresh(db, report)
+    print(f"{'changed':>8} {'recomputed':>11} {'seconds':>8}   ({args.contents} contents x {args.rows_per_content:,} rows)")
+    print(f"{'(cold)':>8} {recomputed:>11} {seconds:8.3f}")
+
+    for changed in sorted({0, 1, args.contents // 10, args.contents // 4, args.contents // 2, args.contents}):
+        db.execute(
+            update(Content)
+            .where(Content.id.in_(content_ids[:changed]))
+            .values(data_version=Content.data_version + 1)
+        )
+        db.commit()
+        seconds, recomputed = refresh(db, report)
+        print(f"{changed:>8} {recomputed:>11} {seconds:8.3f}")
+
+
+if __name__ == "__main__":
+    main()
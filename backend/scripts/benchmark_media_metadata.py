@@ -0,0 +1,75 @@
+"""Throughput of media metadata extraction over a directory of sample files.
+
+Probes every file with media_metadata_service.probe_file, first inline in
+one process and then on a ProcessPoolExecutor per worker count, and
+reports files and megabytes per second. Without a directory, synthetic
+files (random bytes behind real magic numbers) are generated first.
+
+Usage (from the backend directory):
+    python scripts/benchmark_media_metadata.py [DIRECTORY] [--workers 1 2 4]
+    python scripts/benchmark_media_metadata.py --files 64 --size-mb 16
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# Add parent directory to path to import app modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.media_metadata_service import MAGIC_NUMBERS, probe_file
+
+
+def generate_samples(directory: str, files: int, size_mb: int) -> None:
+    for index in range(files):
+        magic, mime_type = MAGIC_NUMBERS[index % len(MAGIC_NUMBERS)]
+        extension = mime_type.split("/")[1]
+        with open(os.path.join(directory, f"sample-{index}.{extension}"), "wb") as f:
+            f.write(magic)
+            f.write(os.urandom(size_mb * 1024 * 1024))
+
+
+def report(label: str, seconds: float, paths: list, total_bytes: int) -> None:
+    print(f"{label:<12} {seconds:8.2f} {len(paths) / seconds:10.1f} {total_bytes / seconds / 1e6:10.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("directory", nargs="?")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, os.cpu_count()])
+    parser.add_argument("--files", type=int, default=32, help="synthetic files when no directory is given")
+    parser.add_argument("--size-mb", type=int, default=8)
+    args = parser.parse_args()
+
+    directory = args.directory or tempfile.mkdtemp(prefix="media-benchmark-")
+    try:
+        if not args.directory:
+            generate_samples(directory, args.files, args.size_mb)
+
+        paths = sorted(
+            os.path.join(directory, name) for name in os.listdir(directory)
+            if os.path.isfile(os.path.join(directory, name))
+        )
+        total_bytes = sum(os.path.getsize(path) for path in paths)
+        print(f"{'mode':<12} {'seconds':>8} {'files/s':>10} {'MB/s':>10}   ({len(paths)} files, {total_bytes / 1e6:,.0f} MB)")
+
+        started = time.perf_counter()
+        for path in paths:
+            probe_file(path)
+        report("inline", time.perf_counter() - started, paths, total_bytes)
+
+        for workers in dict.fromkeys(args.workers):
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                started = time.perf_counter()
+                list(executor.map(probe_file, paths))
+                report(f"pool x{workers}", time.perf_counter() - started, paths, total_bytes)
+    finally:
+        if not args.directory:
+            shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Time the vectorized report aggregation over synthetic metric rows.
+
+Builds DataFrames shaped like report_engine.load_metrics() output (no
+database needed) and times aggregate + finalize for each granularity and
+grouping, plus merging per-content partials as report workers do.
+
+Usage (from the backend directory):
+    python scripts/benchmark_report_engine.py [--rows 1000000 2000000] [--contents 200]
+"""
+import argparse
+import os
+import sys
+import time
+
+# Add parent directory to path to import app modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+from services.report_engine import SUM_METRICS, aggregate, finalize, merge_partials
+
+CASES = [("day", None), ("week", None), ("month", None), ("day", "platform"), ("week", "country"), ("day", "content")]
+
+
+def make_frame(rows: int, contents: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    start = np.datetime64("2024-01-01T00:00:00")
+    frame = pd.DataFrame({
+        "content_id": rng.integers(1, contents + 1, rows),
+        "recorded_at": start + rng.integers(0, 365 * 24 * 3600, rows).astype("timedelta64[s]"),
+        "platform": pd.Categorical.from_codes(rng.integers(0, 4, rows), ["youtube", "tiktok", "instagram", "twitch"]),
+        "country": pd.Categorical.from_codes(rng.integers(0, 30, rows), [f"C{index:02d}" for index in range(30)]),
+    })
+    for metric in SUM_METRICS:
+        frame[metric] = rng.integers(0, 10000, rows).astype("float64")
+    frame["recorded_at"] = frame["recorded_at"].astype("datetime64[ns]")
+    return frame
+
+
+def timed(call) -> float:
+    started = time.perf_counter()
+    call()
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000_000, 2_000_000])
+    parser.add_argument("--contents", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'granularity':<12} {'group_by':<10} {'seconds':>8} {'rows/s':>12}")
+    for rows in args.rows:
+        frame = make_frame(rows, args.contents)
+        for granularity, group_by in CASES:
+            seconds = min(timed(lambda: finalize(aggregate(frame, granularity, group_by))) for _ in range(3))
+            print(f"{rows:>10,} {granularity:<12} {group_by or '-':<10} {seconds:8.3f} {rows / seconds:12,.0f}")
+
+        by_content = [rows_ for _, rows_ in frame.groupby("content_id", sort=False)]
+        partials = [aggregate(part, "day") for part in by_content]
+        seconds = timed(lambda: finalize(merge_partials(partials)))
+        print(f"{rows:>10,} {'day':<12} {'merge':<10} {seconds:8.3f}   ({len(partials)} per-content partials)")
+
+
+if __name__ == "__main__":
+    main()
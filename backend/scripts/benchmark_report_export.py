@@ -0,0 +1,144 @@
+"""Report export throughput and peak memory as the exported row count grows.
+
+Seeds a temporary SQLite database with one content item's synthetic metric
+rows and streams each export format over a tenth of them and over all of
+them, through the same row cursor and encoders as the export endpoint.
+Peak memory is traced with tracemalloc; the script exits non-zero when the
+full export's peak is not flat against the tenth's.
+
+Usage (from the backend directory):
+    python scripts/benchmark_report_export.py [--rows 1000000] [--formats csv,ndjson,pdf]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+# Add parent directory to path to import app modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import core  # noqa: F401 - core.security imports database, so core loads first
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+from core.config import settings
+from models.base import Base
+from models.content import Content
+from models.content_metric import ContentMetric
+from models.report import Report
+from models.subscription import Subscription  # noqa: F401 - registers relationship targets
+from models.subscription_plan import SubscriptionPlan  # noqa: F401
+from models.user import User, UserRole
+from services.report_export_service import iter_csv, iter_ndjson, iter_pdf, iter_report_rows
+
+START = datetime(2024, 1, 1)
+SEED_BATCH = 50000
+
+
+def seed(db, rows: int) -> tuple:
+    random.seed(0)
+    agency = User(email="export-benchmark@example.com", password_hash="-", role=UserRole.AGENCY)
+    db.add(agency)
+    db.flush()
+    content = Content(title="Export benchmark", file_url="-", creator_id=agency.id)
+    db.add(content)
+    db.flush()
+
+    for offset in range(0, rows, SEED_BATCH):
+        db.execute(insert(ContentMetric), [
+            {
+                "content_id": content.id,
+                "recorded_at": START + timedelta(minutes=index),
+                "platform": random.choice(["youtube", "tiktok", "instagram"]),
+                "country": random.choice(["US", "GB", "DE", "BR"]),
+                "views": random.randint(0, 10000),
+                "likes": random.randint(0, 500),
+                "comments": random.randint(0, 50),
+                "shares": random.randint(0, 50),
+                "watch_time_seconds": random.randint(0, 100000),
+                "revenue": round(random.uniform(0, 20), 2),
+            }
+            for index in range(offset, min(offset + SEED_BATCH, rows))
+        ])
+
+    window_end = START + timedelta(minutes=rows // 10)
+    tenth = Report(
+        name="A tenth", agency_id=agency.id, content_id=content.id,
+        parameters={"start": START.isoformat(), "end": window_end.isoformat()}
+    )
+    full = Report(name="Everything", agency_id=agency.id, content_id=content.id, parameters={})
+    db.add_all([tenth, full])
+    db.commit()
+    return tenth, full
+
+
+def encode(db, report: Report, export_format: str):
+    rows = iter_report_rows(db, report)
+    if export_format == "csv":
+        return iter_csv(rows)
+    if export_format == "ndjson":
+        return iter_ndjson(rows)
+    return iter_pdf(rows, report.name)
+
+
+def drain(db, report: Report, export_format: str) -> tuple:
+    """Bytes, seconds and traced peak of one export, read as a client would"""
+    started = time.perf_counter()
+    total = sum(len(chunk) for chunk in encode(db, report, export_format))
+    seconds = time.perf_counter() - started
+
+    # Traced separately; tracemalloc slows allocation-heavy loops several-fold
+    tracemalloc.start()
+    try:
+        for _ in encode(db, report, export_format):
+            pass
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return total, seconds, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--formats", default="csv,ndjson,pdf")
+    parser.add_argument("--max-growth", type=float, default=2.0, help="allowed full/tenth peak ratio")
+    args = parser.parse_args()
+    if args.rows // 10 < 2 * settings.REPORT_EXPORT_BATCH_SIZE:
+        # Below a couple of cursor batches the tenth's peak isn't the steady state
+        parser.error(f"--rows must be at least {20 * settings.REPORT_EXPORT_BATCH_SIZE}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{directory}/export.db")
+        Base.metadata.create_all(engine)
+        db = sessionmaker(bind=engine)()
+        tenth, full = seed(db, args.rows)
+
+        flat = True
+        print(f"{'format':<7} {'rows':>10} {'MB':>9} {'rows/s':>11} {'peak MiB':>9}")
+        for export_format in args.formats.split(","):
+            for _ in encode(db, tenth, export_format):  # warm statement caches
+                pass
+            peaks = []
+            for report, rows in ((tenth, args.rows // 10), (full, args.rows)):
+                total, seconds, peak = drain(db, report, export_format)
+                peaks.append(peak)
+                print(
+                    f"{export_format:<7} {rows:>10,} {total / 1e6:9.1f} "
+                    f"{rows / seconds:11,.0f} {peak / 2 ** 20:9.2f}"
+                )
+            if peaks[1] > args.max_growth * peaks[0]:
+                print(f"{export_format}: peak memory grew {peaks[1] / peaks[0]:.1f}x with 10x the rows")
+                flat = False
+
+        db.close()
+        engine.dispose()
+
+    sys.exit(0 if flat else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Time validation and serialization of ORM rows for the list schemas.
+
+For content, report and subscription rows (unsaved, no database needed)
+compares validating and dumping one model at a time against a TypeAdapter
+built once for the whole list, as the list endpoints do.
+
+Usage (from the backend directory):
+    python scripts/benchmark_schemas.py [--items 100] [--rounds 200]
+"""
+import argparse
+import os
+import sys
+import timeit
+from datetime import datetime
+from typing import List
+
+# Add parent directory to path to import app modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import core  # noqa: F401 - core.security imports database, so core loads first
+from pydantic import TypeAdapter
+from models.user import User  # noqa: F401 - registers relationship targets
+from models.subscription_plan import SubscriptionPlan  # noqa: F401
+from models.content import Content
+from models.report import Report, ReportStatus
+from models.subscription import Subscription, SubscriptionStatus
+from schemas.content import ContentOut
+from schemas.report import ReportOut
+from schemas.subscription import SubscriptionOut
+
+
+def make_rows(items: int) -> dict:
+    now = datetime.utcnow()
+    return {
+        ContentOut: [
+            Content(id=index, title=f"Video {index}", file_url="-", creator_id=1, created_at=now)
+            for index in range(items)
+        ],
+        ReportOut: [
+            Report(
+                id=index, name=f"Report {index}", agency_id=1, content_id=index, created_at=now,
+                parameters={"granularity": "day"}, results={"totals": {"views": 100.0}},
+                computed_at=now, status=ReportStatus.DONE, progress=1.0
+            )
+            for index in range(items)
+        ],
+        SubscriptionOut: [
+            Subscription(id=index, user_id=index, plan_id=1, status=SubscriptionStatus.ACTIVE, started_at=now)
+            for index in range(items)
+        ],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    def per_ms(call) -> float:
+        return min(timeit.repeat(call, number=args.rounds, repeat=3)) / args.rounds * 1000
+
+    print(f"{'schema':<16} {'per-model':>12} {'adapter':>12} {'adapter json':>14}   ({args.items} rows, ms)")
+    for schema, rows in make_rows(args.items).items():
+        adapter = TypeAdapter(List[schema])
+
+        per_model = per_ms(lambda: [schema.model_validate(row).model_dump(mode="json") for row in rows])
+        batched = per_ms(lambda: adapter.dump_python(adapter.validate_python(rows, from_attributes=True), mode="json"))
+        to_json = per_ms(lambda: adapter.dump_json(adapter.validate_python(rows, from_attributes=True)))
+
+        print(f"{schema.__name__:<16} {per_model:12.3f} {batched:12.3f} {to_json:14.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Compare serialization paths for a 100-item page of reports.
+
+Builds unsaved Report rows (no database needed) and times:
+  - jsonable_encoder + json.dumps     (FastAPI's stock JSONResponse)
+  - jsonable_encoder + orjson.dumps   (ORJSONResponse, the app default)
+  - PageSerializer.render             (ORM rows straight to bytes)
+
+Usage (from the backend directory):
+    python scripts/benchmark_serialization.py [--items 100] [--rounds 200]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import timeit
+from datetime import datetime, timedelta
+
+# Add parent directory to path to import app modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import core  # noqa: F401 - core.security imports database, so core loads first
+import orjson
+from fastapi.encoders import jsonable_encoder
+from core.responses import PageSerializer
+from core.utils import create_response
+from models.user import User  # noqa: F401 - registers relationship targets
+from models.content import Content  # noqa: F401
+from models.subscription import Subscription  # noqa: F401
+from models.subscription_plan import SubscriptionPlan  # noqa: F401
+from models.report import Report, ReportStatus
+from schemas.report import ReportOut
+
+
+def make_page(items: int) -> dict:
+    now = datetime.utcnow()
+    random.seed(0)
+
+    def series():
+        return [
+            {
+                "bucket": (now - timedelta(days=day)).isoformat(),
+                "group": "all",
+                "views": float(random.randint(100, 50000)),
+                "revenue": round(random.uniform(0, 200), 2),
+                "samples": random.randint(1, 48),
+            }
+            for day in range(7)
+        ]
+
+    reports = [
+        Report(
+            id=index,
+            name=f"Weekly report {index}",
+            agency_id=1,
+            content_id=index,
+            created_at=now - timedelta(seconds=random.randint(0, 86400)),
+            parameters={"granularity": "day", "group_by": None, "content_ids": []},
+            results={"totals": {"views": float(random.randint(1000, 350000))}, "series": series(), "row_count": 168},
+            computed_at=now,
+            status=ReportStatus.DONE,
+            progress=1.0,
+        )
+        for index in range(items)
+    ]
+    return {"items": reports, "total": items, "page": 1, "per_page": items, "pages": 1}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    page = make_page(args.items)
+    serializer = PageSerializer(ReportOut)
+
+    def encoded_envelope():
+        items = [ReportOut.model_validate(report) for report in page["items"]]
+        return jsonable_encoder(create_response(True, "Reports retrieved successfully", {**page, "items": items}))
+
+    paths = {
+        "jsonable_encoder + json": lambda: json.dumps(encoded_envelope()).encode(),
+        "jsonable_encoder + orjson": lambda: orjson.dumps(encoded_envelope()),
+        "PageSerializer": lambda: serializer.render(page, "Reports retrieved successfully"),
+    }
+
+    baseline = None
+    for name, render in paths.items():
+        seconds = min(timeit.repeat(render, number=args.rounds, repeat=3)) / args.rounds
+        baseline = baseline or seconds
+        print(f"{name:<28} {seconds * 1000:8.3f} ms/page  {baseline / seconds:5.1f}x  {len(render()):,} bytes")
+
+
+if __name__ == "__main__":
+    main()
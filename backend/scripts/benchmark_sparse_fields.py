@@ -0,0 +1,98 @@
+"""Full report pages versus sparse fieldsets (?fields=) on the list endpoint path.
+
+Seeds an in-memory SQLite database with the report rows from
+benchmark_serialization.py and, for each fieldset, times the paginated
+service query, measures the bytes of column data it fetches and times
+rendering the page.
+
+Usage (from the backend directory):
+    python scripts/benchmark_sparse_fields.py [--items 100] [--rounds 50]
+"""
+import argparse
+import os
+import sys
+import timeit
+
+# Add parent directory to path to import app modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import core  # noqa: F401 - core.security imports database, so core loads first
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from benchmark_serialization import make_page
+from core.responses import PageSerializer
+from core.utils import parse_fields
+from models.base import Base
+from models.user import User, UserRole
+from schemas.report import ReportOut, REPORT_LIST_FIELDS
+from services.report_service import ReportService
+
+FIELDSETS = [None, "id,name,status,created_at", "id,name,status"]
+
+
+def seed(items: int):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+
+    db.add(User(id=1, email="benchmark-agency@example.com", password_hash="-", role=UserRole.AGENCY))
+    db.add_all(make_page(items)["items"])
+    db.commit()
+    db.close()
+    return engine
+
+
+def fetched_bytes(db, call) -> int:
+    """Size of the column values the page query returns, as the driver hands them over"""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if "count(" not in statement:
+            statements.append((statement, parameters))
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        call()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    statement, parameters = statements[-1]
+    rows = db.connection().exec_driver_sql(statement, parameters).fetchall()
+    return sum(len(str(value)) for row in rows for value in row if value is not None)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    Session = sessionmaker(bind=seed(args.items))
+    serializer = PageSerializer(ReportOut)
+
+    def per_ms(call) -> float:
+        return min(timeit.repeat(call, number=args.rounds, repeat=3)) / args.rounds * 1000
+
+    print(f"{'fields':<28} {'query ms':>9} {'fetched':>9} {'render ms':>10} {'body':>9}   ({args.items} rows)")
+    for fieldset in FIELDSETS:
+        fields = parse_fields(fieldset, REPORT_LIST_FIELDS)
+        db = Session()
+
+        def query():
+            db.expunge_all()  # a fresh identity map, as in a request
+            return ReportService(db).get_all_reports(1, args.items, fields=fields)
+
+        query_ms = per_ms(query)
+        transferred = fetched_bytes(db, query)
+        page = query()
+        render_ms = per_ms(lambda: serializer.render(page, "All reports retrieved successfully", fields))
+        body = len(serializer.render(page, "All reports retrieved successfully", fields))
+
+        print(f"{fieldset or '(all)':<28} {query_ms:9.3f} {transferred:9,} {render_ms:10.3f} {body:9,}")
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Fail if a hot service query is planned as a sequential scan.
+
+Runs the checks from tests/test_query_plans.py against the configured
+database: seeds a few rows inside a transaction, EXPLAINs the statements
+each hot query issues and rolls everything back. Exits non-zero when any
+plan scans a whole table, so it can gate migrations in CI.
+
+Usage (from the backend directory):
+    python scripts/check_query_plans.py
+"""
+import os
+import sys
+
+# Add parent directory to path to import app modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import core  # noqa: F401 - core.security imports database, so core loads first
+from database import SessionLocal
+from tests.test_query_plans import HOT_QUERIES, planned_seq_scans, seed
+
+
+def main() -> int:
+    db = SessionLocal()
+    failures = 0
+    try:
+        seeded = seed(db)
+
+        for name in HOT_QUERIES:
+            scanned = planned_seq_scans(db, seeded, name)
+            if scanned:
+                failures += 1
+                print(f"❌ {name}: sequential scan on {', '.join(sorted(scanned))}")
+            else:
+                print(f"✅ {name}")
+    finally:
+        db.rollback()
+        db.close()
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
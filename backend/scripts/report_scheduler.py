@@ -0,0 +1,94 @@
+"""Run the report scheduler.
+
+Every REPORT_SCHEDULER_TICK_SECONDS, claims due report schedules, groups
+them by agency and content, and generates each group in a process pool.
+Usage (from the backend directory):
+    python scripts/report_scheduler.py [--once]
+"""
+import argparse
+import logging
+import multiprocessing
+import os
+import signal
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+
+# Add parent directory to path to import app modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.config import settings
+from database import SessionLocal
+from models.user import User  # noqa: F401 - registers relationship targets
+from models.subscription import Subscription  # noqa: F401
+from models.subscription_plan import SubscriptionPlan  # noqa: F401
+from services.report_schedule_service import ReportScheduleService, run_schedule_group
+
+logger = logging.getLogger("report_scheduler")
+
+
+def tick(executor: ProcessPoolExecutor) -> int:
+    db = SessionLocal()
+    try:
+        service = ReportScheduleService(db)
+        groups = service.group_runs(service.claim_due(datetime.utcnow()))
+    finally:
+        db.close()
+
+    if not groups:
+        return 0
+
+    completed = 0
+    futures = [executor.submit(run_schedule_group, group) for group in groups]
+    for future in as_completed(futures):
+        try:
+            completed += future.result()
+        except Exception as e:
+            logger.error(f"Scheduled report group failed: {str(e)}")
+
+    logger.info(f"Generated {completed} scheduled reports in {len(groups)} groups")
+    return completed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--once", action="store_true", help="Run a single tick and exit")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=settings.LOG_LEVEL.upper())
+
+    stopping = False
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    executor = ProcessPoolExecutor(
+        max_workers=settings.REPORT_WORKERS,
+        mp_context=multiprocessing.get_context("spawn")
+    )
+    try:
+        while not stopping:
+            started = time.monotonic()
+            try:
+                tick(executor)
+            except Exception as e:
+                logger.error(f"Scheduler tick failed: {str(e)}")
+
+            if args.once:
+                break
+
+            # Sleep in short steps so a stop signal is handled promptly
+            deadline = started + settings.REPORT_SCHEDULER_TICK_SECONDS
+            while not stopping and time.monotonic() < deadline:
+                time.sleep(max(0.0, min(1.0, deadline - time.monotonic())))
+    finally:
+        executor.shutdown(wait=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Run the report worker pool.
+
+Starts REPORT_WORKERS processes that claim queued reports and compute them.
+Usage (from the backend directory):
+    python scripts/report_worker.py [--workers N]
+"""
+import argparse
+import logging
+import multiprocessing
+import os
+import signal
+import sys
+import time
+
+# Add parent directory to path to import app modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.config import settings
+
+logger = logging.getLogger("report_worker")
+
+# Requeue abandoned jobs about once a minute per worker
+STALE_CHECK_INTERVAL_SECONDS = 60
+
+
+def work(worker_index: int) -> None:
+    from database import SessionLocal
+    from models.user import User  # noqa: F401 - registers relationship targets
+    from models.subscription import Subscription  # noqa: F401
+    from models.subscription_plan import SubscriptionPlan  # noqa: F401
+    from services.report_job_service import ReportJobService
+
+    stopping = False
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    logger.info(f"Report worker {worker_index} started (pid {os.getpid()})")
+    last_stale_check = 0.0
+
+    while not stopping:
+        db = SessionLocal()
+        try:
+            service = ReportJobService(db)
+            if time.monotonic() - last_stale_check > STALE_CHECK_INTERVAL_SECONDS:
+                service.requeue_stale()
+                last_stale_check = time.monotonic()
+
+            worked = service.run_once()
+        except Exception as e:
+            logger.error(f"Report worker {worker_index} error: {str(e)}")
+            worked = False
+        finally:
+            db.close()
+
+        if not worked:
+            time.sleep(settings.REPORT_POLL_INTERVAL_SECONDS)
+
+    logger.info(f"Report worker {worker_index} stopped")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=settings.REPORT_WORKERS)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=settings.LOG_LEVEL.upper())
+
+    # Spawned (not forked) so no worker inherits another's DB connections
+    context = multiprocessing.get_context("spawn")
+    workers = [context.Process(target=work, args=(index,)) for index in range(args.workers)]
+    for worker in workers:
+        worker.start()
+
+    def stop(signum, frame):
+        for worker in workers:
+            worker.terminate()
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    for worker in workers:
+        worker.join()
+
+
+if __name__ == "__main__":
+    main()
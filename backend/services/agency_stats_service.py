@@ -0,0 +1,188 @@
+from collections import defaultdict
+from datetime import datetime
+from typing import Iterable, Optional, Dict, Any
+from sqlalchemy import select, delete, func, and_
+from sqlalchemy.orm import Session
+from core.utils import dialect_insert
+from models.agency_dashboard_stats import AgencyDashboardStats, AgencyContentReportCount
+from models.report import Report, ReportStatus
+from models.report_schedule import ReportSchedule
+from models.subscription import Subscription, SubscriptionStatus
+from models.subscription_plan import SubscriptionPlan
+from models.user import User
+
+COUNTERS = ("report_count", "content_count", "pending_report_count", "scheduled_report_count")
+
+PENDING_STATUSES = (ReportStatus.QUEUED, ReportStatus.RUNNING)
+
+RECENT_ACTIVITY_LIMIT = 10
+
+class AgencyStatsService:
+    """Maintains AgencyDashboardStats and serves the agency dashboard from it"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def apply(self, agency_id: int, last_report_at: Optional[datetime] = None, **deltas: int) -> None:
+        """Add ``deltas`` to an agency's counters with one upsert (caller commits)"""
+        deltas = {name: delta for name, delta in deltas.items() if delta}
+        if not deltas and last_report_at is None:
+            return
+
+        stats = AgencyDashboardStats.__table__.c
+        now = datetime.utcnow()
+        values = {name: deltas.get(name, 0) for name in COUNTERS}
+        updates = {name: stats[name] + delta for name, delta in deltas.items()}
+        updates["updated_at"] = now
+        if last_report_at is not None:
+            values["last_report_at"] = updates["last_report_at"] = last_report_at
+
+        insert = dialect_insert(self.db)
+        self.db.execute(
+            insert(AgencyDashboardStats)
+            .values(agency_id=agency_id, updated_at=now, **values)
+            .on_conflict_do_update(index_elements=["agency_id"], set_=updates)
+        )
+
+    def apply_many(self, deltas_by_agency: Dict[int, Dict[str, int]]) -> None:
+        for agency_id, deltas in deltas_by_agency.items():
+            self.apply(agency_id, **deltas)
+
+    def track_content_reports(self, agency_id: int, content_id: int, delta: int) -> int:
+        """Add ``delta`` to the agency's report count on this content and return
+        the content_count change (caller commits).
+
+        The upsert and RETURNING run as one statement holding the row lock, so
+        of two concurrent first reports (or last deletes) exactly one sees the
+        count cross 0/1.
+        """
+        counts = AgencyContentReportCount.__table__.c
+        insert = dialect_insert(self.db)
+        count = self.db.execute(
+            insert(AgencyContentReportCount)
+            .values(agency_id=agency_id, content_id=content_id, report_count=delta)
+            .on_conflict_do_update(
+                index_elements=["agency_id", "content_id"],
+                set_={"report_count": counts.report_count + delta}
+            )
+            .returning(counts.report_count)
+        ).scalar_one()
+
+        previous = count - delta
+        return (count > 0) - (previous > 0)
+
+    def record_deleted_reports(self, rows: Iterable, scheduled_report_ids: Iterable[int] = ()) -> None:
+        """Counter deltas for reports removed in bulk; ``rows`` carry id,
+        agency_id, content_id and status of every deleted report (caller commits)"""
+        scheduled = set(scheduled_report_ids)
+        deltas: Dict[int, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        per_content: Dict[tuple, int] = defaultdict(int)
+
+        for row in rows:
+            agency = deltas[row.agency_id]
+            agency["report_count"] -= 1
+            agency["pending_report_count"] -= row.status in PENDING_STATUSES
+            agency["scheduled_report_count"] -= row.id in scheduled
+            per_content[row.agency_id, row.content_id] += 1
+
+        for (agency_id, content_id), removed in per_content.items():
+            deltas[agency_id]["content_count"] += self.track_content_reports(agency_id, content_id, -removed)
+
+        self.apply_many(deltas)
+
+    def get_dashboard(self, agency_id: int) -> Dict[str, Any]:
+        """Counters and subscription in one lookup, recent reports in a second"""
+        row = self.db.execute(
+            select(
+                AgencyDashboardStats,
+                Subscription.id.label("subscription_id"),
+                Subscription.started_at,
+                SubscriptionPlan.id.label("plan_id"),
+                SubscriptionPlan.name.label("plan_name")
+            )
+            .select_from(User)
+            .outerjoin(AgencyDashboardStats, AgencyDashboardStats.agency_id == User.id)
+            .outerjoin(
+                Subscription,
+                and_(
+                    Subscription.user_id == User.id,
+                    Subscription.status == SubscriptionStatus.ACTIVE
+                )
+            )
+            .outerjoin(SubscriptionPlan, SubscriptionPlan.id == Subscription.plan_id)
+            .where(User.id == agency_id)
+        ).first()
+
+        recent = self.db.execute(
+            select(Report.id, Report.name, Report.content_id, Report.status, Report.created_at, Report.finished_at)
+            .where(Report.agency_id == agency_id)
+            .order_by(Report.created_at.desc(), Report.id.desc())
+            .limit(RECENT_ACTIVITY_LIMIT)
+        ).all()
+
+        stats = row.AgencyDashboardStats if row else None
+        return {
+            "agency_id": agency_id,
+            **{name: getattr(stats, name) if stats else 0 for name in COUNTERS},
+            "last_report_at": stats.last_report_at.isoformat() if stats and stats.last_report_at else None,
+            "subscription": {
+                "id": row.subscription_id,
+                "status": SubscriptionStatus.ACTIVE.value,
+                "plan_id": row.plan_id,
+                "plan_name": row.plan_name,
+                "started_at": row.started_at.isoformat() if row.started_at else None,
+            } if row and row.subscription_id else None,
+            "recent_reports": [
+                {
+                    "id": report.id,
+                    "name": report.name,
+                    "content_id": report.content_id,
+                    "status": report.status.value,
+                    "created_at": report.created_at.isoformat() if report.created_at else None,
+                    "finished_at": report.finished_at.isoformat() if report.finished_at else None,
+                }
+                for report in recent
+            ],
+        }
+
+    def backfill(self) -> int:
+        """Rebuild every agency's counters from the reports and schedules tables"""
+        counts = self.db.execute(
+            select(
+                Report.agency_id,
+                func.count(Report.id),
+                func.count(func.distinct(Report.content_id)),
+                func.count(Report.id).filter(Report.status.in_(PENDING_STATUSES)),
+                func.count(ReportSchedule.id),
+                func.max(Report.created_at)
+            )
+            .outerjoin(ReportSchedule, ReportSchedule.report_id == Report.id)
+            .group_by(Report.agency_id)
+        ).all()
+
+        per_content = self.db.execute(
+            select(Report.agency_id, Report.content_id, func.count(Report.id))
+            .group_by(Report.agency_id, Report.content_id)
+        ).all()
+
+        self.db.execute(delete(AgencyContentReportCount))
+        self.db.add_all([
+            AgencyContentReportCount(agency_id=agency_id, content_id=content_id, report_count=reports)
+            for agency_id, content_id, reports in per_content
+        ])
+
+        self.db.execute(delete(AgencyDashboardStats))
+        now = datetime.utcnow()
+        for agency_id, reports, contents, pending, scheduled, last_report_at in counts:
+            self.db.add(AgencyDashboardStats(
+                agency_id=agency_id,
+                report_count=reports,
+                content_count=contents,
+                pending_report_count=pending,
+                scheduled_report_count=scheduled,
+                last_report_at=last_report_at,
+                updated_at=now
+            ))
+        self.db.commit()
+
+        return len(counts)
@@ -62,7 +62,7 @@ class BaseService(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
     def create(self, *, obj_in: CreateSchemaType) -> ModelType:
         """Create a new record"""
-        obj_in_data = obj_in.dict() if hasattr(obj_in, 'dict') else obj_in
+        obj_in_data = obj_in.model_dump() if hasattr(obj_in, 'model_dump') else obj_in
         db_obj = self.model(**obj_in_data)
         self.db.add(db_obj)
         self.db.commit()
@@ -76,7 +76,7 @@ class BaseService(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         obj_in: UpdateSchemaType
     ) -> ModelType:
         """Update an existing record"""
-        update_data = obj_in.dict(exclude_unset=True) if hasattr(obj_in, 'dict') else obj_in
+        update_data = obj_in.model_dump(exclude_unset=True) if hasattr(obj_in, 'model_dump') else obj_in
 
         for field, value in update_data.items():
             if hasattr(db_obj, field):
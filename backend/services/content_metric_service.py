@@ -0,0 +1,34 @@
+from typing import List
+from sqlalchemy import insert, update
+from sqlalchemy.orm import Session
+from models.content import Content
+from models.content_metric import ContentMetric
+from schemas.content_metric import ContentMetricCreate
+from services.base import BaseService
+
+class ContentMetricService(BaseService[ContentMetric, ContentMetricCreate, None]):
+    def __init__(self, db: Session):
+        super().__init__(ContentMetric, db)
+
+    def ingest(self, content_id: int, items: List[ContentMetricCreate]) -> int:
+        """Store a batch of metric observations with one executemany INSERT"""
+        if not items:
+            return 0
+
+        params = [{**item.model_dump(), "content_id": content_id} for item in items]
+
+        try:
+            self.db.execute(insert(ContentMetric), params)
+            # New data invalidates cached report results for this content
+            self.db.execute(
+                update(Content)
+                .where(Content.id == content_id)
+                .values(data_version=Content.data_version + 1)
+                .execution_options(synchronize_session=False)
+            )
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        return len(params)
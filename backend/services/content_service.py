@@ -1,16 +1,35 @@
 from typing import List, Optional, Dict, Any
+from sqlalchemy import insert, select, update, delete
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 from models.content import Content
-from models.user import UserRole
+from models.content_metric import ContentMetric
+from models.content_upload import ContentUpload
+from models.report import Report
+from models.report_partial import ReportPartial
+from models.report_schedule import ReportSchedule
+from models.user import User, UserRole
 from schemas.content import ContentCreate
 from services.base import BaseService
+from services.media_blob_service import MediaBlobService
+from services.agency_stats_service import AgencyStatsService
+from core.responses import make_row_etag
+from core.utils import load_fields
+
+def content_etag(content_id: int, data_version: int, updated_at, creator_updated_at) -> str:
+    """ETag of GET /content/{id}, which embeds the creator"""
+    return make_row_etag("content", content_id, data_version, updated_at, creator_updated_at)
 
 class ContentService(BaseService[Content, ContentCreate, None]):
     def __init__(self, db: Session):
         super().__init__(Content, db)
 
-    def create_content(self, content_data: ContentCreate, creator_id: int) -> Content:
+    def create_content(
+        self,
+        content_data: ContentCreate,
+        creator_id: int,
+        storage_key: Optional[str] = None
+    ) -> Content:
         """Create new content for a creator"""
         # Ensure the creator_id matches the authenticated user
         if content_data.creator_id != creator_id:
@@ -22,7 +41,8 @@ class ContentService(BaseService[Content, ContentCreate, None]):
         db_content = Content(
             title=content_data.title,
             file_url=content_data.file_url,
-            creator_id=creator_id
+            creator_id=creator_id,
+            storage_key=storage_key
         )
 
         self.db.add(db_content)
@@ -31,20 +51,88 @@ class ContentService(BaseService[Content, ContentCreate, None]):
 
         return db_content
 
-    def get_user_content(self, creator_id: int, page: int = 1, per_page: int = 10) -> Dict[str, Any]:
-        """Get all content by a specific creator"""
+    def bulk_create_content(self, items: List[ContentCreate], creator_id: int) -> List[Dict[str, Any]]:
+        """Insert many content rows with one multi-row INSERT ... RETURNING"""
+        if not items:
+            return []
+
+        # executemany with RETURNING is sent as multi-row INSERT statements
+        # (insertmanyvalues); sort_by_parameter_order keeps rows aligned with items
+        stmt = insert(Content).returning(
+            Content.id,
+            Content.title,
+            Content.file_url,
+            Content.creator_id,
+            Content.created_at,
+            sort_by_parameter_order=True
+        )
+        params = [
+            {
+                "title": item.title,
+                "file_url": item.file_url,
+                "creator_id": creator_id
+            }
+            for item in items
+        ]
+
+        try:
+            rows = self.db.execute(stmt, params).mappings().all()
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        return [dict(row) for row in rows]
+
+    def get_user_content(
+        self, creator_id: int, page: int = 1, per_page: int = 10, fields: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Get all content by a specific creator, loading only ``fields`` when given"""
         query = self.db.query(Content).filter(Content.creator_id == creator_id)
-        return self.paginate_query(query, page, per_page)
+        return self.paginate_query(load_fields(query, Content, fields), page, per_page)
 
-    def get_all_content(self, page: int = 1, per_page: int = 10) -> Dict[str, Any]:
-        """Get all content (admin only)"""
+    def get_all_content(self, page: int = 1, per_page: int = 10, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Get all content (admin only), loading only ``fields`` when given"""
         query = self.db.query(Content)
-        return self.paginate_query(query, page, per_page)
+        return self.paginate_query(load_fields(query, Content, fields), page, per_page)
 
     def get_content_with_creator(self, content_id: int) -> Optional[Content]:
         """Get content with creator information"""
         return self.db.query(Content).filter(Content.id == content_id).first()
 
+    def get_content_etag(self, content_id: int, user_id: int, user_role: UserRole) -> str:
+        """ETag of content the user may view, from version columns alone"""
+        row = self.db.execute(
+            select(Content.creator_id, Content.data_version, Content.updated_at, User.updated_at.label("creator_updated_at"))
+            .join(User, User.id == Content.creator_id)
+            .where(Content.id == content_id)
+        ).first()
+
+        if row is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Content not found"
+            )
+        if user_role != UserRole.ADMIN and row.creator_id != user_id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Not authorized to view this content"
+            )
+
+        return content_etag(content_id, row.data_version, row.updated_at, row.creator_updated_at)
+
+    def get_content_for_user(self, content_id: int, user_id: int, user_role: UserRole) -> Content:
+        """Get content the user may view (creator can view own, admin can view any)"""
+        content = self.get_or_404(content_id)
+
+        if user_role != UserRole.ADMIN and content.creator_id != user_id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Not authorized to view this content"
+            )
+
+        return content
+
     def delete_content(self, content_id: int, user_id: int, user_role: UserRole) -> Content:
         """Delete content (creator can delete own, admin can delete any)"""
         content = self.get_or_404(content_id)
@@ -56,10 +144,96 @@ class ContentService(BaseService[Content, ContentCreate, None]):
                 detail="Not authorized to delete this content"
             )
 
-        self.db.delete(content)
-        self.db.commit()
+        # Detach first so the returned object stays readable after the delete
+        self.db.expunge(content)
+        self._delete_where(Content.id == content_id)
         return content
 
+    def bulk_delete_content(self, content_ids: List[int], user_id: int, user_role: UserRole) -> Dict[str, Any]:
+        """Delete many content items and their reports in a few set-based statements.
+
+        Ownership is part of the WHERE clause, so ids the user may not delete
+        (or that don't exist) are skipped rather than loaded and checked.
+        """
+        ids = list(dict.fromkeys(content_ids))
+        if not ids:
+            return {"deleted_ids": [], "skipped_ids": [], "deleted_content": 0, "deleted_reports": 0}
+
+        condition = Content.id.in_(ids)
+        if user_role != UserRole.ADMIN:
+            condition = condition & (Content.creator_id == user_id)
+
+        deleted_ids, deleted_reports = self._delete_where(condition)
+        deleted = set(deleted_ids)
+
+        return {
+            "deleted_ids": sorted(deleted),
+            "skipped_ids": [content_id for content_id in ids if content_id not in deleted],
+            "deleted_content": len(deleted),
+            "deleted_reports": deleted_reports
+        }
+
+    def _delete_where(self, condition) -> tuple:
+        """Delete matching content with its reports (and their schedules),
+        metrics and upload links, then release their media blobs.
+        Returns (deleted ids, deleted report count)."""
+        matching = select(Content.id).where(condition)
+
+        try:
+            self.db.execute(
+                delete(ReportPartial)
+                .where(
+                    ReportPartial.content_id.in_(matching)
+                    | ReportPartial.report_id.in_(select(Report.id).where(Report.content_id.in_(matching)))
+                )
+                .execution_options(synchronize_session=False)
+            )
+            scheduled_report_ids = self.db.execute(
+                delete(ReportSchedule)
+                .where(ReportSchedule.report_id.in_(
+                    select(Report.id).where(Report.content_id.in_(matching))
+                ))
+                .returning(ReportSchedule.report_id)
+                .execution_options(synchronize_session=False)
+            ).scalars().all()
+            report_rows = self.db.execute(
+                delete(Report)
+                .where(Report.content_id.in_(matching))
+                .returning(Report.id, Report.agency_id, Report.content_id, Report.status)
+                .execution_options(synchronize_session=False)
+            ).all()
+            AgencyStatsService(self.db).record_deleted_reports(report_rows, scheduled_report_ids)
+            self.db.execute(
+                delete(ContentMetric)
+                .where(ContentMetric.content_id.in_(matching))
+                .execution_options(synchronize_session=False)
+            )
+            self.db.execute(
+                update(ContentUpload)
+                .where(ContentUpload.content_id.in_(matching))
+                .values(content_id=None)
+                .execution_options(synchronize_session=False)
+            )
+            rows = self.db.execute(
+                delete(Content)
+                .where(condition)
+                .returning(Content.id, Content.content_hash, Content.storage_key)
+                .execution_options(synchronize_session=False)
+            ).all()
+
+            blob_service = MediaBlobService(self.db)
+            orphan_keys = blob_service.release_many(
+                (row.content_hash, row.storage_key) for row in rows
+            )
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        # Only remove files once no other content shares them
+        blob_service.delete_objects(orphan_keys)
+        return [row.id for row in rows], len(report_rows)
+
     def paginate_query(self, query, page: int, per_page: int) -> Dict[str, Any]:
         """Paginate query results"""
         total = query.count()
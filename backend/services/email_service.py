@@ -14,7 +14,8 @@ EMAILS_FROM_NAME = os.getenv("EMAILS_FROM_NAME", "Creator Agency SaaS")
 
 class EmailService:
     @staticmethod
-    def send_email(to_email: str, subject: str, body: str, html: Optional[str] = None):
+    def send_email(to_email: str, subject: str, body: str, html: Optional[str] = None) -> bool:
+        """Send an email; returns whether it was handed to the SMTP server"""
         try:
             msg = MIMEMultipart("alternative")
             msg["From"] = f"{EMAILS_FROM_NAME} <{EMAILS_FROM_EMAIL}>"
@@ -34,9 +35,11 @@ class EmailService:
                 server.sendmail(EMAILS_FROM_EMAIL, to_email, msg.as_string())
 
             print(f"✅ Email sent to {to_email}")
+            return True
 
         except Exception as e:
             print(f"❌ Email sending failed: {str(e)}")
+            return False
 
 
 email_service = EmailService()
@@ -0,0 +1,114 @@
+from collections import Counter
+from typing import Iterable, List, Optional, Tuple, Dict, Any
+from sqlalchemy import bindparam, func, select, delete
+from sqlalchemy.orm import Session
+from core.utils import dialect_insert
+from models.content import Content
+from models.media_blob import MediaBlob
+from services.rendition_service import forget_renditions
+from services.storage_service import get_storage_backend
+
+class MediaBlobService:
+    """Content-addressable storage: identical bytes are stored once and
+    reference counted by the Content rows that point at them."""
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.storage = get_storage_backend()
+
+    def register(self, content: Content, content_hash: str, size_bytes: Optional[int]) -> Optional[str]:
+        """Point content at the blob for its hash, creating it if it's new.
+
+        Returns the key of the now-redundant uploaded object when the bytes
+        were already stored; delete it with delete_objects() after committing.
+        """
+        insert = dialect_insert(self.db)
+        stmt = insert(MediaBlob).values(
+            content_hash=content_hash,
+            storage_key=content.storage_key,
+            size_bytes=size_bytes,
+            ref_count=1
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[MediaBlob.content_hash],
+            set_={"ref_count": MediaBlob.ref_count + 1}
+        ).returning(MediaBlob.storage_key)
+
+        blob_key = self.db.execute(stmt).scalar_one()
+        content.content_hash = content_hash
+
+        if blob_key == content.storage_key:
+            return None
+
+        duplicate_key = content.storage_key
+        content.storage_key = blob_key
+        content.file_url = self.storage.url(blob_key)
+        return duplicate_key
+
+    def release_many(self, refs: Iterable[Tuple[Optional[str], Optional[str]]]) -> List[str]:
+        """Drop one reference per (content_hash, storage_key) pair; returns the
+        keys no longer referenced by anything (caller commits)"""
+        orphan_keys = []
+        counts = Counter()
+        keys_by_hash = {}
+
+        for content_hash, storage_key in refs:
+            if not storage_key:
+                continue
+            if not content_hash:
+                orphan_keys.append(storage_key)
+                continue
+            counts[content_hash] += 1
+            keys_by_hash[content_hash] = storage_key
+
+        if not counts:
+            return orphan_keys
+
+        hashes = list(counts)
+        known = set(self.db.execute(
+            select(MediaBlob.content_hash).where(MediaBlob.content_hash.in_(hashes))
+        ).scalars())
+        # Hashed content without a blob row owns its object outright
+        orphan_keys.extend(keys_by_hash[h] for h in hashes if h not in known)
+
+        if known:
+            blobs = MediaBlob.__table__
+            self.db.execute(
+                blobs.update()
+                .where(blobs.c.content_hash == bindparam("blob_hash"))
+                .values(ref_count=blobs.c.ref_count - bindparam("released")),
+                [{"blob_hash": h, "released": counts[h]} for h in known]
+            )
+            orphan_keys.extend(self.db.execute(
+                delete(MediaBlob)
+                .where(MediaBlob.content_hash.in_(known), MediaBlob.ref_count <= 0)
+                .returning(MediaBlob.storage_key)
+                .execution_options(synchronize_session=False)
+            ).scalars())
+
+        return orphan_keys
+
+    def delete_objects(self, keys: Iterable[Optional[str]]) -> None:
+        """Remove unreferenced objects (and their renditions) from storage"""
+        for key in keys:
+            if not key:
+                continue
+            forget_renditions(self.storage, key)
+            self.storage.delete(key)
+
+    def get_storage_savings(self) -> Dict[str, Any]:
+        """How much storage deduplication saves"""
+        blobs, references, stored_bytes, saved_bytes = self.db.query(
+            func.count(MediaBlob.content_hash),
+            func.coalesce(func.sum(MediaBlob.ref_count), 0),
+            func.coalesce(func.sum(MediaBlob.size_bytes), 0),
+            func.coalesce(func.sum((MediaBlob.ref_count - 1) * MediaBlob.size_bytes), 0)
+        ).one()
+
+        return {
+            "blobs": blobs,
+            "references": int(references),
+            "duplicate_references": int(references) - blobs,
+            "stored_bytes": int(stored_bytes),
+            "saved_bytes": int(saved_bytes)
+        }
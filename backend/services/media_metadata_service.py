@@ -0,0 +1,172 @@
+import hashlib
+import json
+import logging
+import mimetypes
+import os
+import shutil
+import subprocess
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, Any, Optional
+from core.config import settings
+from services.storage_service import get_storage_backend, local_path
+
+logger = logging.getLogger(__name__)
+
+# Leading bytes of common media formats, used when the extension is missing or wrong
+MAGIC_NUMBERS = [
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+    (b"%PDF-", "application/pdf"),
+    (b"\x1aE\xdf\xa3", "video/webm"),
+    (b"ID3", "audio/mpeg"),
+    (b"OggS", "audio/ogg"),
+]
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+def sniff_mime_type(path: str, header: bytes) -> Optional[str]:
+    """Guess a MIME type from the file's leading bytes, then its extension"""
+    for magic, mime_type in MAGIC_NUMBERS:
+        if header.startswith(magic):
+            return mime_type
+    if header[4:8] == b"ftyp":
+        return "video/quicktime" if header[8:10] == b"qt" else "video/mp4"
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return "image/webp"
+    if header[:4] == b"RIFF" and header[8:12] == b"WAVE":
+        return "audio/wav"
+    return mimetypes.guess_type(path)[0]
+
+def probe_image_dimensions(path: str) -> Optional[tuple]:
+    """(width, height) of an image, or None if Pillow can't read it"""
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+
+    try:
+        with Image.open(path) as image:
+            return image.size
+    except Exception:
+        return None
+
+def probe_media_duration(path: str) -> Optional[float]:
+    """Duration in seconds of an audio/video file, via ffprobe when available"""
+    ffprobe = shutil.which("ffprobe")
+    if not ffprobe:
+        return None
+
+    try:
+        output = subprocess.run(
+            [ffprobe, "-v", "error", "-show_entries", "format=duration", "-of", "json", path],
+            capture_output=True,
+            timeout=60,
+            check=True
+        ).stdout
+        return float(json.loads(output)["format"]["duration"])
+    except (subprocess.SubprocessError, KeyError, ValueError):
+        return None
+
+def probe_file(path: str, known_hash: Optional[str] = None) -> Dict[str, Any]:
+    """Collect MIME type, size, SHA-256, image dimensions and media duration.
+
+    Runs inside the process pool, so it only takes and returns plain data.
+    """
+    digest = hashlib.sha256()
+    header = b""
+
+    with open(path, "rb") as f:
+        header = f.read(64)
+        if known_hash is None:
+            digest.update(header)
+            for chunk in iter(lambda: f.read(settings.UPLOAD_CHUNK_SIZE), b""):
+                digest.update(chunk)
+
+    mime_type = sniff_mime_type(path, header)
+    metadata = {
+        "mime_type": mime_type,
+        "size_bytes": os.path.getsize(path),
+        "content_hash": known_hash or digest.hexdigest(),
+        "width": None,
+        "height": None,
+        "duration_seconds": None,
+    }
+
+    if mime_type and mime_type.startswith("image/"):
+        dimensions = probe_image_dimensions(path)
+        if dimensions:
+            metadata["width"], metadata["height"] = dimensions
+    elif mime_type and mime_type.startswith(("video/", "audio/")):
+        metadata["duration_seconds"] = probe_media_duration(path)
+
+    return metadata
+
+def extract_stored_metadata(storage_key: str, known_hash: Optional[str] = None) -> Dict[str, Any]:
+    """Probe an object in the configured storage backend (process-pool entry point)"""
+    with local_path(get_storage_backend(), storage_key) as path:
+        return probe_file(path, known_hash)
+
+def get_media_executor() -> ProcessPoolExecutor:
+    """Process pool for media work (metadata, renditions), sized to the available cores"""
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=settings.MEDIA_WORKERS or os.cpu_count())
+    return _executor
+
+def shutdown_media_executor() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+def schedule_metadata_extraction(
+    content_id: int,
+    storage_key: str,
+    known_hash: Optional[str] = None
+) -> Future:
+    """Probe a content file in the background and store the results on its row"""
+    future = get_media_executor().submit(extract_stored_metadata, storage_key, known_hash)
+    future.add_done_callback(lambda f: _save_metadata(content_id, f))
+    return future
+
+def _save_metadata(content_id: int, future: Future) -> None:
+    """Done-callback: persist probe results with a short-lived session"""
+    from database import SessionLocal
+    from models.content import Content
+    from services.media_blob_service import MediaBlobService
+
+    try:
+        metadata = future.result()
+    except Exception as e:
+        logger.error(f"Metadata extraction failed for content {content_id}: {str(e)}")
+        return
+
+    db = SessionLocal()
+    try:
+        content = db.query(Content).filter(Content.id == content_id).first()
+        if content is None:
+            return
+
+        duplicate_key = None
+        if content.content_hash is None and content.storage_key:
+            # Presigned uploads only learn their hash here, so dedupe now
+            blob_service = MediaBlobService(db)
+            duplicate_key = blob_service.register(
+                content, metadata["content_hash"], metadata["size_bytes"]
+            )
+
+        for field, value in metadata.items():
+            setattr(content, field, value)
+        content.metadata_extracted_at = datetime.utcnow()
+        db.commit()
+
+        if duplicate_key:
+            blob_service.delete_objects([duplicate_key])
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Failed to store metadata for content {content_id}: {str(e)}")
+    finally:
+        db.close()
@@ -1,6 +1,7 @@
 import stripe
 from typing import Dict, Any, Optional
 from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
 from core.config import settings
 from models.subscription import Subscription, SubscriptionStatus
@@ -48,7 +49,8 @@ class PaymentService:
                 detail="User not found"
             )
 
-        # Check if user already has an active subscription
+        # Fast-path check so we don't open a Stripe session that can never be
+        # fulfilled; the partial unique index enforces it when the webhook inserts
         existing_subscription = self.subscription_service.get_active_subscription(user_id)
         if existing_subscription:
             raise HTTPException(
@@ -105,6 +107,12 @@ class PaymentService:
             plan_id = int(session['metadata']['plan_id'])
             stripe_subscription_id = session['subscription']
 
+            # Redelivered webhook: this Stripe subscription is already recorded
+            if self.db.query(Subscription.id).filter(
+                Subscription.stripe_subscription_id == stripe_subscription_id
+            ).first():
+                return
+
             # Get user and plan info
             user = self.db.query(User).filter(User.id == user_id).first()
             plan = self.db.query(SubscriptionPlan).filter(SubscriptionPlan.id == plan_id).first()
@@ -117,8 +125,14 @@ class PaymentService:
                 stripe_subscription_id=stripe_subscription_id
             )
 
-            self.db.add(subscription)
-            self.db.commit()
+            try:
+                self.subscription_service.add_subscription(subscription)
+                self.db.commit()
+            except IntegrityError:
+                self.db.rollback()
+                self._cancel_duplicate_checkout(user_id, stripe_subscription_id)
+                return
+
             self.db.refresh(subscription)
 
             # Send subscription success email
@@ -138,6 +152,28 @@ class PaymentService:
             logger.error(f"Error handling checkout completion: {str(e)}")
             raise e
 
+    def _cancel_duplicate_checkout(self, user_id: int, stripe_subscription_id: str) -> None:
+        """A second checkout lost the race to the partial unique index: the user
+        already has an active subscription, so stop Stripe billing for this one"""
+        active = self.subscription_service.get_active_subscription(user_id)
+        if active and active.stripe_subscription_id == stripe_subscription_id:
+            return  # Concurrent redelivery of the webhook that won
+
+        logger.error(
+            f"Duplicate checkout for user {user_id}: canceling Stripe subscription "
+            f"{stripe_subscription_id}, active subscription is {active.id if active else None}; "
+            f"refund its first invoice if it was charged"
+        )
+        try:
+            stripe.Subscription.delete(stripe_subscription_id)
+        except stripe.error.StripeError as e:
+            # Fail the webhook so Stripe redelivers it and the cancel is retried
+            logger.critical(
+                f"Could not cancel duplicate Stripe subscription {stripe_subscription_id} "
+                f"for user {user_id}, customer is still being billed: {str(e)}"
+            )
+            raise
+
     def handle_subscription_updated(self, subscription_data: Dict[str, Any]) -> None:
         """Handle subscription status updates from Stripe"""
         try:
@@ -154,12 +190,20 @@ class PaymentService:
 
             # Map Stripe status to our status
             if stripe_status == 'active':
-                subscription.status = SubscriptionStatus.ACTIVE
+                self.subscription_service.set_status(subscription, SubscriptionStatus.ACTIVE)
             elif stripe_status in ['canceled', 'unpaid', 'past_due']:
-                subscription.status = SubscriptionStatus.CANCELED
+                self.subscription_service.set_status(subscription, SubscriptionStatus.CANCELED)
 
             self.db.commit()
 
+        except IntegrityError:
+            # Reactivation would give the user a second active subscription
+            self.db.rollback()
+            logger.warning(
+                f"Not reactivating Stripe subscription {subscription_data['id']}: "
+                f"user already has an active subscription"
+            )
+
         except Exception as e:
             self.db.rollback()
             raise e
@@ -175,7 +219,7 @@ class PaymentService:
             ).first()
 
             if subscription:
-                subscription.status = SubscriptionStatus.CANCELED
+                self.subscription_service.set_status(subscription, SubscriptionStatus.CANCELED)
                 self.db.commit()
 
                 # Send cancellation email
@@ -222,7 +266,7 @@ class PaymentService:
                 stripe.Subscription.delete(subscription.stripe_subscription_id)
 
             # Update database
-            subscription.status = SubscriptionStatus.CANCELED
+            self.subscription_service.set_status(subscription, SubscriptionStatus.CANCELED)
             self.db.commit()
 
             # Send cancellation email
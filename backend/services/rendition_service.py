@@ -0,0 +1,91 @@
+import asyncio
+import io
+import os
+from concurrent.futures import Future
+from typing import Dict, Set
+from fastapi import HTTPException, status
+from starlette.concurrency import run_in_threadpool
+from core.config import settings
+from models.content import Content
+from services.media_metadata_service import get_media_executor
+from services.storage_service import StorageBackend, get_storage_backend, local_path
+
+# Rendition keys already known to exist in storage, so repeat requests skip the lookup
+_known_renditions: Set[str] = set()
+# Renditions being generated right now, shared by concurrent requests for the same key
+_pending_renditions: Dict[str, Future] = {}
+
+def rendition_key(storage_key: str, size: int) -> str:
+    """Storage key of a thumbnail, stored next to the original"""
+    return f"{os.path.dirname(storage_key)}/renditions/{size}.jpg"
+
+def forget_renditions(storage: StorageBackend, storage_key: str) -> None:
+    """Delete an original's renditions and drop them from the memo"""
+    for size in settings.RENDITION_SIZES:
+        key = rendition_key(storage_key, size)
+        _known_renditions.discard(key)
+        storage.delete(key)
+
+def render_thumbnail(storage_key: str, size: int) -> str:
+    """Resize an image to fit in size x size and store it as JPEG (process-pool entry point)"""
+    from PIL import Image
+
+    storage = get_storage_backend()
+    target_key = rendition_key(storage_key, size)
+
+    with local_path(storage, storage_key) as path, Image.open(path) as image:
+        image.thumbnail((size, size))
+        if image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+        buffer = io.BytesIO()
+        image.save(buffer, "JPEG", quality=85, optimize=True)
+
+    storage.write_chunk(target_key, buffer.getvalue(), 0)
+    return target_key
+
+async def get_rendition(content: Content, size: int) -> str:
+    """Return the key of a content thumbnail, generating it on first request"""
+    if size not in settings.RENDITION_SIZES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Thumbnail size must be one of {settings.RENDITION_SIZES}"
+        )
+
+    if not content.storage_key:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Content file is not hosted by this service"
+        )
+
+    if content.mime_type and not content.mime_type.startswith("image/"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Thumbnails are only available for image content"
+        )
+
+    key = rendition_key(content.storage_key, size)
+    if key in _known_renditions:
+        return key
+
+    storage = get_storage_backend()
+    if await run_in_threadpool(storage.exists, key):
+        _known_renditions.add(key)
+        return key
+
+    future = _pending_renditions.get(key)
+    if future is None:
+        future = get_media_executor().submit(render_thumbnail, content.storage_key, size)
+        _pending_renditions[key] = future
+
+    try:
+        await asyncio.wrap_future(future)
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Could not generate a thumbnail for this content"
+        )
+    finally:
+        _pending_renditions.pop(key, None)
+
+    _known_renditions.add(key)
+    return key
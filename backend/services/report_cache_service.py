@@ -0,0 +1,83 @@
+import hashlib
+import json
+from datetime import datetime
+from typing import List, Optional, Dict, Any
+from sqlalchemy import select, update, delete, func
+from sqlalchemy.orm import Session
+from core.config import settings
+from core.utils import dialect_insert
+from models.content import Content
+from models.report_result_cache import ReportResultCache
+
+class ReportCacheService:
+    """LRU cache of report results shared by the API and the report workers.
+
+    Keys cover the content ids, each content's data_version and the report
+    parameters, so new metrics change the key instead of needing an
+    invalidation. Stale entries simply stop being used and are evicted
+    once the cache exceeds REPORT_CACHE_MAX_BYTES.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def build_key(self, content_ids: List[int], parameters: Dict[str, Any]) -> str:
+        versions = dict(
+            self.db.execute(
+                select(Content.id, Content.data_version).where(Content.id.in_(content_ids))
+            ).all()
+        )
+        payload = {
+            "content": [[content_id, versions.get(content_id)] for content_id in content_ids],
+            "parameters": {key: value for key, value in parameters.items() if key != "content_ids"},
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+    def get(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Cached results for a key, marking the entry as recently used (caller commits)"""
+        results = self.db.execute(
+            update(ReportResultCache)
+            .where(ReportResultCache.cache_key == cache_key)
+            .values(last_used_at=datetime.utcnow())
+            .returning(ReportResultCache.results)
+            .execution_options(synchronize_session=False)
+        ).scalar_one_or_none()
+        return results
+
+    def put(self, cache_key: str, results: Dict[str, Any]) -> None:
+        """Store results and evict least recently used entries over budget (caller commits)"""
+        size_bytes = len(json.dumps(results))
+        if size_bytes > settings.REPORT_CACHE_MAX_BYTES:
+            return
+
+        now = datetime.utcnow()
+        insert = dialect_insert(self.db)
+        stmt = insert(ReportResultCache).values(
+            cache_key=cache_key,
+            results=results,
+            size_bytes=size_bytes,
+            created_at=now,
+            last_used_at=now
+        )
+        self.db.execute(stmt.on_conflict_do_update(
+            index_elements=[ReportResultCache.cache_key],
+            set_={"results": stmt.excluded.results, "size_bytes": size_bytes, "last_used_at": now}
+        ))
+        self.evict()
+
+    def evict(self) -> int:
+        """Drop the least recently used entries beyond REPORT_CACHE_MAX_BYTES"""
+        ranked = select(
+            ReportResultCache.cache_key,
+            func.sum(ReportResultCache.size_bytes).over(
+                order_by=(ReportResultCache.last_used_at.desc(), ReportResultCache.cache_key)
+            ).label("running_bytes")
+        ).subquery()
+
+        return self.db.execute(
+            delete(ReportResultCache)
+            .where(ReportResultCache.cache_key.in_(
+                select(ranked.c.cache_key).where(ranked.c.running_bytes > settings.REPORT_CACHE_MAX_BYTES)
+            ))
+            .execution_options(synchronize_session=False)
+        ).rowcount
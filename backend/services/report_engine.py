@@ -0,0 +1,173 @@
+from datetime import datetime
+from typing import Callable, Iterable, List, Optional, Dict, Any, Tuple
+import numpy as np
+import pandas as pd
+from sqlalchemy import select, cast, Float
+from sqlalchemy.orm import Session
+from models.content_metric import ContentMetric
+
+# Additive metrics: partial aggregates of these can be merged by summing
+SUM_METRICS = ["views", "likes", "comments", "shares", "watch_time_seconds", "revenue"]
+
+GROUP_COLUMNS = {
+    "platform": "platform",
+    "country": "country",
+    "content": "content_id",
+}
+
+PERIODS = {"week": "W-SUN", "month": "M"}  # W-SUN periods start on Monday
+
+def window_bounds(parameters: Dict[str, Any]) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """A report's start/end as naive UTC datetimes, matching recorded_at.
+
+    ReportParameters normalizes new windows; parameters stored before that
+    may still carry an offset.
+    """
+    bounds = []
+    for key in ("start", "end"):
+        bound = pd.Timestamp(parameters[key]) if parameters.get(key) else None
+        if bound is not None and bound.tzinfo is not None:
+            bound = bound.tz_convert("UTC").tz_localize(None)
+        bounds.append(bound.to_pydatetime() if bound is not None else None)
+    return bounds[0], bounds[1]
+
+def load_metrics(
+    db: Session,
+    content_ids: Iterable[int],
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None
+) -> pd.DataFrame:
+    """Read the metric rows a report needs into a DataFrame"""
+    stmt = select(
+        ContentMetric.content_id,
+        ContentMetric.recorded_at,
+        ContentMetric.platform,
+        ContentMetric.country,
+        ContentMetric.views,
+        ContentMetric.likes,
+        ContentMetric.comments,
+        ContentMetric.shares,
+        ContentMetric.watch_time_seconds,
+        cast(ContentMetric.revenue, Float).label("revenue")
+    ).where(ContentMetric.content_id.in_(list(content_ids)))
+
+    if start:
+        stmt = stmt.where(ContentMetric.recorded_at >= start)
+    if end:
+        stmt = stmt.where(ContentMetric.recorded_at < end)
+
+    frame = pd.read_sql_query(stmt, db.connection(), parse_dates=["recorded_at"])
+    return frame.astype({metric: "float64" for metric in SUM_METRICS})
+
+def aggregate(frame: pd.DataFrame, granularity: str = "day", group_by: Optional[str] = None) -> pd.DataFrame:
+    """Sum metrics per (bucket, group).
+
+    The result is a partial aggregate: partials over disjoint rows combine
+    exactly with merge_partials(), so they can be computed per content and
+    stored.
+    """
+    if granularity == "day":
+        buckets = frame["recorded_at"].dt.floor("D")
+    else:
+        buckets = frame["recorded_at"].dt.to_period(PERIODS[granularity]).dt.start_time
+
+    if group_by:
+        groups = frame[GROUP_COLUMNS[group_by]].astype("string").fillna("unknown")
+    else:
+        groups = pd.Series("all", index=frame.index, dtype="string")
+
+    sums = frame[SUM_METRICS].assign(samples=1.0)
+    return sums.groupby([buckets.rename("bucket"), groups.rename("group")], sort=False).sum()
+
+def merge_partials(partials: List[pd.DataFrame]) -> pd.DataFrame:
+    """Combine partial aggregates into one"""
+    partials = [partial for partial in partials if not partial.empty]
+    if not partials:
+        return empty_partial()
+    if len(partials) == 1:
+        return partials[0]
+    return pd.concat(partials).groupby(level=["bucket", "group"], sort=False).sum()
+
+def empty_partial() -> pd.DataFrame:
+    index = pd.MultiIndex.from_arrays(
+        [pd.DatetimeIndex([]), pd.Index([], dtype="string")], names=["bucket", "group"]
+    )
+    return pd.DataFrame(columns=SUM_METRICS + ["samples"], index=index, dtype="float64")
+
+def partial_to_json(partial: pd.DataFrame) -> Dict[str, List[Any]]:
+    """Column-oriented JSON form of a partial aggregate, for storage"""
+    frame = partial.reset_index()
+    frame["bucket"] = frame["bucket"].dt.strftime("%Y-%m-%dT%H:%M:%S")
+    return frame.astype({"group": "object"}).to_dict("list")
+
+def partial_from_json(data: Dict[str, List[Any]]) -> pd.DataFrame:
+    if not data.get("bucket"):
+        return empty_partial()
+    frame = pd.DataFrame(data)
+    frame["bucket"] = pd.to_datetime(frame["bucket"])
+    frame["group"] = frame["group"].astype("string")
+    return frame.set_index(["bucket", "group"]).astype("float64")
+
+def finalize(partial: pd.DataFrame) -> Dict[str, Any]:
+    """Turn a partial aggregate into the JSON stored on the report,
+    adding the ratio metrics that can't be summed"""
+    totals = _derive(partial.sum().to_frame().T)
+    series = _derive(partial.sort_index().reset_index())
+    series["bucket"] = series["bucket"].dt.strftime("%Y-%m-%dT%H:%M:%S")
+
+    return {
+        "totals": totals.to_dict("records")[0],
+        "series": series.to_dict("records"),
+    }
+
+def _derive(frame: pd.DataFrame) -> pd.DataFrame:
+    """Vectorized ratio columns; rows without views get 0 rather than NaN"""
+    views = frame["views"].to_numpy(dtype="float64")
+    engagement = frame[["likes", "comments", "shares"]].to_numpy(dtype="float64").sum(axis=1)
+    revenue = frame["revenue"].to_numpy(dtype="float64")
+
+    return frame.assign(
+        samples=frame["samples"].astype("int64"),
+        engagement=engagement,
+        engagement_rate=np.divide(engagement, views, out=np.zeros_like(views), where=views > 0),
+        revenue_per_mille=np.divide(revenue * 1000, views, out=np.zeros_like(views), where=views > 0)
+    )
+
+def compute_report(
+    db: Session,
+    content_ids: List[int],
+    parameters: Dict[str, Any],
+    progress: Optional[Callable[[float], None]] = None
+) -> Dict[str, Any]:
+    """Aggregate the metrics of ``content_ids`` as described by ``parameters``.
+
+    Content is processed one item at a time and the partials merged, which
+    bounds memory to the largest item and lets ``progress`` report a fraction.
+    """
+    start, end = window_bounds(parameters)
+    granularity = parameters.get("granularity", "day")
+    group_by = parameters.get("group_by")
+
+    partials = []
+    row_count = 0
+    for done, content_id in enumerate(content_ids, start=1):
+        frame = load_metrics(db, [content_id], start, end)
+        partials.append(aggregate(frame, granularity, group_by))
+        row_count += len(frame)
+        if progress:
+            progress(done / len(content_ids))
+
+    return {**finalize(merge_partials(partials)), "row_count": row_count}
+
+def compute_from_frame(frame: pd.DataFrame, content_ids: List[int], parameters: Dict[str, Any]) -> Dict[str, Any]:
+    """Like compute_report, over rows already loaded for several reports at once"""
+    mask = frame["content_id"].isin(content_ids).to_numpy()
+    start, end = window_bounds(parameters)
+    if start:
+        mask &= (frame["recorded_at"] >= start).to_numpy()
+    if end:
+        mask &= (frame["recorded_at"] < end).to_numpy()
+
+    rows = frame[mask]
+    partial = aggregate(rows, parameters.get("granularity", "day"), parameters.get("group_by"))
+    return {**finalize(partial), "row_count": len(rows)}
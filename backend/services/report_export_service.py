@@ -0,0 +1,219 @@
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+from sqlalchemy import select, cast, Float
+from sqlalchemy.orm import Session
+from core.config import settings
+from models.content_metric import ContentMetric
+from models.report import Report
+from services.report_engine import window_bounds
+from services.report_service import report_content_ids
+
+EXPORT_COLUMNS = [
+    "content_id", "recorded_at", "platform", "country", "views", "likes",
+    "comments", "shares", "watch_time_seconds", "revenue",
+]
+
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+    "pdf": "application/pdf",
+}
+
+def iter_report_rows(
+    db: Session, report: Report, parameters: Optional[Dict[str, Any]] = None
+) -> Iterator[Sequence]:
+    """Yield the metric rows behind a report through a server-side cursor.
+
+    ``parameters`` overrides the report's stored ones, e.g. with a
+    scheduled period's window.
+    """
+    if parameters is None:
+        parameters = report.parameters or {}
+    stmt = (
+        select(
+            ContentMetric.content_id,
+            ContentMetric.recorded_at,
+            ContentMetric.platform,
+            ContentMetric.country,
+            ContentMetric.views,
+            ContentMetric.likes,
+            ContentMetric.comments,
+            ContentMetric.shares,
+            ContentMetric.watch_time_seconds,
+            cast(ContentMetric.revenue, Float).label("revenue")
+        )
+        .where(ContentMetric.content_id.in_(report_content_ids(report)))
+        .order_by(ContentMetric.content_id, ContentMetric.recorded_at)
+        .execution_options(yield_per=settings.REPORT_EXPORT_BATCH_SIZE)
+    )
+    start, end = window_bounds(parameters)
+    if start:
+        stmt = stmt.where(ContentMetric.recorded_at >= start)
+    if end:
+        stmt = stmt.where(ContentMetric.recorded_at < end)
+
+    yield from db.execute(stmt)
+
+def _batches(rows: Iterable[Sequence]) -> Iterator[List[Sequence]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= settings.REPORT_EXPORT_BATCH_SIZE:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def iter_csv(rows: Iterable[Sequence]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+
+    for batch in _batches(rows):
+        for row in batch:
+            writer.writerow([value.isoformat() if hasattr(value, "isoformat") else value for value in row])
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+def _isoformat(value):
+    return value.isoformat()
+
+def iter_ndjson(rows: Iterable[Sequence]) -> Iterator[bytes]:
+    for batch in _batches(rows):
+        yield "".join(
+            json.dumps(dict(zip(EXPORT_COLUMNS, row)), default=_isoformat) + "\n" for row in batch
+        ).encode()
+
+class _PdfWriter:
+    """Writes a plain-text PDF page by page, tracking object offsets for the
+    xref table so the document never has to be held in memory"""
+
+    PAGE_WIDTH, PAGE_HEIGHT = 842, 595  # A4 landscape, in points
+    FONT_SIZE = 7
+    LINE_HEIGHT = 9
+    MARGIN = 36
+    LINES_PER_PAGE = (PAGE_HEIGHT - 2 * MARGIN) // LINE_HEIGHT
+
+    # Objects 1-3 (catalog, page tree, font) have fixed numbers; pages follow
+    CATALOG, PAGES, FONT = 1, 2, 3
+
+    def __init__(self):
+        self.offset = 0
+        self.object_offsets = {}
+        self.page_ids = []
+        self.next_id = 4
+
+    def _emit(self, data: bytes) -> bytes:
+        self.offset += len(data)
+        return data
+
+    def _object(self, object_id: int, body: bytes) -> bytes:
+        self.object_offsets[object_id] = self.offset
+        return self._emit(b"%d 0 obj\n" % object_id + body + b"\nendobj\n")
+
+    def start(self) -> bytes:
+        return self._emit(b"%PDF-1.4\n") + self._object(
+            self.FONT, b"<< /Type /Font /Subtype /Type1 /BaseFont /Courier >>"
+        )
+
+    def page(self, lines: List[str]) -> bytes:
+        text = [b"BT /F1 %d Tf %d TL %d %d Td" % (
+            self.FONT_SIZE, self.LINE_HEIGHT, self.MARGIN, self.PAGE_HEIGHT - self.MARGIN
+        )]
+        for line in lines:
+            escaped = line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+            text.append(b"(" + escaped.encode("latin-1", "replace") + b") '")
+        text.append(b"ET")
+        stream = b"\n".join(text)
+
+        content_id, page_id = self.next_id, self.next_id + 1
+        self.next_id += 2
+        self.page_ids.append(page_id)
+
+        return self._object(
+            content_id, b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream"
+        ) + self._object(
+            page_id,
+            b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 %d %d] "
+            b"/Resources << /Font << /F1 %d 0 R >> >> /Contents %d 0 R >>" % (
+                self.PAGES, self.PAGE_WIDTH, self.PAGE_HEIGHT, self.FONT, content_id
+            )
+        )
+
+    def finish(self) -> bytes:
+        kids = b" ".join(b"%d 0 R" % page_id for page_id in self.page_ids)
+        data = self._object(
+            self.PAGES, b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(self.page_ids))
+        ) + self._object(self.CATALOG, b"<< /Type /Catalog /Pages %d 0 R >>" % self.PAGES)
+
+        xref_offset = self.offset
+        xref = [b"xref\n0 %d\n" % self.next_id, b"0000000000 65535 f \n"]
+        for object_id in range(1, self.next_id):
+            xref.append(b"%010d 00000 n \n" % self.object_offsets[object_id])
+        trailer = b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+            self.next_id, self.CATALOG, xref_offset
+        )
+        return data + b"".join(xref) + trailer
+
+def _pdf_line(row: Sequence) -> str:
+    content_id, recorded_at, platform, country, *counts, revenue = row
+    return "%-10s %-19s %-12s %-7s %12s %10s %10s %10s %14s %12.2f" % (
+        content_id, recorded_at.isoformat(sep=" ", timespec="seconds"), platform or "-",
+        country or "-", *counts, revenue
+    )
+
+def iter_pdf(rows: Iterable[Sequence], title: str) -> Iterator[bytes]:
+    pdf = _PdfWriter()
+    yield pdf.start()
+
+    header = [title, "", "%-10s %-19s %-12s %-7s %12s %10s %10s %10s %14s %12s" % tuple(EXPORT_COLUMNS), ""]
+    lines = list(header)
+
+    for row in rows:
+        lines.append(_pdf_line(row))
+        if len(lines) >= pdf.LINES_PER_PAGE:
+            yield pdf.page(lines)
+            lines = []
+
+    if lines or not pdf.page_ids:
+        yield pdf.page(lines)
+
+    yield pdf.finish()
+
+def stream_report_export(
+    report_id: int,
+    export_format: str,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None
+) -> Iterator[bytes]:
+    """Produce an export with its own session, so it outlives the request's
+    dependency-managed session while the response streams.
+
+    ``start`` and ``end`` replace the report's saved window when given.
+    """
+    from database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        report = db.get(Report, report_id)
+        parameters = dict(report.parameters or {})
+        for key, bound in (("start", start), ("end", end)):
+            if bound is not None:
+                parameters[key] = bound.isoformat()
+        rows = iter_report_rows(db, report, parameters)
+
+        if export_format == "csv":
+            yield from iter_csv(rows)
+        elif export_format == "ndjson":
+            yield from iter_ndjson(rows)
+        else:
+            yield from iter_pdf(rows, f"{report.name} (report {report.id})")
+    finally:
+        db.close()
@@ -0,0 +1,224 @@
+import logging
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Callable, Iterator, Optional, Set
+from sqlalchemy import select, update, func
+from sqlalchemy.orm import Session, aliased, sessionmaker
+from core.config import settings
+from models.report import Report, ReportStatus
+from services.agency_stats_service import AgencyStatsService
+from services.report_cache_service import ReportCacheService
+from services.report_partial_service import ReportPartialService
+from services.report_service import report_content_ids
+
+logger = logging.getLogger(__name__)
+
+# Progress is written back at most this often (as a fraction of the job)
+PROGRESS_STEP = 0.05
+
+class ReportJobService:
+    """Claims queued reports and runs them through the report engine.
+
+    Used by the worker processes in scripts/report_worker.py. Claims use
+    SELECT ... FOR UPDATE SKIP LOCKED on PostgreSQL so workers never wait
+    on each other, and respect REPORT_MAX_RUNNING_PER_AGENCY so one agency
+    can't occupy every worker.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.is_postgres = db.get_bind().dialect.name == "postgresql"
+
+    def run_once(self) -> bool:
+        """Claim and run one job; False when there was nothing to claim"""
+        report = self.claim_next()
+        if report is None:
+            return False
+
+        self.run(report)
+        return True
+
+    def claim_next(self) -> Optional[Report]:
+        """Mark the oldest runnable queued report as running and return it"""
+        skipped_agencies: Set[int] = set()
+
+        # A claim only fails when another worker took the agency's last slot
+        # in the meantime; retry with the next agency a few times
+        for _ in range(5):
+            query = (
+                select(Report.id, Report.agency_id)
+                .where(
+                    Report.status == ReportStatus.QUEUED,
+                    self._running_count(Report.agency_id) < settings.REPORT_MAX_RUNNING_PER_AGENCY
+                )
+                .order_by(Report.created_at, Report.id)
+                .limit(1)
+                .with_for_update(skip_locked=True, of=Report)
+            )
+            if skipped_agencies:
+                query = query.where(Report.agency_id.not_in(skipped_agencies))
+
+            candidate = self.db.execute(query).first()
+            if candidate is None:
+                self.db.rollback()
+                return None
+
+            if self.is_postgres:
+                # Serialize claims per agency so the running count below is exact
+                self.db.execute(select(func.pg_advisory_xact_lock(candidate.agency_id)))
+
+            claimed = self.db.execute(
+                update(Report)
+                .where(
+                    Report.id == candidate.id,
+                    Report.status == ReportStatus.QUEUED,
+                    self._running_count(candidate.agency_id) < settings.REPORT_MAX_RUNNING_PER_AGENCY
+                )
+                .values(
+                    status=ReportStatus.RUNNING,
+                    progress=0.0,
+                    started_at=datetime.utcnow(),
+                    heartbeat_at=datetime.utcnow(),
+                    finished_at=None,
+                    attempts=Report.attempts + 1,
+                    error=None
+                )
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            self.db.commit()
+
+            if claimed:
+                return self.db.get(Report, candidate.id)
+
+            skipped_agencies.add(candidate.agency_id)
+
+        return None
+
+    def run(self, report: Report) -> None:
+        """Compute a claimed report and record the outcome"""
+        content_ids = report_content_ids(report)
+        parameters = report.parameters or {}
+
+        try:
+            # Keyed on the data versions seen before computing, so rows that
+            # arrive mid-run produce a different key rather than a stale hit
+            cache = ReportCacheService(self.db)
+            cache_key = cache.build_key(content_ids, parameters)
+            with self._heartbeat(report.id):
+                results = ReportPartialService(self.db).compute(
+                    report,
+                    content_ids,
+                    progress=self._progress_writer(report.id)
+                )
+            cache.put(cache_key, results)
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Report {report.id} failed: {str(e)}")
+            self._finish(report, status=ReportStatus.FAILED, error=str(e))
+            return
+
+        now = datetime.utcnow()
+        self._finish(report, status=ReportStatus.DONE, progress=1.0, results=results, computed_at=now)
+
+    def requeue_stale(self) -> int:
+        """Requeue running jobs whose worker died, judged by a missed heartbeat
+        rather than run time; give up after REPORT_MAX_ATTEMPTS"""
+        cutoff = datetime.utcnow() - timedelta(seconds=settings.REPORT_JOB_TIMEOUT_SECONDS)
+        stale = (Report.status == ReportStatus.RUNNING) & (
+            func.coalesce(Report.heartbeat_at, Report.started_at) < cutoff
+        )
+
+        failed_agencies = self.db.execute(
+            update(Report)
+            .where(stale, Report.attempts >= settings.REPORT_MAX_ATTEMPTS)
+            .values(status=ReportStatus.FAILED, finished_at=datetime.utcnow(), error="Report job timed out")
+            .returning(Report.agency_id)
+            .execution_options(synchronize_session=False)
+        ).scalars().all()
+        AgencyStatsService(self.db).apply_many({
+            agency_id: {"pending_report_count": -failed_agencies.count(agency_id)}
+            for agency_id in set(failed_agencies)
+        })
+        failed = len(failed_agencies)
+        requeued = self.db.execute(
+            update(Report)
+            .where(stale)
+            .values(status=ReportStatus.QUEUED, started_at=None, heartbeat_at=None, progress=0.0)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        self.db.commit()
+
+        if failed or requeued:
+            logger.warning(f"Stale report jobs: {requeued} requeued, {failed} failed")
+        return requeued
+
+    def _running_count(self, agency_id):
+        running = aliased(Report)
+        return (
+            select(func.count(running.id))
+            .where(running.agency_id == agency_id, running.status == ReportStatus.RUNNING)
+            .scalar_subquery()
+        )
+
+    def _progress_writer(self, report_id: int) -> Callable[[float], None]:
+        """Writes progress back in PROGRESS_STEP increments"""
+        last = [0.0]
+
+        def write(progress: float) -> None:
+            if progress < 1.0 and progress - last[0] < PROGRESS_STEP:
+                return
+            last[0] = progress
+            self.db.execute(
+                update(Report)
+                .where(Report.id == report_id)
+                .values(progress=progress, heartbeat_at=datetime.utcnow())
+                .execution_options(synchronize_session=False)
+            )
+            self.db.commit()
+
+        return write
+
+    @contextmanager
+    def _heartbeat(self, report_id: int) -> Iterator[None]:
+        """Refresh heartbeat_at every REPORT_JOB_HEARTBEAT_SECONDS from a
+        background thread while the job computes, so requeue_stale leaves a
+        healthy job alone however long a single content item takes"""
+        stop = threading.Event()
+        Session = sessionmaker(bind=self.db.get_bind())
+
+        def beat() -> None:
+            while not stop.wait(settings.REPORT_JOB_HEARTBEAT_SECONDS):
+                db = Session()
+                try:
+                    db.execute(
+                        update(Report)
+                        .where(Report.id == report_id, Report.status == ReportStatus.RUNNING)
+                        .values(heartbeat_at=datetime.utcnow())
+                        .execution_options(synchronize_session=False)
+                    )
+                    db.commit()
+                except Exception as e:
+                    # A missed beat is retried next interval; the job itself carries on
+                    logger.warning(f"Heartbeat for report {report_id} failed: {str(e)}")
+                finally:
+                    db.close()
+
+        thread = threading.Thread(target=beat, name=f"report-heartbeat-{report_id}", daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join()
+
+    def _finish(self, report: Report, **values) -> None:
+        finished = self.db.execute(
+            update(Report)
+            .where(Report.id == report.id, Report.status == ReportStatus.RUNNING)
+            .values(finished_at=datetime.utcnow(), **values)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        if finished:
+            AgencyStatsService(self.db).apply(report.agency_id, pending_report_count=-1)
+        self.db.commit()
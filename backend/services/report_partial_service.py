@@ -0,0 +1,117 @@
+import hashlib
+import json
+from datetime import datetime
+from typing import Callable, List, Optional, Dict, Any
+import pandas as pd
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from core.utils import dialect_insert
+from models.content import Content
+from models.report import Report
+from models.report_partial import ReportPartial
+from services.report_engine import (
+    load_metrics, aggregate, merge_partials, finalize, partial_to_json, partial_from_json, window_bounds
+)
+
+# Parameters that shape a per-content partial; content_ids only decides which partials exist
+PARTIAL_PARAMETERS = ("start", "end", "granularity", "group_by")
+
+class ReportPartialService:
+    """Incremental report computation from stored per-content partial aggregates.
+
+    Each content item's partial is kept with the content's data_version and
+    a hash of the parameters it was computed with. A refresh only reloads
+    and re-aggregates content whose data changed; the rest are read back
+    and merged.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def compute(
+        self,
+        report: Report,
+        content_ids: List[int],
+        progress: Optional[Callable[[float], None]] = None
+    ) -> Dict[str, Any]:
+        parameters = report.parameters or {}
+        parameters_hash = self._parameters_hash(parameters)
+        start, end = window_bounds(parameters)
+
+        versions = dict(
+            self.db.execute(
+                select(Content.id, Content.data_version).where(Content.id.in_(content_ids))
+            ).all()
+        )
+        stored = {
+            partial.content_id: partial
+            for partial in self.db.execute(
+                select(ReportPartial).where(ReportPartial.report_id == report.id)
+            ).scalars()
+        }
+
+        partials = []
+        row_count = 0
+        recomputed = 0
+        for done, content_id in enumerate(content_ids, start=1):
+            cached = stored.get(content_id)
+            if (
+                cached is not None
+                and cached.data_version == versions.get(content_id)
+                and cached.parameters_hash == parameters_hash
+            ):
+                partials.append(partial_from_json(cached.partial))
+                row_count += cached.row_count
+            else:
+                frame = load_metrics(self.db, [content_id], start, end)
+                partial = aggregate(frame, parameters.get("granularity", "day"), parameters.get("group_by"))
+                self._store(report.id, content_id, versions.get(content_id, 0), parameters_hash, len(frame), partial)
+                partials.append(partial)
+                row_count += len(frame)
+                recomputed += 1
+
+            if progress:
+                progress(done / len(content_ids))
+
+        # Partials of content no longer in the report would never be read again
+        dropped = [content_id for content_id in stored if content_id not in set(content_ids)]
+        if dropped:
+            self.db.query(ReportPartial).filter(
+                ReportPartial.report_id == report.id,
+                ReportPartial.content_id.in_(dropped)
+            ).delete(synchronize_session=False)
+
+        return {
+            **finalize(merge_partials(partials)),
+            "row_count": row_count,
+            "recomputed_partials": recomputed,
+            "reused_partials": len(content_ids) - recomputed,
+        }
+
+    def _store(
+        self,
+        report_id: int,
+        content_id: int,
+        data_version: int,
+        parameters_hash: str,
+        row_count: int,
+        partial: pd.DataFrame
+    ) -> None:
+        values = {
+            "data_version": data_version,
+            "parameters_hash": parameters_hash,
+            "row_count": row_count,
+            "partial": partial_to_json(partial),
+            "computed_at": datetime.utcnow(),
+        }
+        insert = dialect_insert(self.db)
+        self.db.execute(
+            insert(ReportPartial)
+            .values(report_id=report_id, content_id=content_id, **values)
+            .on_conflict_do_update(index_elements=["report_id", "content_id"], set_=values)
+        )
+
+    @staticmethod
+    def _parameters_hash(parameters: Dict[str, Any]) -> str:
+        shaping = {key: parameters.get(key) for key in PARTIAL_PARAMETERS}
+        return hashlib.sha256(json.dumps(shaping, sort_keys=True).encode()).hexdigest()
@@ -0,0 +1,255 @@
+import logging
+import random
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import List, Tuple, Dict, Any
+from dateutil.relativedelta import relativedelta
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.orm import Session
+from fastapi import HTTPException, status
+from core.config import settings
+from models.report import Report
+from models.report_schedule import ReportSchedule, ReportFrequency
+from models.user import User
+from schemas.report import ReportScheduleCreate
+from services.base import BaseService
+from services.agency_stats_service import AgencyStatsService
+from services.report_engine import load_metrics, compute_from_frame
+from services.report_service import report_content_ids
+
+logger = logging.getLogger(__name__)
+
+def period_start(frequency: ReportFrequency, moment: datetime) -> datetime:
+    """Start of the week (Monday) or month containing ``moment``"""
+    day = moment.replace(hour=0, minute=0, second=0, microsecond=0)
+    if frequency == ReportFrequency.WEEKLY:
+        return day - timedelta(days=day.weekday())
+    return day.replace(day=1)
+
+def period_length(frequency: ReportFrequency) -> relativedelta:
+    return relativedelta(weeks=1) if frequency == ReportFrequency.WEEKLY else relativedelta(months=1)
+
+def next_run_after(frequency: ReportFrequency, moment: datetime) -> datetime:
+    """First period boundary after ``moment``, plus jitter so schedules
+    created or caught up together don't all fire in the same tick"""
+    boundary = period_start(frequency, moment) + period_length(frequency)
+    return boundary + timedelta(seconds=random.uniform(0, settings.REPORT_SCHEDULE_JITTER_SECONDS))
+
+class ReportScheduleService(BaseService[ReportSchedule, ReportScheduleCreate, None]):
+    def __init__(self, db: Session):
+        super().__init__(ReportSchedule, db)
+
+    def set_schedule(self, report: Report, schedule_data: ReportScheduleCreate) -> ReportSchedule:
+        """Create or replace the schedule of a report"""
+        frequency = ReportFrequency[schedule_data.frequency.name]
+        schedule = self.db.query(ReportSchedule).filter(ReportSchedule.report_id == report.id).first()
+
+        if schedule is None:
+            schedule = ReportSchedule(report_id=report.id)
+            self.db.add(schedule)
+            AgencyStatsService(self.db).apply(report.agency_id, scheduled_report_count=1)
+
+        schedule.frequency = frequency
+        schedule.recipient_email = schedule_data.recipient_email
+        schedule.is_active = True
+        schedule.next_run_at = next_run_after(frequency, datetime.utcnow())
+
+        self.db.commit()
+        self.db.refresh(schedule)
+
+        return schedule
+
+    def get_report_schedule(self, report_id: int) -> ReportSchedule:
+        schedule = self.db.query(ReportSchedule).filter(ReportSchedule.report_id == report_id).first()
+        if schedule is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Report has no schedule"
+            )
+        return schedule
+
+    def delete_schedule(self, report: Report) -> None:
+        schedule = self.get_report_schedule(report.id)
+        self.db.delete(schedule)
+        AgencyStatsService(self.db).apply(report.agency_id, scheduled_report_count=-1)
+        self.db.commit()
+
+    def claim_due(self, now: datetime) -> List[Dict[str, Any]]:
+        """Take up to REPORT_SCHEDULE_BATCH_SIZE due schedules and advance them.
+
+        Each due schedule runs once for its most recently completed period,
+        however many ticks were missed, and moves to the next boundary after
+        ``now``. Overdue schedules beyond the batch size wait for later ticks,
+        so catching up after downtime is spread out rather than a burst.
+
+        The claimed period stays pending on the schedule until
+        run_schedule_group has stored and sent it. A period still pending
+        REPORT_SCHEDULE_RETRY_SECONDS after its claim (the run crashed or the
+        email failed) is claimed again, before any newer period.
+        """
+        retry_before = now - timedelta(seconds=settings.REPORT_SCHEDULE_RETRY_SECONDS)
+        due = self.db.execute(
+            select(
+                ReportSchedule.id,
+                ReportSchedule.report_id,
+                ReportSchedule.frequency,
+                ReportSchedule.pending_period_start,
+                ReportSchedule.pending_period_end
+            )
+            .where(
+                ReportSchedule.is_active.is_(True),
+                or_(
+                    and_(ReportSchedule.pending_period_start.is_(None), ReportSchedule.next_run_at <= now),
+                    and_(ReportSchedule.pending_period_start.isnot(None), ReportSchedule.last_run_at <= retry_before)
+                )
+            )
+            .order_by(ReportSchedule.next_run_at)
+            .limit(settings.REPORT_SCHEDULE_BATCH_SIZE)
+            .with_for_update(skip_locked=True)
+        ).all()
+
+        runs = []
+        for schedule_id, report_id, frequency, pending_start, pending_end in due:
+            values = {"last_run_at": now}
+            if pending_start is not None:
+                # Retry the unfinished period; the next one waits until it is done
+                start, end = pending_start, pending_end
+            else:
+                end = period_start(frequency, now)
+                start = end - period_length(frequency)
+                values.update(
+                    next_run_at=next_run_after(frequency, now),
+                    pending_period_start=start,
+                    pending_period_end=end
+                )
+
+            runs.append({
+                "schedule_id": schedule_id,
+                "report_id": report_id,
+                "start": start.isoformat(),
+                "end": end.isoformat(),
+            })
+            self.db.execute(
+                update(ReportSchedule)
+                .where(ReportSchedule.id == schedule_id)
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+
+        self.db.commit()
+        return runs
+
+    def group_runs(self, runs: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """Group claimed runs by (agency, content) so each group loads its data once"""
+        if not runs:
+            return []
+
+        owners = dict(
+            (report_id, (agency_id, content_id))
+            for report_id, agency_id, content_id in self.db.execute(
+                select(Report.id, Report.agency_id, Report.content_id)
+                .where(Report.id.in_([run["report_id"] for run in runs]))
+            )
+        )
+
+        groups: Dict[Tuple[int, int], List[Dict[str, Any]]] = defaultdict(list)
+        for run in runs:
+            if run["report_id"] in owners:
+                groups[owners[run["report_id"]]].append(run)
+
+        return list(groups.values())
+
+def run_schedule_group(runs: List[Dict[str, Any]]) -> int:
+    """Generate one group of scheduled reports (process-pool entry point).
+
+    The metric rows for every content in the group are loaded once over the
+    union of the runs' windows; each report is then computed from that frame.
+    Results land on the schedule, so the report's saved window and results
+    are left as the user set them. A run's period stops being pending once
+    its results are stored and emailed; a computation error is recorded as
+    the period's outcome, since retrying the same data would fail again.
+    """
+    from database import SessionLocal
+    from services.email_service import email_service
+
+    db = SessionLocal()
+    completed = 0
+    try:
+        reports = {
+            report.id: report
+            for report in db.query(Report).filter(Report.id.in_([run["report_id"] for run in runs]))
+        }
+        schedules = {
+            schedule.id: schedule
+            for schedule in db.query(ReportSchedule).filter(
+                ReportSchedule.id.in_([run["schedule_id"] for run in runs])
+            )
+        }
+        content_ids = sorted({
+            content_id for report in reports.values() for content_id in report_content_ids(report)
+        })
+        frame = load_metrics(
+            db,
+            content_ids,
+            datetime.fromisoformat(min(run["start"] for run in runs)),
+            datetime.fromisoformat(max(run["end"] for run in runs))
+        )
+
+        for run in runs:
+            report = reports.get(run["report_id"])
+            schedule = schedules.get(run["schedule_id"])
+            if report is None or schedule is None:
+                continue
+
+            parameters = {**(report.parameters or {}), "start": run["start"], "end": run["end"]}
+            schedule.last_period_start = datetime.fromisoformat(run["start"])
+            schedule.last_period_end = datetime.fromisoformat(run["end"])
+            try:
+                results = compute_from_frame(frame, report_content_ids(report), parameters)
+            except Exception as e:
+                logger.error(f"Scheduled report {report.id} failed: {str(e)}")
+                schedule.last_results = None
+                schedule.last_error = str(e)
+                _finish_period(schedule, run)
+                db.commit()
+                continue
+
+            schedule.last_results = results
+            schedule.last_error = None
+            db.commit()
+            completed += 1
+
+            if settings.SMTP_HOST and not _email_report(db, email_service, report, schedule):
+                logger.warning(f"Scheduled report {report.id} was not sent; its period will be retried")
+                continue
+
+            _finish_period(schedule, run)
+            db.commit()
+
+        return completed
+    finally:
+        db.close()
+
+def _finish_period(schedule: ReportSchedule, run: Dict[str, Any]) -> None:
+    """Clear the schedule's pending period if it is still the one this run claimed"""
+    if schedule.pending_period_start == datetime.fromisoformat(run["start"]):
+        schedule.pending_period_start = None
+        schedule.pending_period_end = None
+
+def _email_report(db: Session, email_service, report: Report, schedule: ReportSchedule) -> bool:
+    recipient = schedule.recipient_email
+    if not recipient:
+        recipient = db.query(User.email).filter(User.id == report.agency_id).scalar()
+
+    start, end = schedule.last_period_start.isoformat(), schedule.last_period_end.isoformat()
+    totals = schedule.last_results["totals"]
+    body = "\n".join([
+        f"{report.name}: {start[:10]} to {end[:10]}",
+        "",
+        f"Views: {totals['views']:,.0f}",
+        f"Engagement: {totals['engagement']:,.0f} ({totals['engagement_rate']:.2%})",
+        f"Revenue: {totals['revenue']:,.2f}",
+        "",
+        f"Full data: /api/v1/reports/{report.id}/export?format=csv&start={start}&end={end}",
+    ])
+    return email_service.send_email(recipient, f"Scheduled report: {report.name}", body)
@@ -1,11 +1,39 @@
+import base64
+import json
+from datetime import datetime
 from typing import List, Optional, Dict, Any
+from sqlalchemy import func, select, tuple_
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
-from models.report import Report
-from models.user import UserRole
+from models.report import Report, ReportStatus
+from models.report_partial import ReportPartial
+from models.report_schedule import ReportSchedule
+from models.user import User, UserRole
 from models.content import Content
 from schemas.report import ReportCreate
 from services.base import BaseService
+from services.report_cache_service import ReportCacheService
+from services.agency_stats_service import AgencyStatsService, PENDING_STATUSES
+from core.responses import make_row_etag
+from core.utils import load_fields
+
+def encode_report_cursor(report: Report) -> str:
+    payload = json.dumps([report.created_at.isoformat(), report.id]).encode()
+    return base64.urlsafe_b64encode(payload).decode()
+
+def decode_report_cursor(cursor: str) -> tuple:
+    try:
+        created_at, id_ = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(created_at), int(id_)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+def report_etag(report_id: int, updated_at, agency_updated_at, content_updated_at) -> str:
+    """ETag of GET /reports/{id}, which embeds the agency and content"""
+    return make_row_etag("report", report_id, updated_at, agency_updated_at, content_updated_at)
 
 class ReportService(BaseService[Report, ReportCreate, None]):
     def __init__(self, db: Session):
@@ -21,8 +49,9 @@ class ReportService(BaseService[Report, ReportCreate, None]):
             )
 
         # Verify content exists
-        content = self.db.query(Content).filter(Content.id == report_data.content_id).first()
-        if not content:
+        content_ids = list(dict.fromkeys([report_data.content_id, *report_data.parameters.content_ids]))
+        found = self.db.query(func.count(Content.id)).filter(Content.id.in_(content_ids)).scalar()
+        if found != len(content_ids):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Content not found"
@@ -31,24 +60,152 @@ class ReportService(BaseService[Report, ReportCreate, None]):
         db_report = Report(
             name=report_data.name,
             agency_id=agency_id,
-            content_id=report_data.content_id
+            content_id=report_data.content_id,
+            parameters=report_data.parameters.model_dump(mode="json")
         )
 
+        # Served from the result cache when possible, otherwise computed by
+        # the report workers (services/report_job_service.py)
+        stats_service = AgencyStatsService(self.db)
         self.db.add(db_report)
+        cached = not report_data.refresh and self._load_cached_results(db_report)
+        stats_service.apply(
+            agency_id,
+            report_count=1,
+            content_count=stats_service.track_content_reports(agency_id, report_data.content_id, 1),
+            pending_report_count=int(not cached),
+            last_report_at=datetime.utcnow()
+        )
         self.db.commit()
         self.db.refresh(db_report)
 
         return db_report
 
-    def get_agency_reports(self, agency_id: int, page: int = 1, per_page: int = 10) -> Dict[str, Any]:
-        """Get all reports by a specific agency"""
+    def refresh_report(self, report_id: int, user_id: int, user_role: UserRole, force: bool = False) -> Report:
+        """Recompute a report; ``force`` skips the result cache"""
+        report = self.get_report_for_user(report_id, user_id, user_role)
+
+        if report.status in (ReportStatus.QUEUED, ReportStatus.RUNNING):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Report is already being computed"
+            )
+
+        if force or not self._load_cached_results(report):
+            report.status = ReportStatus.QUEUED
+            report.progress = 0.0
+            report.attempts = 0
+            report.started_at = None
+            report.finished_at = None
+            report.error = None
+            AgencyStatsService(self.db).apply(report.agency_id, pending_report_count=1)
+
+        self.db.commit()
+        self.db.refresh(report)
+
+        return report
+
+    def _load_cached_results(self, report: Report) -> bool:
+        """Complete the report from the result cache; False on a miss"""
+        cache = ReportCacheService(self.db)
+        cache_key = cache.build_key(report_content_ids(report), report.parameters or {})
+        results = cache.get(cache_key)
+        if results is None:
+            return False
+
+        now = datetime.utcnow()
+        report.results = results
+        report.computed_at = now
+        report.status = ReportStatus.DONE
+        report.progress = 1.0
+        report.started_at = now
+        report.finished_at = now
+        report.error = None
+        return True
+
+    def get_report_for_user(self, report_id: int, user_id: int, user_role: UserRole) -> Report:
+        """Get a report the user may view (agency can view own, admin can view any)"""
+        report = self.get_or_404(report_id)
+
+        if user_role != UserRole.ADMIN and report.agency_id != user_id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Not authorized to view this report"
+            )
+
+        return report
+
+    def get_report_status(self, report_id: int, user_id: int, user_role: UserRole) -> Dict[str, Any]:
+        """Job state of a report, read without loading its results"""
+        row = self.db.query(
+            Report.id,
+            Report.agency_id,
+            Report.status,
+            Report.progress,
+            Report.attempts,
+            Report.error,
+            Report.created_at,
+            Report.started_at,
+            Report.finished_at
+        ).filter(Report.id == report_id).first()
+
+        if not row:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Report not found"
+            )
+
+        if user_role != UserRole.ADMIN and row.agency_id != user_id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Not authorized to view this report"
+            )
+
+        job = row._asdict()
+        end = row.finished_at or datetime.utcnow()
+        job["queued_seconds"] = ((row.started_at or end) - row.created_at).total_seconds()
+        job["run_seconds"] = (end - row.started_at).total_seconds() if row.started_at else None
+
+        return job
+
+    def get_agency_reports(
+        self, agency_id: int, page: int = 1, per_page: int = 10, fields: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Get all reports by a specific agency, loading only ``fields`` when given"""
         query = self.db.query(Report).filter(Report.agency_id == agency_id)
-        return self.paginate_query(query, page, per_page)
+        return self.paginate_query(load_fields(query, Report, fields), page, per_page)
 
-    def get_all_reports(self, page: int = 1, per_page: int = 10) -> Dict[str, Any]:
-        """Get all reports (admin only)"""
+    def get_all_reports(self, page: int = 1, per_page: int = 10, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Get all reports (admin only), loading only ``fields`` when given"""
         query = self.db.query(Report)
-        return self.paginate_query(query, page, per_page)
+        return self.paginate_query(load_fields(query, Report, fields), page, per_page)
+
+    def get_report_etag(self, report_id: int, user_id: int, user_role: UserRole) -> str:
+        """ETag of a report the user may view, from version columns alone"""
+        row = self.db.execute(
+            select(
+                Report.agency_id,
+                Report.updated_at,
+                User.updated_at.label("agency_updated_at"),
+                Content.updated_at.label("content_updated_at")
+            )
+            .join(User, User.id == Report.agency_id)
+            .join(Content, Content.id == Report.content_id)
+            .where(Report.id == report_id)
+        ).first()
+
+        if row is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Report not found"
+            )
+        if user_role != UserRole.ADMIN and row.agency_id != user_id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Not authorized to view this report"
+            )
+
+        return report_etag(report_id, row.updated_at, row.agency_updated_at, row.content_updated_at)
 
     def get_report_with_relations(self, report_id: int) -> Optional[Report]:
         """Get report with agency and content information"""
@@ -65,13 +222,55 @@ class ReportService(BaseService[Report, ReportCreate, None]):
                 detail="Not authorized to delete this report"
             )
 
+        unscheduled = self.db.query(ReportSchedule).filter(
+            ReportSchedule.report_id == report.id
+        ).delete(synchronize_session=False)
+        self.db.query(ReportPartial).filter(
+            ReportPartial.report_id == report.id
+        ).delete(synchronize_session=False)
+
+        stats_service = AgencyStatsService(self.db)
+        stats_service.apply(
+            report.agency_id,
+            report_count=-1,
+            content_count=stats_service.track_content_reports(report.agency_id, report.content_id, -1),
+            pending_report_count=-int(report.status in PENDING_STATUSES),
+            scheduled_report_count=-unscheduled
+        )
+
         self.db.delete(report)
         self.db.commit()
         return report
 
-    def get_reports_by_content(self, content_id: int) -> List[Report]:
-        """Get all reports for a specific content"""
-        return self.db.query(Report).filter(Report.content_id == content_id).all()
+    def get_reports_by_content(
+        self,
+        content_id: int,
+        user_id: int,
+        user_role: UserRole,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Reports on a content visible to the user, newest first, with keyset
+        pagination on (created_at, id) served by ix_reports_content_id_created_at_id"""
+        # created_at is needed for the next cursor even when not returned
+        query = load_fields(select(Report), Report, fields, always=("created_at",))
+        query = query.where(Report.content_id == content_id)
+        if user_role != UserRole.ADMIN:
+            query = query.where(Report.agency_id == user_id)
+        if cursor:
+            created_at, report_id = decode_report_cursor(cursor)
+            query = query.where(tuple_(Report.created_at, Report.id) < tuple_(created_at, report_id))
+
+        reports = self.db.execute(
+            query.order_by(Report.created_at.desc(), Report.id.desc()).limit(limit + 1)
+        ).scalars().all()
+        next_cursor = encode_report_cursor(reports[limit - 1]) if len(reports) > limit else None
+
+        return {
+            "items": reports[:limit],
+            "next_cursor": next_cursor
+        }
 
     def paginate_query(self, query, page: int, per_page: int) -> Dict[str, Any]:
         """Paginate query results"""
@@ -85,3 +284,8 @@ class ReportService(BaseService[Report, ReportCreate, None]):
             "per_page": per_page,
             "pages": (total + per_page - 1) // per_page if total > 0 else 0
         }
+
+def report_content_ids(report: Report) -> List[int]:
+    """Every content id a report aggregates, its own content first"""
+    extra = (report.parameters or {}).get("content_ids", [])
+    return list(dict.fromkeys([report.content_id, *extra]))
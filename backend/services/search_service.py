@@ -0,0 +1,165 @@
+import base64
+import json
+from typing import List, Optional, Dict, Any
+from sqlalchemy import text, inspect
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from fastapi import HTTPException, status
+from models.user import UserRole
+
+# Local (SQLite) runs index titles and names in external-content FTS5 tables
+# kept in sync by triggers; PostgreSQL uses generated tsvector columns instead.
+SQLITE_FTS_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS contents_fts USING fts5(title, content='contents', content_rowid='id')",
+    "CREATE TRIGGER IF NOT EXISTS contents_fts_ai AFTER INSERT ON contents BEGIN "
+    "INSERT INTO contents_fts(rowid, title) VALUES (new.id, new.title); END",
+    "CREATE TRIGGER IF NOT EXISTS contents_fts_ad AFTER DELETE ON contents BEGIN "
+    "INSERT INTO contents_fts(contents_fts, rowid, title) VALUES ('delete', old.id, old.title); END",
+    "CREATE TRIGGER IF NOT EXISTS contents_fts_au AFTER UPDATE OF title ON contents BEGIN "
+    "INSERT INTO contents_fts(contents_fts, rowid, title) VALUES ('delete', old.id, old.title); "
+    "INSERT INTO contents_fts(rowid, title) VALUES (new.id, new.title); END",
+    "CREATE VIRTUAL TABLE IF NOT EXISTS reports_fts USING fts5(name, content='reports', content_rowid='id')",
+    "CREATE TRIGGER IF NOT EXISTS reports_fts_ai AFTER INSERT ON reports BEGIN "
+    "INSERT INTO reports_fts(rowid, name) VALUES (new.id, new.name); END",
+    "CREATE TRIGGER IF NOT EXISTS reports_fts_ad AFTER DELETE ON reports BEGIN "
+    "INSERT INTO reports_fts(reports_fts, rowid, name) VALUES ('delete', old.id, old.name); END",
+    "CREATE TRIGGER IF NOT EXISTS reports_fts_au AFTER UPDATE OF name ON reports BEGIN "
+    "INSERT INTO reports_fts(reports_fts, rowid, name) VALUES ('delete', old.id, old.name); "
+    "INSERT INTO reports_fts(rowid, name) VALUES (new.id, new.name); END",
+    "INSERT INTO contents_fts(contents_fts) VALUES ('rebuild')",
+    "INSERT INTO reports_fts(reports_fts) VALUES ('rebuild')",
+]
+
+# Same as migration 94595dffd8a2, for databases built with metadata.create_all
+POSTGRES_SEARCH_DDL = [
+    "ALTER TABLE contents ADD COLUMN IF NOT EXISTS search_vector tsvector "
+    "GENERATED ALWAYS AS (to_tsvector('simple', coalesce(title, ''))) STORED",
+    "ALTER TABLE reports ADD COLUMN IF NOT EXISTS search_vector tsvector "
+    "GENERATED ALWAYS AS (to_tsvector('simple', coalesce(name, ''))) STORED",
+    "CREATE INDEX IF NOT EXISTS ix_contents_search_vector ON contents USING gin (search_vector)",
+    "CREATE INDEX IF NOT EXISTS ix_reports_search_vector ON reports USING gin (search_vector)",
+]
+
+POSTGRES_SEARCH_SQL = """
+    WITH q AS (SELECT websearch_to_tsquery('simple', :query) AS query)
+    SELECT 'content' AS kind, c.id AS id, c.title AS label,
+           ts_rank(c.search_vector, q.query) AS rank
+    FROM contents c, q
+    WHERE :search_content AND c.search_vector @@ q.query
+      AND (:is_admin OR c.creator_id = :user_id)
+    UNION ALL
+    SELECT 'report' AS kind, r.id AS id, r.name AS label,
+           ts_rank(r.search_vector, q.query) AS rank
+    FROM reports r, q
+    WHERE :search_reports AND r.search_vector @@ q.query
+      AND (:is_admin OR r.agency_id = :user_id)
+"""
+
+# bm25() is lower-is-better, so it is negated to share the DESC ordering
+SQLITE_SEARCH_SQL = """
+    SELECT 'content' AS kind, c.id AS id, c.title AS label,
+           -bm25(contents_fts) AS rank
+    FROM contents_fts JOIN contents c ON c.id = contents_fts.rowid
+    WHERE :search_content AND contents_fts MATCH :query
+      AND (:is_admin OR c.creator_id = :user_id)
+    UNION ALL
+    SELECT 'report' AS kind, r.id AS id, r.name AS label,
+           -bm25(reports_fts) AS rank
+    FROM reports_fts JOIN reports r ON r.id = reports_fts.rowid
+    WHERE :search_reports AND reports_fts MATCH :query
+      AND (:is_admin OR r.agency_id = :user_id)
+"""
+
+def ensure_search_index(engine: Engine) -> None:
+    """Create what search queries need when the schema came from
+    metadata.create_all: tsvector columns on PostgreSQL, FTS5 tables on SQLite"""
+    if engine.dialect.name not in ("postgresql", "sqlite"):
+        return
+
+    inspector = inspect(engine)
+    if not (inspector.has_table("contents") and inspector.has_table("reports")):
+        return
+
+    if engine.dialect.name == "postgresql":
+        if all(
+            "search_vector" in {column["name"] for column in inspector.get_columns(table)}
+            for table in ("contents", "reports")
+        ):
+            return
+        statements = POSTGRES_SEARCH_DDL
+    else:
+        if inspector.has_table("contents_fts"):
+            return
+        statements = SQLITE_FTS_DDL
+
+    with engine.begin() as connection:
+        for statement in statements:
+            connection.execute(text(statement))
+
+def encode_cursor(row: Dict[str, Any]) -> str:
+    payload = json.dumps([row["rank"], row["kind"], row["id"]]).encode()
+    return base64.urlsafe_b64encode(payload).decode()
+
+def decode_cursor(cursor: str) -> tuple:
+    try:
+        rank, kind, id_ = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return float(rank), str(kind), int(id_)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+class SearchService:
+    """Ranked full-text search over content titles and report names"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def search(
+        self,
+        query: str,
+        user_id: int,
+        user_role: UserRole,
+        kind: Optional[str] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Search with role-based visibility and keyset pagination on (rank, kind, id)"""
+        is_postgres = self.db.get_bind().dialect.name == "postgresql"
+
+        params = {
+            "query": query if is_postgres else self._fts5_query(query),
+            "user_id": user_id,
+            "is_admin": user_role == UserRole.ADMIN,
+            "search_content": kind in (None, "content"),
+            "search_reports": kind in (None, "report"),
+            "limit": limit + 1,
+        }
+
+        keyset = ""
+        if cursor:
+            params["rank"], params["kind"], params["id"] = decode_cursor(cursor)
+            keyset = """
+                WHERE rank < :rank
+                   OR (rank = :rank AND (kind > :kind OR (kind = :kind AND id > :id)))
+            """
+
+        sql = f"""
+            SELECT kind, id, label, rank
+            FROM ({POSTGRES_SEARCH_SQL if is_postgres else SQLITE_SEARCH_SQL}) AS matches
+            {keyset}
+            ORDER BY rank DESC, kind, id
+            LIMIT :limit
+        """
+
+        rows = [dict(row) for row in self.db.execute(text(sql), params).mappings()]
+        next_cursor = encode_cursor(rows[limit - 1]) if len(rows) > limit else None
+
+        return {"items": rows[:limit], "next_cursor": next_cursor}
+
+    @staticmethod
+    def _fts5_query(query: str) -> str:
+        """Quote each term so user input can't use FTS5 query syntax"""
+        terms = [term.replace('"', '""') for term in query.split()]
+        return " ".join(f'"{term}"' for term in terms)
@@ -0,0 +1,349 @@
+import hashlib
+import hmac
+import os
+import re
+import tempfile
+import time
+import uuid
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import AsyncIterator, BinaryIO, Dict, Any, Iterator, Optional
+from starlette.concurrency import run_in_threadpool
+from core.config import settings
+
+class StorageBackend(ABC):
+    """Interface for where uploaded content files live.
+
+    Keys are relative, slash-separated paths such as
+    ``content/12/<uuid>/video.mp4``; backends map them onto their own layout.
+    """
+
+    # Whether write_chunk can append at an offset (needed for resumable uploads)
+    supports_append = True
+
+    @abstractmethod
+    def write_chunk(self, key: str, data: bytes, offset: int) -> None:
+        """Write ``data`` at ``offset``, truncating anything after it"""
+
+    @abstractmethod
+    def size(self, key: str) -> Optional[int]:
+        """Size of the stored object in bytes, or None if it doesn't exist"""
+
+    def exists(self, key: str) -> bool:
+        return self.size(key) is not None
+
+    @abstractmethod
+    def open_read(self, key: str) -> BinaryIO:
+        """Readable binary file object over the stored bytes"""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove the object; a missing object is not an error"""
+
+    @abstractmethod
+    def url(self, key: str) -> str:
+        """Public URL stored in Content.file_url"""
+
+    @abstractmethod
+    def presigned_put_url(self, key: str, expires_in: int) -> str:
+        """URL a client can PUT the object's bytes to directly"""
+
+    @abstractmethod
+    def presigned_get_url(self, key: str, expires_in: int) -> str:
+        """URL a client can GET the object's bytes from directly"""
+
+    def iter_chunks(self, key: str, chunk_size: Optional[int] = None) -> Iterator[bytes]:
+        """Read an object back in fixed-size chunks"""
+        chunk_size = chunk_size or settings.UPLOAD_CHUNK_SIZE
+        with self.open_read(key) as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+
+    def checksum(self, key: str) -> str:
+        """SHA-256 of a stored object, computed without loading it whole"""
+        return self.hash_prefix(key).hexdigest()
+
+    def hash_prefix(self, key: str, length: Optional[int] = None):
+        """Running SHA-256 over an object's first ``length`` bytes (all of it
+        by default), to continue hashing when more bytes are appended"""
+        digest = hashlib.sha256()
+        remaining = length
+        for chunk in self.iter_chunks(key):
+            if remaining is not None:
+                chunk = chunk[:remaining]
+                remaining -= len(chunk)
+            digest.update(chunk)
+            if remaining == 0:
+                break
+        return digest
+
+    async def save_stream(
+        self,
+        key: str,
+        stream: AsyncIterator[bytes],
+        offset: int = 0,
+        max_size: Optional[int] = None,
+        digest=None
+    ) -> Dict[str, Any]:
+        """Write an async byte stream in fixed-size chunks, hashing as it goes.
+
+        Returns the number of bytes written and the SHA-256 of the bytes
+        hashed. Pass ``digest`` to continue a running hash over earlier
+        chunks of the same object. Raises ValueError if the stream would
+        grow the object past ``max_size``.
+        """
+        digest = digest or hashlib.sha256()
+        written = 0
+
+        async for chunk in iter_fixed_chunks(stream, settings.UPLOAD_CHUNK_SIZE):
+            if max_size is not None and offset + written + len(chunk) > max_size:
+                raise ValueError("Upload exceeds the maximum allowed size")
+            digest.update(chunk)
+            # Disk I/O runs in the threadpool so the event loop keeps serving
+            await run_in_threadpool(self.write_chunk, key, chunk, offset + written)
+            written += len(chunk)
+
+        if written == 0 and offset == 0:
+            await run_in_threadpool(self.write_chunk, key, b"", 0)
+
+        return {"size": written, "checksum": digest.hexdigest()}
+
+class LocalStorageBackend(StorageBackend):
+    """Stores objects as files under a root directory"""
+
+    def __init__(self, root: str, base_url: str):
+        self.root = os.path.abspath(root)
+        self.base_url = base_url.rstrip("/")
+
+    def path(self, key: str) -> str:
+        path = os.path.abspath(os.path.join(self.root, key))
+        if not path.startswith(self.root + os.sep):
+            raise ValueError("Invalid storage key")
+        return path
+
+    def write_chunk(self, key: str, data: bytes, offset: int) -> None:
+        path = self.path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        mode = "r+b" if os.path.exists(path) else "wb"
+        with open(path, mode) as f:
+            f.seek(offset)
+            f.write(data)
+            f.truncate()
+
+    def size(self, key: str) -> Optional[int]:
+        try:
+            return os.path.getsize(self.path(key))
+        except FileNotFoundError:
+            return None
+
+    def open_read(self, key: str) -> BinaryIO:
+        return open(self.path(key), "rb")
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self.path(key))
+        except FileNotFoundError:
+            pass
+
+    def url(self, key: str) -> str:
+        return f"{self.base_url}/{key}"
+
+    def presigned_put_url(self, key: str, expires_in: int) -> str:
+        return _signed_local_url("PUT", key, expires_in)
+
+    def presigned_get_url(self, key: str, expires_in: int) -> str:
+        return _signed_local_url("GET", key, expires_in)
+
+class S3StorageBackend(StorageBackend):
+    """Stores objects in an S3-compatible bucket (AWS S3, MinIO, ...)"""
+
+    supports_append = False
+
+    # S3 multipart parts must be at least 5 MiB, except the last one
+    MIN_PART_SIZE = 5 * 1024 * 1024
+
+    def __init__(
+        self,
+        bucket: str,
+        endpoint_url: Optional[str] = None,
+        region: Optional[str] = None,
+        access_key_id: Optional[str] = None,
+        secret_access_key: Optional[str] = None,
+        public_base_url: Optional[str] = None
+    ):
+        try:
+            import boto3
+            from botocore.exceptions import ClientError
+        except ImportError:
+            raise RuntimeError("boto3 is required for the s3 storage backend")
+
+        self.bucket = bucket
+        self.client_error = ClientError
+        self.client = boto3.client(
+            "s3",
+            endpoint_url=endpoint_url or None,
+            region_name=region or None,
+            aws_access_key_id=access_key_id or None,
+            aws_secret_access_key=secret_access_key or None
+        )
+        base = public_base_url or f"{endpoint_url or 'https://s3.amazonaws.com'}/{bucket}"
+        self.base_url = base.rstrip("/")
+
+    def write_chunk(self, key: str, data: bytes, offset: int) -> None:
+        if offset != 0:
+            raise ValueError("S3 objects cannot be appended to")
+        self.client.put_object(Bucket=self.bucket, Key=key, Body=data)
+
+    def size(self, key: str) -> Optional[int]:
+        try:
+            head = self.client.head_object(Bucket=self.bucket, Key=key)
+        except self.client_error as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise
+        return head["ContentLength"]
+
+    def open_read(self, key: str) -> BinaryIO:
+        return self.client.get_object(Bucket=self.bucket, Key=key)["Body"]
+
+    def delete(self, key: str) -> None:
+        self.client.delete_object(Bucket=self.bucket, Key=key)
+
+    def url(self, key: str) -> str:
+        return f"{self.base_url}/{key}"
+
+    def presigned_put_url(self, key: str, expires_in: int) -> str:
+        return self.client.generate_presigned_url(
+            "put_object", Params={"Bucket": self.bucket, "Key": key}, ExpiresIn=expires_in
+        )
+
+    def presigned_get_url(self, key: str, expires_in: int) -> str:
+        return self.client.generate_presigned_url(
+            "get_object", Params={"Bucket": self.bucket, "Key": key}, ExpiresIn=expires_in
+        )
+
+    async def save_stream(
+        self,
+        key: str,
+        stream: AsyncIterator[bytes],
+        offset: int = 0,
+        max_size: Optional[int] = None,
+        digest=None
+    ) -> Dict[str, Any]:
+        """Stream into a multipart upload so the object is never held in memory"""
+        if offset != 0:
+            raise ValueError("S3 objects cannot be appended to")
+
+        digest = digest or hashlib.sha256()
+        written = 0
+        parts = []
+        upload = await run_in_threadpool(
+            self.client.create_multipart_upload, Bucket=self.bucket, Key=key
+        )
+        part_size = max(settings.UPLOAD_CHUNK_SIZE, self.MIN_PART_SIZE)
+
+        try:
+            async for chunk in iter_fixed_chunks(stream, part_size):
+                if max_size is not None and written + len(chunk) > max_size:
+                    raise ValueError("Upload exceeds the maximum allowed size")
+                digest.update(chunk)
+                part = await run_in_threadpool(
+                    self.client.upload_part,
+                    Bucket=self.bucket,
+                    Key=key,
+                    UploadId=upload["UploadId"],
+                    PartNumber=len(parts) + 1,
+                    Body=chunk
+                )
+                parts.append({"ETag": part["ETag"], "PartNumber": len(parts) + 1})
+                written += len(chunk)
+
+            if not parts:
+                await run_in_threadpool(
+                    self.client.abort_multipart_upload,
+                    Bucket=self.bucket, Key=key, UploadId=upload["UploadId"]
+                )
+                await run_in_threadpool(self.write_chunk, key, b"", 0)
+            else:
+                await run_in_threadpool(
+                    self.client.complete_multipart_upload,
+                    Bucket=self.bucket,
+                    Key=key,
+                    UploadId=upload["UploadId"],
+                    MultipartUpload={"Parts": parts}
+                )
+        except Exception:
+            await run_in_threadpool(
+                self.client.abort_multipart_upload,
+                Bucket=self.bucket, Key=key, UploadId=upload["UploadId"]
+            )
+            raise
+
+        return {"size": written, "checksum": digest.hexdigest()}
+
+def sign_storage_request(method: str, key: str, expires: int) -> str:
+    """HMAC signature for a local-backend presigned URL"""
+    message = f"{method}\n{key}\n{expires}".encode()
+    return hmac.new(settings.SECRET_KEY.encode(), message, hashlib.sha256).hexdigest()
+
+def verify_storage_signature(method: str, key: str, expires: int, signature: str) -> bool:
+    """Check a local-backend presigned URL's signature and expiry"""
+    if expires < time.time():
+        return False
+    return hmac.compare_digest(sign_storage_request(method, key, expires), signature)
+
+def _signed_local_url(method: str, key: str, expires_in: int) -> str:
+    expires = int(time.time()) + expires_in
+    signature = sign_storage_request(method, key, expires)
+    return f"{settings.STORAGE_SIGNED_URL_BASE}/{key}?expires={expires}&signature={signature}"
+
+@contextmanager
+def local_path(storage: StorageBackend, key: str) -> Iterator[str]:
+    """Filesystem path for an object, spooling remote objects to a temp file"""
+    if isinstance(storage, LocalStorageBackend):
+        yield storage.path(key)
+        return
+
+    suffix = os.path.splitext(key)[1]
+    with tempfile.NamedTemporaryFile(suffix=suffix) as tmp:
+        for chunk in storage.iter_chunks(key):
+            tmp.write(chunk)
+        tmp.flush()
+        yield tmp.name
+
+async def iter_fixed_chunks(stream: AsyncIterator[bytes], chunk_size: int) -> AsyncIterator[bytes]:
+    """Regroup an arbitrary async byte stream into chunks of ``chunk_size``"""
+    buffer = bytearray()
+    async for data in stream:
+        buffer.extend(data)
+        while len(buffer) >= chunk_size:
+            yield bytes(buffer[:chunk_size])
+            del buffer[:chunk_size]
+    if buffer:
+        yield bytes(buffer)
+
+def build_content_key(creator_id: int, filename: str) -> str:
+    """Unique storage key for a creator's uploaded file"""
+    safe_name = re.sub(r"[^A-Za-z0-9._-]", "_", os.path.basename(filename or "")) or "file"
+    return f"content/{creator_id}/{uuid.uuid4().hex}/{safe_name}"
+
+@lru_cache()
+def get_storage_backend() -> StorageBackend:
+    """Configured storage backend (shared per process)"""
+    if settings.STORAGE_BACKEND == "local":
+        return LocalStorageBackend(settings.STORAGE_LOCAL_ROOT, settings.STORAGE_PUBLIC_BASE_URL)
+    if settings.STORAGE_BACKEND == "s3":
+        return S3StorageBackend(
+            bucket=settings.S3_BUCKET,
+            endpoint_url=settings.S3_ENDPOINT_URL,
+            region=settings.S3_REGION,
+            access_key_id=settings.S3_ACCESS_KEY_ID,
+            secret_access_key=settings.S3_SECRET_ACCESS_KEY,
+            public_base_url=settings.S3_PUBLIC_BASE_URL
+        )
+
+    raise ValueError(f"Unknown storage backend: {settings.STORAGE_BACKEND}")
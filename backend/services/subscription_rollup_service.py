@@ -0,0 +1,177 @@
+from collections import defaultdict
+from datetime import date, datetime
+from decimal import Decimal
+from typing import List, Optional, Dict, Any
+from sqlalchemy import Date, and_, func, literal, select, true
+from sqlalchemy.orm import Session
+from core.utils import dialect_insert
+from models.subscription import Subscription, SubscriptionStatus
+from models.subscription_plan import SubscriptionPlan
+from models.subscription_rollup import SubscriptionDailyRollup
+
+class SubscriptionRollupService:
+    """Maintains per-day, per-plan subscription rollups for the admin dashboard.
+
+    Rollup rows hold deltas (activations, cancellations, MRR change), so every
+    status change is a single upsert and running totals are derived from the
+    rollup table alone.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def record_status_change(
+        self,
+        subscription: Subscription,
+        old_status: Optional[SubscriptionStatus],
+        new_status: SubscriptionStatus,
+        when: Optional[datetime] = None
+    ) -> None:
+        """Record a status transition in the rollups (caller commits)"""
+        if old_status == new_status:
+            return
+
+        price = subscription.plan.price if subscription.plan else Decimal("0")
+        day = (when or datetime.utcnow()).date()
+
+        if new_status == SubscriptionStatus.ACTIVE:
+            self._increment(day, subscription.plan_id, activations=1, mrr_delta=price)
+        elif old_status == SubscriptionStatus.ACTIVE:
+            self._increment(day, subscription.plan_id, cancellations=1, mrr_delta=-price)
+
+    def _increment(
+        self,
+        day: date,
+        plan_id: int,
+        activations: int = 0,
+        cancellations: int = 0,
+        mrr_delta: Decimal = Decimal("0")
+    ) -> None:
+        """Atomically add deltas to the (day, plan) rollup row"""
+        insert = dialect_insert(self.db)
+        stmt = insert(SubscriptionDailyRollup).values(
+            day=day,
+            plan_id=plan_id,
+            activations=activations,
+            cancellations=cancellations,
+            mrr_delta=mrr_delta
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[SubscriptionDailyRollup.day, SubscriptionDailyRollup.plan_id],
+            set_={
+                "activations": SubscriptionDailyRollup.activations + stmt.excluded.activations,
+                "cancellations": SubscriptionDailyRollup.cancellations + stmt.excluded.cancellations,
+                "mrr_delta": SubscriptionDailyRollup.mrr_delta + stmt.excluded.mrr_delta,
+            }
+        )
+        self.db.execute(stmt)
+
+    def backfill(self) -> int:
+        """Rebuild all rollups from the subscriptions table, returns rows written"""
+        totals: Dict[tuple, Dict[str, Any]] = defaultdict(
+            lambda: {"activations": 0, "cancellations": 0, "mrr_delta": Decimal("0")}
+        )
+
+        rows = self.db.execute(
+            select(
+                Subscription.plan_id,
+                Subscription.status,
+                Subscription.started_at,
+                Subscription.canceled_at,
+                SubscriptionPlan.price
+            ).join(SubscriptionPlan, SubscriptionPlan.id == Subscription.plan_id)
+            .execution_options(yield_per=1000)
+        )
+
+        for plan_id, sub_status, started_at, canceled_at, price in rows:
+            if started_at is None:
+                continue
+            bucket = totals[(started_at.date(), plan_id)]
+            bucket["activations"] += 1
+            bucket["mrr_delta"] += price
+
+            if sub_status == SubscriptionStatus.CANCELED:
+                # Cancellations from before canceled_at existed fall on the start day
+                canceled_day = (canceled_at or started_at).date()
+                bucket = totals[(canceled_day, plan_id)]
+                bucket["cancellations"] += 1
+                bucket["mrr_delta"] -= price
+
+        self.db.query(SubscriptionDailyRollup).delete(synchronize_session=False)
+        if totals:
+            self.db.execute(
+                SubscriptionDailyRollup.__table__.insert(),
+                [
+                    {"day": day, "plan_id": plan_id, **values}
+                    for (day, plan_id), values in totals.items()
+                ]
+            )
+        self.db.commit()
+
+        return len(totals)
+
+    def _day_series(self, start: date, end: date):
+        """Recursive CTE yielding every day from start to end inclusive"""
+        if self.db.get_bind().dialect.name == "postgresql":
+            next_day = lambda day: day + 1  # date + integer is a date
+        else:
+            next_day = lambda day: func.date(day, "+1 day")
+
+        days = select(literal(start, Date).label("day")).cte("days", recursive=True)
+        return days.union_all(select(next_day(days.c.day)).where(days.c.day < end))
+
+    def get_daily_metrics(self, start: date, end: date) -> List[Dict[str, Any]]:
+        """MRR, active subscribers and churn for every day and plan in the
+        window, read from rollups only.
+
+        Days without a rollup row carry the previous totals forward, and each
+        plan's totals start from its cumulative deltas before ``start``.
+        """
+        rollup = SubscriptionDailyRollup
+        days = self._day_series(start, end)
+        before = select(
+            rollup.plan_id,
+            func.sum(rollup.activations - rollup.cancellations).label("active_subscribers"),
+            func.sum(rollup.mrr_delta).label("mrr")
+        ).where(rollup.day < start).group_by(rollup.plan_id).subquery()
+
+        activations = func.coalesce(rollup.activations, 0)
+        cancellations = func.coalesce(rollup.cancellations, 0)
+        window = {"partition_by": SubscriptionPlan.id, "order_by": days.c.day}
+        rows = self.db.execute(
+            select(
+                days.c.day,
+                SubscriptionPlan.id.label("plan_id"),
+                activations.label("activations"),
+                cancellations.label("cancellations"),
+                (
+                    func.coalesce(before.c.active_subscribers, 0)
+                    + func.sum(activations - cancellations).over(**window)
+                ).label("active_subscribers"),
+                (
+                    func.coalesce(before.c.mrr, 0)
+                    + func.sum(func.coalesce(rollup.mrr_delta, 0)).over(**window)
+                ).label("mrr")
+            )
+            .select_from(days)
+            .join(SubscriptionPlan, true())
+            .outerjoin(rollup, and_(rollup.day == days.c.day, rollup.plan_id == SubscriptionPlan.id))
+            .outerjoin(before, before.c.plan_id == SubscriptionPlan.id)
+            .order_by(days.c.day, SubscriptionPlan.id)
+        ).all()
+
+        metrics = []
+        for row in rows:
+            # Subscribers at the start of the day are the base for churn
+            start_of_day = row.active_subscribers - row.activations + row.cancellations
+            metrics.append({
+                "day": row.day.isoformat(),
+                "plan_id": row.plan_id,
+                "activations": row.activations,
+                "cancellations": row.cancellations,
+                "active_subscribers": int(row.active_subscribers),
+                "mrr": float(row.mrr),
+                "churn_rate": round(row.cancellations / start_of_day, 4) if start_of_day > 0 else 0.0
+            })
+
+        return metrics
@@ -1,5 +1,7 @@
+from datetime import datetime
 from typing import List, Optional, Dict, Any
 from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
 from models.subscription import Subscription, SubscriptionStatus
 from models.subscription_plan import SubscriptionPlan
@@ -7,6 +9,8 @@ from models.user import UserRole
 from schemas.subscription import SubscriptionCreate
 from schemas.subscription_plan import SubscriptionPlanCreate
 from services.base import BaseService
+from services.subscription_rollup_service import SubscriptionRollupService
+from core.utils import load_fields
 
 class SubscriptionPlanService(BaseService[SubscriptionPlan, SubscriptionPlanCreate, None]):
     def __init__(self, db: Session):
@@ -33,6 +37,25 @@ class SubscriptionPlanService(BaseService[SubscriptionPlan, SubscriptionPlanCrea
 class SubscriptionService(BaseService[Subscription, SubscriptionCreate, None]):
     def __init__(self, db: Session):
         super().__init__(Subscription, db)
+        self.rollup_service = SubscriptionRollupService(db)
+
+    def set_status(self, subscription: Subscription, new_status: SubscriptionStatus) -> None:
+        """Change a subscription's status and record it in the rollups (caller commits)"""
+        old_status = subscription.status
+        if old_status == new_status:
+            return
+
+        subscription.status = new_status
+        subscription.canceled_at = datetime.utcnow() if new_status == SubscriptionStatus.CANCELED else None
+        # Flush first so the partial unique index rejects a reactivation early
+        self.db.flush()
+        self.rollup_service.record_status_change(subscription, old_status, new_status)
+
+    def add_subscription(self, subscription: Subscription) -> None:
+        """Insert a new subscription and record it in the rollups (caller commits)"""
+        self.db.add(subscription)
+        self.db.flush()
+        self.rollup_service.record_status_change(subscription, None, subscription.status)
 
     def create_subscription(self, subscription_data: SubscriptionCreate, user_id: int) -> Subscription:
         """Create new subscription for a user"""
@@ -53,26 +76,25 @@ class SubscriptionService(BaseService[Subscription, SubscriptionCreate, None]):
                 detail="Subscription plan not found"
             )
 
-        # Check if user already has an active subscription
-        existing_subscription = self.db.query(Subscription).filter(
-            Subscription.user_id == user_id,
-            Subscription.status == SubscriptionStatus.ACTIVE
-        ).first()
+        db_subscription = Subscription(
+            user_id=user_id,
+            plan_id=subscription_data.plan_id,
+            # Map the schema enum onto the model enum so the stored name is 'ACTIVE'
+            status=SubscriptionStatus(subscription_data.status.value)
+        )
 
-        if existing_subscription:
+        # The partial unique index on (user_id) WHERE status = 'ACTIVE'
+        # rejects a second active subscription atomically
+        try:
+            self.add_subscription(db_subscription)
+            self.db.commit()
+        except IntegrityError:
+            self.db.rollback()
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="User already has an active subscription"
             )
 
-        db_subscription = Subscription(
-            user_id=user_id,
-            plan_id=subscription_data.plan_id,
-            status=subscription_data.status
-        )
-
-        self.db.add(db_subscription)
-        self.db.commit()
         self.db.refresh(db_subscription)
 
         return db_subscription
@@ -105,16 +127,18 @@ class SubscriptionService(BaseService[Subscription, SubscriptionCreate, None]):
                 detail="Subscription is already canceled"
             )
 
-        subscription.status = SubscriptionStatus.CANCELED
+        self.set_status(subscription, SubscriptionStatus.CANCELED)
         self.db.commit()
         self.db.refresh(subscription)
 
         return subscription
 
-    def get_all_subscriptions(self, page: int = 1, per_page: int = 10) -> Dict[str, Any]:
-        """Get all subscriptions (admin only)"""
+    def get_all_subscriptions(
+        self, page: int = 1, per_page: int = 10, fields: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Get all subscriptions (admin only), loading only ``fields`` when given"""
         query = self.db.query(Subscription)
-        return self.paginate_query(query, page, per_page)
+        return self.paginate_query(load_fields(query, Subscription, fields), page, per_page)
 
     def paginate_query(self, query, page: int, per_page: int) -> Dict[str, Any]:
         """Paginate query results"""
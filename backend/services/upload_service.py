@@ -0,0 +1,237 @@
+import hashlib
+from collections import OrderedDict
+from typing import AsyncIterator, Dict, Any, Optional, Tuple
+from sqlalchemy.orm import Session
+from fastapi import HTTPException, status
+from starlette.concurrency import run_in_threadpool
+from core.config import settings
+from core.utils import generate_uuid
+from models.content import Content
+from models.content_upload import ContentUpload, UploadStatus
+from schemas.content import ContentCreate
+from schemas.upload import UploadCreate
+from services.base import BaseService
+from services.content_service import ContentService
+from services.storage_service import get_storage_backend, build_content_key
+from services.media_metadata_service import schedule_metadata_extraction
+from services.media_blob_service import MediaBlobService
+
+# Running SHA-256 of each in-progress resumable upload: upload id -> (bytes
+# hashed, hash state). Kept per process; a chunk landing on a process without
+# the state rebuilds it from the stored prefix once
+RUNNING_HASHES_MAX = 1024
+_running_hashes: "OrderedDict[str, Tuple[int, Any]]" = OrderedDict()
+
+def _take_running_hash(upload_id: str, offset: int):
+    state = _running_hashes.pop(upload_id, None)
+    if state is not None and state[0] == offset:
+        return state[1]
+    return None
+
+def _keep_running_hash(upload_id: str, offset: int, digest) -> None:
+    _running_hashes[upload_id] = (offset, digest)
+    while len(_running_hashes) > RUNNING_HASHES_MAX:
+        _running_hashes.popitem(last=False)
+
+class ContentUploadService(BaseService[ContentUpload, UploadCreate, None]):
+    """Streams uploaded files into the storage backend and creates Content rows"""
+
+    def __init__(self, db: Session):
+        super().__init__(ContentUpload, db)
+        self.storage = get_storage_backend()
+        self.content_service = ContentService(db)
+
+    async def upload_file(
+        self,
+        stream: AsyncIterator[bytes],
+        title: str,
+        filename: str,
+        creator_id: int
+    ) -> Dict[str, Any]:
+        """Stream a whole file in one request and create its Content row"""
+        key = build_content_key(creator_id, filename)
+
+        try:
+            stored = await self.storage.save_stream(key, stream, max_size=settings.UPLOAD_MAX_SIZE)
+        except ValueError as e:
+            await run_in_threadpool(self.storage.delete, key)
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=str(e)
+            )
+
+        content = self._create_content(
+            title, key, creator_id, checksum=stored["checksum"], size=stored["size"]
+        )
+
+        return {"content": content, "size": stored["size"], "checksum": stored["checksum"]}
+
+    def create_upload(self, upload_data: UploadCreate, creator_id: int) -> ContentUpload:
+        """Start a resumable upload session"""
+        if upload_data.total_size > settings.UPLOAD_MAX_SIZE:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail="Upload exceeds the maximum allowed size"
+            )
+
+        upload = ContentUpload(
+            id=generate_uuid(),
+            creator_id=creator_id,
+            title=upload_data.title,
+            filename=upload_data.filename,
+            storage_key=build_content_key(creator_id, upload_data.filename),
+            total_size=upload_data.total_size,
+            received_size=0
+        )
+
+        self.db.add(upload)
+        self.db.commit()
+        self.db.refresh(upload)
+
+        return upload
+
+    def create_presigned_upload(self, upload_data: UploadCreate, creator_id: int) -> Dict[str, Any]:
+        """Start an upload the client sends straight to storage via a presigned URL"""
+        upload = self.create_upload(upload_data, creator_id)
+        expires_in = settings.STORAGE_PRESIGN_EXPIRES_SECONDS
+
+        return {
+            "upload": upload,
+            "upload_url": self.storage.presigned_put_url(upload.storage_key, expires_in),
+            "method": "PUT",
+            "expires_in": expires_in
+        }
+
+    def get_user_upload(self, upload_id: str, user_id: int) -> ContentUpload:
+        """Get an upload session owned by the user"""
+        upload = self.get_or_404(upload_id)
+
+        if upload.creator_id != user_id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Not authorized to access this upload"
+            )
+
+        return upload
+
+    async def receive_chunk(
+        self,
+        upload: ContentUpload,
+        stream: AsyncIterator[bytes],
+        start: int
+    ) -> ContentUpload:
+        """Append a chunk at ``start``; completes the upload on the last byte"""
+        self._ensure_pending(upload)
+
+        if not self.storage.supports_append:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Storage backend does not support chunked uploads, use a presigned upload"
+            )
+
+        # The stored object is the source of truth for how much arrived, so a
+        # chunk that died half-way is simply resent from the reported offset
+        current_size = await run_in_threadpool(self.storage.size, upload.storage_key) or 0
+        if start != current_size:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Expected chunk at offset {current_size}"
+            )
+
+        # Hash each byte once as it streams in, continuing from earlier chunks
+        digest = _take_running_hash(upload.id, start)
+        if digest is None:
+            digest = (
+                await run_in_threadpool(self.storage.hash_prefix, upload.storage_key, start)
+                if start else hashlib.sha256()
+            )
+
+        try:
+            stored = await self.storage.save_stream(
+                upload.storage_key, stream, offset=start, max_size=upload.total_size, digest=digest
+            )
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail="Chunk extends past the declared upload size"
+            )
+
+        upload.received_size = start + stored["size"]
+
+        if upload.received_size == upload.total_size:
+            upload.checksum = stored["checksum"]
+            return self._finish_upload(upload)
+
+        _keep_running_hash(upload.id, upload.received_size, digest)
+
+        self.db.commit()
+        self.db.refresh(upload)
+
+        return upload
+
+    async def complete_upload(self, upload: ContentUpload) -> ContentUpload:
+        """Completion callback for presigned uploads: create the Content row
+        only once the object really exists in storage with the declared size"""
+        self._ensure_pending(upload)
+
+        size = await run_in_threadpool(self.storage.size, upload.storage_key)
+        if size is None:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Uploaded object not found in storage"
+            )
+        if size != upload.total_size:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Uploaded object is {size} bytes, expected {upload.total_size}"
+            )
+
+        upload.received_size = size
+        return self._finish_upload(upload)
+
+    def _finish_upload(self, upload: ContentUpload) -> ContentUpload:
+        content = self._create_content(
+            upload.title, upload.storage_key, upload.creator_id,
+            checksum=upload.checksum, size=upload.total_size
+        )
+        upload.content_id = content.id
+        upload.status = UploadStatus.COMPLETED
+
+        self.db.commit()
+        self.db.refresh(upload)
+
+        return upload
+
+    def _ensure_pending(self, upload: ContentUpload) -> None:
+        if upload.status == UploadStatus.COMPLETED:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Upload is already completed"
+            )
+
+    def _create_content(
+        self,
+        title: str,
+        key: str,
+        creator_id: int,
+        checksum: Optional[str] = None,
+        size: Optional[int] = None
+    ) -> Content:
+        content = self.content_service.create_content(
+            ContentCreate(title=title, file_url=self.storage.url(key), creator_id=creator_id),
+            creator_id,
+            storage_key=key
+        )
+
+        if checksum:
+            # Identical bytes already stored: share that blob and drop this copy
+            blob_service = MediaBlobService(self.db)
+            duplicate_key = blob_service.register(content, checksum, size)
+            self.db.commit()
+            blob_service.delete_objects([duplicate_key])
+
+        # Size, type, dimensions and duration are probed off the request path;
+        # a checksum computed while streaming saves the worker a re-read
+        schedule_metadata_extraction(content.id, content.storage_key, known_hash=checksum)
+
+        return content
@@ -1,4 +1,5 @@
 from typing import Optional
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status, BackgroundTasks
@@ -7,11 +8,15 @@ from schemas.user import UserCreate
 from schemas.relations import UserWithRelations
 from core.security import get_password_hash, verify_password
 from services.base import BaseService
+from core.responses import make_row_etag
 from services.email_service import email_service
 import logging
 
 logger = logging.getLogger(__name__)
 
+def user_etag(user_id: int, updated_at) -> str:
+    return make_row_etag("user", user_id, updated_at)
+
 class UserService(BaseService[User, UserCreate, None]):
     def __init__(self, db: Session):
         super().__init__(User, db)
@@ -24,6 +29,16 @@ class UserService(BaseService[User, UserCreate, None]):
         """Get user by ID"""
         return self.db.query(User).filter(User.id == user_id).first()
 
+    def get_user_etag(self, user_id: int) -> str:
+        """ETag of a user from its updated_at alone"""
+        updated_at = self.db.execute(select(User.updated_at).where(User.id == user_id)).first()
+        if updated_at is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found"
+            )
+        return user_etag(user_id, updated_at[0])
+
     def create_user(
         self,
         user_data: UserCreate,
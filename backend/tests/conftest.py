@@ -0,0 +1,50 @@
+import os
+import sys
+import tempfile
+
+# The app reads settings at import time, so point it at a throwaway database first
+_tmp = tempfile.mkdtemp(prefix="backend-tests-")
+os.environ["DATABASE_URL"] = os.environ.get("TEST_DATABASE_URL", f"sqlite:///{_tmp}/test.db")
+os.environ.setdefault("SECRET_KEY", "test-secret")
+os.environ["STORAGE_LOCAL_ROOT"] = os.path.join(_tmp, "media")
+os.environ["SMTP_HOST"] = ""  # Never send real mail, whatever .env says
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from fastapi.testclient import TestClient
+import main
+from database import SessionLocal, engine
+from models.base import Base
+from models.user import User, UserRole
+from services.search_service import ensure_search_index
+
+Base.metadata.create_all(engine)
+ensure_search_index(engine)
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.rollback()
+        with engine.begin() as connection:
+            for table in reversed(Base.metadata.sorted_tables):
+                connection.execute(table.delete())
+        session.close()
+
+
+@pytest.fixture
+def client():
+    return TestClient(main.app)
+
+
+@pytest.fixture
+def make_user(db):
+    def make(role: UserRole = UserRole.CREATOR, email: str = None) -> User:
+        user = User(email=email or f"{role.value}-{db.query(User).count()}@example.com", password_hash="-", role=role)
+        db.add(user)
+        db.commit()
+        return user
+    return make
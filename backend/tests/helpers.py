@@ -0,0 +1,32 @@
+"""Plain helpers shared by the test modules; fixtures live in conftest.py"""
+import threading
+from core.security import create_access_token
+from database import SessionLocal
+from models.user import User
+
+
+def auth_headers(user: User) -> dict:
+    return {"Authorization": f"Bearer {create_access_token(user.id)}"}
+
+
+def run_in_parallel(*calls):
+    """Run each call on its own thread and session, released together"""
+    barrier = threading.Barrier(len(calls))
+    outcomes = [None] * len(calls)
+
+    def worker(index, call):
+        session = SessionLocal()
+        try:
+            barrier.wait()
+            outcomes[index] = call(session)
+        except Exception as e:
+            outcomes[index] = e
+        finally:
+            session.close()
+
+    threads = [threading.Thread(target=worker, args=(index, call)) for index, call in enumerate(calls)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return outcomes
@@ -0,0 +1,68 @@
+import pytest
+from models.agency_dashboard_stats import AgencyDashboardStats
+from models.content import Content
+from models.report import Report
+from models.user import UserRole
+from schemas.report import ReportCreate
+from services.agency_stats_service import AgencyStatsService
+from services.report_service import ReportService
+from tests.helpers import run_in_parallel
+
+
+@pytest.fixture
+def agency_and_content(db, make_user):
+    agency = make_user(UserRole.AGENCY)
+    content = Content(title="Video", file_url="-", creator_id=make_user(UserRole.CREATOR).id)
+    db.add(content)
+    db.commit()
+    return agency.id, content.id
+
+
+def content_count(db, agency_id):
+    db.expire_all()
+    stats = db.get(AgencyDashboardStats, agency_id)
+    return stats.content_count if stats else 0
+
+
+def test_parallel_first_reports_count_the_content_once(db, agency_and_content):
+    agency_id, content_id = agency_and_content
+    create = lambda session: ReportService(session).create_report(
+        ReportCreate(name="Weekly", agency_id=agency_id, content_id=content_id), agency_id
+    )
+
+    outcomes = run_in_parallel(create, create, create)
+
+    assert all(isinstance(outcome, Report) for outcome in outcomes), outcomes
+    assert content_count(db, agency_id) == 1
+
+
+def test_parallel_deletes_of_the_last_reports_uncount_the_content_once(db, agency_and_content):
+    agency_id, content_id = agency_and_content
+    service = ReportService(db)
+    report_ids = [
+        service.create_report(ReportCreate(name=f"Report {index}", agency_id=agency_id, content_id=content_id), agency_id).id
+        for index in range(2)
+    ]
+    assert content_count(db, agency_id) == 1
+
+    outcomes = run_in_parallel(*[
+        lambda session, report_id=report_id: ReportService(session).delete_report(report_id, agency_id, UserRole.AGENCY)
+        for report_id in report_ids
+    ])
+
+    assert all(isinstance(outcome, Report) for outcome in outcomes), outcomes
+    assert content_count(db, agency_id) == 0
+
+
+def test_counters_match_a_backfill(db, agency_and_content):
+    agency_id, content_id = agency_and_content
+    service = ReportService(db)
+    for index in range(3):
+        service.create_report(ReportCreate(name=f"Report {index}", agency_id=agency_id, content_id=content_id), agency_id)
+    first = db.query(Report).order_by(Report.id).first()
+    service.delete_report(first.id, agency_id, UserRole.AGENCY)
+    live = AgencyStatsService(db).get_dashboard(agency_id)
+
+    AgencyStatsService(db).backfill()
+
+    assert AgencyStatsService(db).get_dashboard(agency_id)["content_count"] == live["content_count"] == 1
@@ -0,0 +1,98 @@
+import pytest
+from sqlalchemy import event
+from database import engine
+from models.content import Content
+from models.report import Report
+from models.user import UserRole
+from tests.helpers import auth_headers
+
+
+@pytest.fixture
+def owned(db, make_user):
+    creator = make_user(UserRole.CREATOR)
+    agency = make_user(UserRole.AGENCY)
+    content = Content(title="Launch", file_url="-", creator_id=creator.id)
+    db.add(content)
+    db.flush()
+    report = Report(name="Weekly", agency_id=agency.id, content_id=content.id, parameters={})
+    db.add(report)
+    db.commit()
+    return creator, agency, content, report
+
+
+def revalidate(client, url, user, etag):
+    return client.get(url, headers={**auth_headers(user), "If-None-Match": etag})
+
+
+def current_etag(client, url, user):
+    response = client.get(url, headers=auth_headers(user))
+    assert response.status_code == 200, response.text
+    assert response.headers["cache-control"] == "private, no-cache"
+    return response.headers["etag"]
+
+
+def test_matching_etag_returns_an_empty_304(client, owned):
+    creator, agency, content, report = owned
+    for url, user in (
+        (f"/api/v1/content/{content.id}", creator),
+        (f"/api/v1/reports/{report.id}", agency),
+        ("/api/v1/auth/me", agency),
+    ):
+        etag = current_etag(client, url, user)
+        assert etag.startswith('W/"')
+
+        response = revalidate(client, url, user, etag)
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+        assert revalidate(client, url, user, 'W/"stale"').status_code == 200
+
+
+def test_weak_lists_and_star_match(client, owned):
+    creator, _, content, _ = owned
+    url = f"/api/v1/content/{content.id}"
+    etag = current_etag(client, url, creator)
+
+    assert revalidate(client, url, creator, etag.removeprefix("W/")).status_code == 304
+    assert revalidate(client, url, creator, f'W/"other", {etag}').status_code == 304
+    assert revalidate(client, url, creator, "*").status_code == 304
+
+
+def test_etag_follows_the_row_and_its_embedded_rows(client, db, owned):
+    creator, agency, content, report = owned
+    content_url, report_url = f"/api/v1/content/{content.id}", f"/api/v1/reports/{report.id}"
+
+    def changes(url, user, mutate) -> bool:
+        before = current_etag(client, url, user)
+        mutate()
+        db.commit()
+        after = current_etag(client, url, user)
+        return before != after and revalidate(client, url, user, before).status_code == 200
+
+    assert changes(content_url, creator, lambda: setattr(content, "title", "Launch (final cut)"))
+    assert changes(report_url, agency, lambda: setattr(report, "name", "Weekly (EU)"))
+    # The report response embeds its agency and content
+    assert changes(report_url, agency, lambda: setattr(agency, "email", "renamed-agency@example.com"))
+    assert changes(report_url, agency, lambda: setattr(content, "title", "Launch (director's cut)"))
+
+
+def test_auth_me_revalidates_without_loading_the_user(client, owned):
+    _, agency, _, _ = owned
+    etag = current_etag(client, "/api/v1/auth/me", agency)
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        response = revalidate(client, "/api/v1/auth/me", agency, etag)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert response.status_code == 304
+    selects = [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+    assert len(selects) == 1
+    assert "users.updated_at" in selects[0] and "users.email" not in selects[0]
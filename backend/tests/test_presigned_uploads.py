@@ -0,0 +1,91 @@
+import os
+import time
+from urllib.parse import parse_qs, urlsplit
+import pytest
+from models.content import Content
+from models.content_upload import ContentUpload, UploadStatus
+from models.user import UserRole
+from services import upload_service
+from services.storage_service import get_storage_backend, sign_storage_request
+from tests.helpers import auth_headers
+
+
+@pytest.fixture(autouse=True)
+def no_metadata_workers(monkeypatch):
+    monkeypatch.setattr(upload_service, "schedule_metadata_extraction", lambda *args, **kwargs: None)
+
+
+@pytest.fixture
+def creator_headers(make_user):
+    return auth_headers(make_user(UserRole.CREATOR))
+
+
+def presign(client, headers, size):
+    response = client.post(
+        "/api/v1/content/presigned-uploads",
+        json={"title": "Direct", "filename": "direct.mp4", "total_size": size},
+        headers=headers
+    )
+    assert response.status_code == 201, response.text
+    return response.json()["data"]
+
+
+def complete(client, headers, upload_id):
+    return client.post(f"/api/v1/content/uploads/{upload_id}/complete", headers=headers)
+
+
+def test_presign_put_complete_creates_content(client, db, creator_headers):
+    data = os.urandom(4096)
+    presigned = presign(client, creator_headers, len(data))
+    assert presigned["method"] == "PUT"
+
+    # The signed URL carries its own authorization; no bearer token needed
+    assert client.put(presigned["upload_url"], content=data).status_code == 200
+    response = complete(client, creator_headers, presigned["upload"]["id"])
+
+    assert response.status_code == 200, response.text
+    upload = response.json()
+    assert upload["status"] == "completed"
+    content = db.get(Content, upload["content_id"])
+    with get_storage_backend().open_read(content.storage_key) as f:
+        assert f.read() == data
+
+
+def test_complete_before_the_object_exists_creates_nothing(client, db, creator_headers):
+    data = os.urandom(1024)
+    presigned = presign(client, creator_headers, len(data))
+    upload_id = presigned["upload"]["id"]
+
+    assert complete(client, creator_headers, upload_id).status_code == 409
+    assert db.query(Content).count() == 0
+    assert db.get(ContentUpload, upload_id).status == UploadStatus.PENDING
+
+    # A short object is rejected the same way
+    client.put(presigned["upload_url"], content=data[:100])
+    assert complete(client, creator_headers, upload_id).status_code == 409
+    assert db.query(Content).count() == 0
+
+    # The session stays usable once the full object arrives
+    client.put(presigned["upload_url"], content=data)
+    assert complete(client, creator_headers, upload_id).status_code == 200
+    assert db.query(Content).count() == 1
+
+
+def test_storage_put_rejects_bad_signatures(client, db, creator_headers):
+    presigned = presign(client, creator_headers, 10)
+    url = urlsplit(presigned["upload_url"])
+    query = parse_qs(url.query)
+    key = url.path.split("/storage/", 1)[1]
+    expires = int(query["expires"][0])
+
+    tampered = f"{url.path}?expires={expires}&signature={'0' * len(query['signature'][0])}"
+    other_key = f"{url.path}-other?expires={expires}&signature={query['signature'][0]}"
+    get_signature = f"{url.path}?expires={expires}&signature={sign_storage_request('GET', key, expires)}"
+    past = int(time.time()) - 1
+    expired = f"{url.path}?expires={past}&signature={sign_storage_request('PUT', key, past)}"
+
+    for target in (tampered, other_key, get_signature, expired):
+        assert client.put(target, content=b"x" * 10).status_code == 403, target
+
+    assert get_storage_backend().size(key) is None
+    assert complete(client, creator_headers, presigned["upload"]["id"]).status_code == 409
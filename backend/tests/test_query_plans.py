@@ -0,0 +1,117 @@
+"""Hot service queries must be served by an index, never a sequential scan.
+
+Each case seeds a few rows, runs one service call while recording the
+SELECTs it issues and EXPLAINs every recorded statement. On PostgreSQL
+sequential scans are disabled for the transaction, so the planner only
+falls back to one when no index can serve the query at all.
+
+scripts/check_query_plans.py runs the same checks against a live database.
+"""
+import json
+from datetime import datetime
+import pytest
+from sqlalchemy import event, text
+from models.base import Base
+from models.user import User, UserRole
+from models.content import Content
+from models.report import Report
+from models.subscription import Subscription, SubscriptionStatus
+from models.subscription_plan import SubscriptionPlan
+from services.agency_stats_service import AgencyStatsService
+from services.content_service import ContentService
+from services.report_service import ReportService
+from services.subscription_service import SubscriptionService
+from services.user_service import UserService
+
+HOT_QUERIES = {
+    "content by creator": lambda db, s: ContentService(db).get_user_content(s["creator"].id),
+    "reports by agency": lambda db, s: ReportService(db).get_agency_reports(s["agency"].id),
+    "reports by content": lambda db, s: ReportService(db).get_reports_by_content(
+        s["content"].id, s["agency"].id, UserRole.AGENCY
+    ),
+    "subscriptions by user": lambda db, s: SubscriptionService(db).get_user_subscriptions(s["agency"].id),
+    "active subscription": lambda db, s: SubscriptionService(db).get_active_subscription(s["agency"].id),
+    "users by role": lambda db, s: UserService(db).get_users_by_role(UserRole.AGENCY),
+    "agency dashboard": lambda db, s: AgencyStatsService(db).get_dashboard(s["agency"].id),
+}
+
+
+def seed(db) -> dict:
+    plan = SubscriptionPlan(name="Plan check", price=10, features="{}")
+    creator = User(email="plan-check-creator@example.com", password_hash="-", role=UserRole.CREATOR)
+    agency = User(email="plan-check-agency@example.com", password_hash="-", role=UserRole.AGENCY)
+    db.add_all([plan, creator, agency])
+    db.flush()
+
+    content = Content(title="Plan check", file_url="-", creator_id=creator.id)
+    db.add(content)
+    db.flush()
+
+    db.add_all([
+        Report(name="Plan check", agency_id=agency.id, content_id=content.id),
+        Subscription(
+            user_id=agency.id, plan_id=plan.id, status=SubscriptionStatus.ACTIVE, started_at=datetime.utcnow()
+        ),
+    ])
+    db.flush()
+    return {"creator": creator, "agency": agency, "content": content}
+
+
+def capture_selects(db, call) -> list:
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            statements.append((statement, parameters))
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        call()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return statements
+
+
+def postgres_seq_scans(plan: dict) -> list:
+    scans = []
+    if plan.get("Node Type") == "Seq Scan" and plan.get("Relation Name") in Base.metadata.tables:
+        scans.append(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        scans.extend(postgres_seq_scans(child))
+    return scans
+
+
+def seq_scans(db, statement: str, parameters) -> list:
+    connection = db.connection()
+    if connection.dialect.name == "postgresql":
+        result = connection.exec_driver_sql("EXPLAIN (FORMAT JSON) " + statement, parameters).scalar()
+        plan = result if isinstance(result, list) else json.loads(result)
+        return postgres_seq_scans(plan[0]["Plan"])
+
+    # SQLite reports a full scan as "SCAN <table>" with no "USING ... INDEX"
+    scans = []
+    for row in connection.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters):
+        detail = row[-1]
+        words = detail.split()
+        if words[0] == "SCAN" and "USING" not in words and words[1] in Base.metadata.tables:
+            scans.append(words[1])
+    return scans
+
+
+def planned_seq_scans(db, seeded: dict, name: str) -> set:
+    """Tables the hot query ``name`` scans sequentially"""
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(text("SET LOCAL enable_seqscan = off"))
+
+    scanned = set()
+    for statement, parameters in capture_selects(db, lambda: HOT_QUERIES[name](db, seeded)):
+        scanned.update(seq_scans(db, statement, parameters))
+    return scanned
+
+
+@pytest.mark.parametrize("name", list(HOT_QUERIES))
+def test_hot_query_uses_an_index(db, name):
+    seeded = seed(db)
+
+    assert planned_seq_scans(db, seeded, name) == set()
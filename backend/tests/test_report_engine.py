@@ -0,0 +1,25 @@
+from datetime import datetime
+import pandas as pd
+from schemas.report import ReportParameters
+from services.report_engine import SUM_METRICS, compute_from_frame
+
+
+def test_parameters_normalize_offsets_to_naive_utc():
+    parameters = ReportParameters(start="2024-01-01T02:00:00+02:00", end="2024-01-02T00:00:00Z")
+
+    assert parameters.start == datetime(2024, 1, 1, 0, 0)
+    assert parameters.end == datetime(2024, 1, 2, 0, 0)
+
+
+def test_stored_windows_with_an_offset_filter_naive_rows():
+    frame = pd.DataFrame({
+        "content_id": [1, 1, 1],
+        "recorded_at": pd.to_datetime(["2023-12-31T23:00:00", "2024-01-01T12:00:00", "2024-01-02T01:00:00"]),
+        "platform": ["youtube"] * 3,
+        "country": ["US"] * 3,
+        **{metric: [1.0, 1.0, 1.0] for metric in SUM_METRICS},
+    })
+
+    results = compute_from_frame(frame, [1], {"start": "2024-01-01T00:00:00Z", "end": "2024-01-02T00:00:00+00:00"})
+
+    assert results["row_count"] == 1
@@ -0,0 +1,71 @@
+import tracemalloc
+from datetime import datetime, timedelta
+import pytest
+from sqlalchemy import insert
+from core.config import settings
+from models.content import Content
+from models.content_metric import ContentMetric
+from models.report import Report
+from models.user import UserRole
+from services.report_export_service import stream_report_export
+
+ROWS = 40000
+START = datetime(2024, 1, 1)
+
+
+@pytest.fixture
+def reports(db, make_user, monkeypatch):
+    """A report over every metric row and one whose window holds a tenth of them"""
+    monkeypatch.setattr(settings, "REPORT_EXPORT_BATCH_SIZE", 1000)
+    agency = make_user(UserRole.AGENCY)
+    content = Content(title="Export", file_url="-", creator_id=agency.id)
+    db.add(content)
+    db.flush()
+
+    db.execute(insert(ContentMetric), [
+        {
+            "content_id": content.id,
+            "recorded_at": START + timedelta(minutes=index),
+            "platform": "youtube",
+            "country": "US",
+            "views": index,
+            "likes": index % 500,
+            "comments": index % 50,
+            "shares": index % 20,
+            "watch_time_seconds": index * 3,
+            "revenue": index % 100 / 10,
+        }
+        for index in range(ROWS)
+    ])
+    window_end = START + timedelta(minutes=ROWS // 10)
+    small = Report(
+        name="Tenth", agency_id=agency.id, content_id=content.id,
+        parameters={"start": START.isoformat(), "end": window_end.isoformat()}
+    )
+    full = Report(name="All", agency_id=agency.id, content_id=content.id, parameters={})
+    db.add_all([small, full])
+    db.commit()
+    return small.id, full.id
+
+
+def streamed_peak(report_id: int, export_format: str) -> tuple:
+    """Bytes produced and peak traced memory while a client drains the export"""
+    tracemalloc.start()
+    try:
+        total = sum(len(chunk) for chunk in stream_report_export(report_id, export_format))
+        return total, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.mark.parametrize("export_format", ["csv", "ndjson", "pdf"])
+def test_export_memory_stays_flat_as_rows_grow(reports, export_format):
+    small_id, full_id = reports
+    streamed_peak(small_id, export_format)  # warm statement caches and imports
+
+    small_bytes, small_peak = streamed_peak(small_id, export_format)
+    full_bytes, full_peak = streamed_peak(full_id, export_format)
+
+    # Ten times the rows (and output), but the same bounded working set
+    assert full_bytes > 9 * small_bytes
+    assert full_peak < 2 * small_peak
@@ -0,0 +1,85 @@
+import threading
+import time
+from datetime import datetime, timedelta
+import pytest
+from core.config import settings
+from database import SessionLocal
+from models.content import Content
+from models.report import Report, ReportStatus
+from models.user import UserRole
+from services import report_job_service
+from services.report_job_service import ReportJobService
+
+
+@pytest.fixture
+def running_report(db, make_user):
+    agency = make_user(UserRole.AGENCY)
+    content = Content(title="Video", file_url="-", creator_id=make_user(UserRole.CREATOR).id)
+    db.add(content)
+    db.flush()
+    report = Report(name="Weekly", agency_id=agency.id, content_id=content.id, parameters={})
+    db.add(report)
+    db.commit()
+    return ReportJobService(db).claim_next()
+
+
+def age(db, report, **columns):
+    for column, seconds in columns.items():
+        setattr(report, column, datetime.utcnow() - timedelta(seconds=seconds))
+    db.commit()
+
+
+def test_long_running_job_with_a_heartbeat_is_not_requeued(db, running_report):
+    age(db, running_report, started_at=settings.REPORT_JOB_TIMEOUT_SECONDS * 3, heartbeat_at=1)
+
+    assert ReportJobService(db).requeue_stale() == 0
+    db.refresh(running_report)
+    assert running_report.status == ReportStatus.RUNNING
+
+
+def test_job_with_a_missed_heartbeat_is_requeued(db, running_report):
+    timeout = settings.REPORT_JOB_TIMEOUT_SECONDS
+    age(db, running_report, started_at=timeout * 3, heartbeat_at=timeout + 1)
+
+    assert ReportJobService(db).requeue_stale() == 1
+    db.refresh(running_report)
+    assert running_report.status == ReportStatus.QUEUED
+    assert running_report.heartbeat_at is None
+
+
+def test_single_slow_item_keeps_its_heartbeat(db, running_report, monkeypatch):
+    monkeypatch.setattr(settings, "REPORT_JOB_TIMEOUT_SECONDS", 1)
+    monkeypatch.setattr(settings, "REPORT_JOB_HEARTBEAT_SECONDS", 0.1)
+    sweeps = []
+
+    def slow_compute(self, report, content_ids, progress=None):
+        # One content item, so no progress callback until it is done
+        time.sleep(1.5)
+        sweeper = SessionLocal()
+        try:
+            sweeps.append(ReportJobService(sweeper).requeue_stale())
+        finally:
+            sweeper.close()
+        return {"totals": {}}
+
+    monkeypatch.setattr(report_job_service.ReportPartialService, "compute", slow_compute)
+
+    ReportJobService(db).run(running_report)
+
+    assert sweeps == [0]
+    db.refresh(running_report)
+    assert running_report.status == ReportStatus.DONE
+    assert not any(thread.name.startswith("report-heartbeat-") for thread in threading.enumerate())
+
+
+def test_cache_write_error_fails_the_job(db, running_report, monkeypatch):
+    def broken_put(self, key, results):
+        raise RuntimeError("cache unavailable")
+
+    monkeypatch.setattr(report_job_service.ReportCacheService, "put", broken_put)
+
+    ReportJobService(db).run(running_report)
+
+    db.refresh(running_report)
+    assert running_report.status == ReportStatus.FAILED
+    assert "cache unavailable" in running_report.error
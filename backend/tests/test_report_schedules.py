@@ -0,0 +1,130 @@
+from datetime import datetime, timedelta
+import pytest
+from sqlalchemy import insert
+from core.config import settings
+from models.content import Content
+from models.content_metric import ContentMetric
+from models.report import Report, ReportStatus
+from models.report_schedule import ReportSchedule, ReportFrequency
+from models.user import UserRole
+from services.email_service import email_service
+from services.report_schedule_service import ReportScheduleService, run_schedule_group
+from tests.helpers import auth_headers
+
+SAVED = {"start": "2024-01-01T00:00:00", "end": "2024-02-01T00:00:00", "granularity": "day"}
+SAVED_RESULTS = {"totals": {"views": 1}}
+
+
+@pytest.fixture
+def scheduled(db, make_user):
+    """A finished report with its own saved window, scheduled weekly, and a
+    metric row per day through January and February 2024"""
+    agency = make_user(UserRole.AGENCY)
+    content = Content(title="Video", file_url="-", creator_id=agency.id)
+    db.add(content)
+    db.flush()
+    db.execute(insert(ContentMetric), [
+        {"content_id": content.id, "recorded_at": datetime(2024, 1, 1) + timedelta(days=day), "views": 10}
+        for day in range(60)
+    ])
+    report = Report(
+        name="Saved", agency_id=agency.id, content_id=content.id, parameters=dict(SAVED),
+        results=dict(SAVED_RESULTS), status=ReportStatus.DONE, progress=1.0
+    )
+    db.add(report)
+    db.flush()
+    schedule = ReportSchedule(report_id=report.id, frequency=ReportFrequency.WEEKLY, next_run_at=datetime.utcnow())
+    db.add(schedule)
+    db.commit()
+    return agency, report, schedule
+
+
+def test_scheduled_run_leaves_the_saved_window_alone(db, scheduled):
+    _, report, schedule = scheduled
+    run = {
+        "schedule_id": schedule.id, "report_id": report.id,
+        "start": "2024-02-05T00:00:00", "end": "2024-02-12T00:00:00",
+    }
+
+    assert run_schedule_group([run]) == 1
+
+    db.expire_all()
+    assert report.parameters == SAVED
+    assert report.results == SAVED_RESULTS
+    assert schedule.last_period_start == datetime(2024, 2, 5)
+    assert schedule.last_period_end == datetime(2024, 2, 12)
+    assert schedule.last_results["totals"]["views"] == 70
+    assert schedule.last_error is None
+
+
+def test_export_window_can_be_overridden(db, client, scheduled):
+    agency, report, _ = scheduled
+    url = f"/api/v1/reports/{report.id}/export"
+
+    saved = client.get(url, headers=auth_headers(agency))
+    assert len(saved.text.splitlines()) == 1 + 31
+
+    period = client.get(
+        url, params={"start": "2024-02-05T00:00:00Z", "end": "2024-02-12T00:00:00Z"},
+        headers=auth_headers(agency)
+    )
+    assert len(period.text.splitlines()) == 1 + 7
+
+    inverted = client.get(
+        url, params={"start": "2024-02-12T00:00:00", "end": "2024-02-05T00:00:00"},
+        headers=auth_headers(agency)
+    )
+    assert inverted.status_code == 400
+
+
+def claim(db, now):
+    return ReportScheduleService(db).claim_due(now)
+
+
+def test_unfinished_period_is_claimed_again(db, scheduled):
+    _, report, schedule = scheduled
+    schedule.next_run_at = datetime(2024, 2, 12, 0, 5)
+    db.commit()
+    now = datetime(2024, 2, 12, 1, 0)
+
+    (run,) = claim(db, now)
+    assert (run["start"], run["end"]) == ("2024-02-05T00:00:00", "2024-02-12T00:00:00")
+    next_run_at = db.get(ReportSchedule, schedule.id).next_run_at
+    assert next_run_at > now
+
+    # The worker died before finishing: nothing is lost, only deferred
+    assert claim(db, now + timedelta(seconds=60)) == []
+    retry_at = now + timedelta(seconds=settings.REPORT_SCHEDULE_RETRY_SECONDS)
+    assert claim(db, retry_at) == [run]
+    db.expire_all()
+    assert schedule.next_run_at == next_run_at
+
+    assert run_schedule_group([run]) == 1
+    db.expire_all()
+    assert schedule.pending_period_start is None
+    assert schedule.last_period_end == datetime(2024, 2, 12)
+    assert claim(db, retry_at + timedelta(seconds=settings.REPORT_SCHEDULE_RETRY_SECONDS)) == []
+
+    (following,) = claim(db, next_run_at)
+    assert (following["start"], following["end"]) == ("2024-02-12T00:00:00", "2024-02-19T00:00:00")
+
+
+def test_failed_send_keeps_the_period_pending(db, scheduled, monkeypatch):
+    _, _, schedule = scheduled
+    schedule.next_run_at = datetime(2024, 2, 12, 0, 5)
+    db.commit()
+    (run,) = claim(db, datetime(2024, 2, 12, 1, 0))
+
+    monkeypatch.setattr(settings, "SMTP_HOST", "smtp.example.com")
+    sent = []
+    monkeypatch.setattr(email_service, "send_email", lambda to, subject, body: sent.append(to) or len(sent) > 1)
+
+    run_schedule_group([run])
+    db.expire_all()
+    assert schedule.pending_period_start == datetime(2024, 2, 5)
+    assert schedule.last_results is not None
+
+    run_schedule_group([run])
+    db.expire_all()
+    assert schedule.pending_period_start is None
+    assert len(sent) == 2
@@ -0,0 +1,72 @@
+from datetime import datetime
+import pytest
+from models.content import Content
+from models.report import Report
+from models.user import UserRole
+from tests.helpers import auth_headers
+
+CREATED_AT = datetime(2024, 5, 1, 12, 0, 0)
+
+
+@pytest.fixture
+def shared_content(db, make_user):
+    """One content item reported on by two agencies, with created_at ties"""
+    agency, rival = make_user(UserRole.AGENCY), make_user(UserRole.AGENCY)
+    content = Content(title="Shared", file_url="-", creator_id=make_user(UserRole.CREATOR).id)
+    db.add(content)
+    db.flush()
+
+    reports = []
+    for index in range(9):
+        # Three reports per timestamp, so paging has to break ties on id
+        created_at = CREATED_AT.replace(hour=12 + index // 3)
+        reports.append(Report(name=f"Ours {index}", agency_id=agency.id, content_id=content.id, created_at=created_at))
+        reports.append(Report(name=f"Theirs {index}", agency_id=rival.id, content_id=content.id, created_at=created_at))
+    db.add_all(reports)
+    db.commit()
+    return agency, rival, content
+
+
+def pages(client, user, content_id, limit):
+    cursor, seen = None, []
+    while True:
+        params = {"limit": limit, "fields": "id,name,agency_id,created_at", **({"cursor": cursor} if cursor else {})}
+        response = client.get(f"/api/v1/reports/content/{content_id}", params=params, headers=auth_headers(user))
+        assert response.status_code == 200, response.text
+        data = response.json()["data"]
+        seen.extend(data["items"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            return seen
+
+
+@pytest.mark.parametrize("limit", [1, 2, 4, 100])
+def test_keyset_pages_cover_each_report_once(client, db, shared_content, limit):
+    agency, _, content = shared_content
+    expected = [
+        report.id for report in db.query(Report)
+        .filter(Report.content_id == content.id, Report.agency_id == agency.id)
+        .order_by(Report.created_at.desc(), Report.id.desc())
+    ]
+
+    seen = pages(client, agency, content.id, limit)
+
+    assert [item["id"] for item in seen] == expected
+    assert all(item["agency_id"] == agency.id for item in seen)
+
+
+def test_agencies_only_see_their_own_reports(client, shared_content, make_user):
+    agency, rival, content = shared_content
+
+    assert {item["name"][:4] for item in pages(client, agency, content.id, 5)} == {"Ours"}
+    assert {item["name"][:6] for item in pages(client, rival, content.id, 5)} == {"Theirs"}
+    assert len(pages(client, make_user(UserRole.ADMIN), content.id, 5)) == 18
+
+
+@pytest.mark.parametrize("cursor", ["garbage", "bm90IGpzb24=", "WyJub3QgYSBkYXRlIiwgMV0="])
+def test_malformed_cursor_is_rejected(client, shared_content, cursor):
+    agency, _, content = shared_content
+    response = client.get(
+        f"/api/v1/reports/content/{content.id}", params={"cursor": cursor}, headers=auth_headers(agency)
+    )
+    assert response.status_code == 400
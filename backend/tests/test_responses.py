@@ -0,0 +1,53 @@
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from core.responses import file_response, parse_range
+
+
+def test_parse_range():
+    assert parse_range(None, 10) is None
+    assert parse_range("bytes=2-5", 10) == (2, 5)
+    assert parse_range("bytes=2-", 10) == (2, 9)
+    assert parse_range("bytes=-3", 10) == (7, 9)
+    assert parse_range("bytes=-30", 10) == (0, 9)
+    with pytest.raises(ValueError):
+        parse_range("bytes=10-", 10)
+
+
+@pytest.mark.parametrize("header", ["bytes=-5", "bytes=0-", "bytes=0-0"])
+def test_parse_range_rejects_any_range_on_empty_file(header):
+    with pytest.raises(ValueError):
+        parse_range(header, 0)
+
+
+@pytest.fixture
+def serve(tmp_path):
+    app = FastAPI()
+
+    @app.get("/files/{name}")
+    def serve_file(name: str, request: Request):
+        return file_response(str(tmp_path / name), request)
+
+    return tmp_path, TestClient(app)
+
+
+def test_suffix_range_on_empty_file_is_416(serve):
+    root, client = serve
+    (root / "empty.bin").write_bytes(b"")
+
+    response = client.get("/files/empty.bin", headers={"Range": "bytes=-5"})
+    assert response.status_code == 416
+    assert response.headers["content-range"] == "bytes */0"
+
+    # Without a Range header the empty file is still served in full
+    assert client.get("/files/empty.bin").status_code == 200
+
+
+def test_suffix_range(serve):
+    root, client = serve
+    (root / "data.bin").write_bytes(b"0123456789")
+
+    response = client.get("/files/data.bin", headers={"Range": "bytes=-3"})
+    assert response.status_code == 206
+    assert response.headers["content-range"] == "bytes 7-9/10"
+    assert response.content == b"789"
@@ -0,0 +1,86 @@
+import pytest
+from models.content import Content
+from models.report import Report
+from models.user import UserRole
+from tests.helpers import auth_headers
+
+
+@pytest.fixture
+def catalog(db, make_user):
+    """Two creators' content and two agencies' reports, all titled "alpha ..." """
+    users = {
+        "creator": make_user(UserRole.CREATOR),
+        "other_creator": make_user(UserRole.CREATOR),
+        "agency": make_user(UserRole.AGENCY),
+        "other_agency": make_user(UserRole.AGENCY),
+        "admin": make_user(UserRole.ADMIN),
+    }
+    own = Content(title="alpha launch video", file_url="-", creator_id=users["creator"].id)
+    other = Content(title="alpha teaser", file_url="-", creator_id=users["other_creator"].id)
+    db.add_all([own, other])
+    db.flush()
+    db.add_all([
+        Report(name="alpha weekly", agency_id=users["agency"].id, content_id=own.id),
+        Report(name="alpha monthly", agency_id=users["other_agency"].id, content_id=own.id),
+    ])
+    db.commit()
+    return users
+
+
+def search(client, user, **params):
+    response = client.get("/api/v1/search/", params=params, headers=auth_headers(user))
+    assert response.status_code == 200, response.text
+    return response.json()["data"]
+
+
+def labels(result):
+    return sorted(item["label"] for item in result["items"])
+
+
+def test_visibility_is_applied_in_the_query(client, catalog):
+    assert labels(search(client, catalog["creator"], q="alpha")) == ["alpha launch video"]
+    assert labels(search(client, catalog["other_creator"], q="alpha")) == ["alpha teaser"]
+    # Reports on a creator's content still belong to the agencies
+    assert labels(search(client, catalog["creator"], q="alpha", type="report")) == []
+    assert labels(search(client, catalog["agency"], q="alpha")) == ["alpha weekly"]
+    assert labels(search(client, catalog["other_agency"], q="alpha")) == ["alpha monthly"]
+    assert labels(search(client, catalog["admin"], q="alpha")) == [
+        "alpha launch video", "alpha monthly", "alpha teaser", "alpha weekly"
+    ]
+
+
+def test_keyset_pages_have_no_duplicates_or_gaps(client, db, make_user):
+    admin = make_user(UserRole.ADMIN)
+    creator = make_user(UserRole.CREATOR)
+    # Identical titles tie on rank, so paging relies on (kind, id)
+    contents = [Content(title="gamma clip", file_url="-", creator_id=creator.id) for _ in range(7)]
+    db.add_all(contents)
+    db.flush()
+    db.add_all([Report(name="gamma clip", agency_id=admin.id, content_id=contents[0].id) for _ in range(4)])
+    db.add(Content(title="gamma clip with a longer title", file_url="-", creator_id=creator.id))
+    db.commit()
+
+    everything = search(client, admin, q="gamma", limit=100)["items"]
+    assert len(everything) == 12
+
+    paged, cursor = [], None
+    while True:
+        params = {"q": "gamma", "limit": 5, **({"cursor": cursor} if cursor else {})}
+        page = search(client, admin, **params)
+        paged.extend(page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    key = [(item["kind"], item["id"]) for item in paged]
+    assert len(set(key)) == len(key)
+    assert key == [(item["kind"], item["id"]) for item in everything]
+
+
+@pytest.mark.parametrize("cursor", ["garbage", "WzEsMl0=", "bm90IGpzb24="])
+def test_malformed_cursor_is_rejected(client, make_user, cursor):
+    response = client.get(
+        "/api/v1/search/", params={"q": "alpha", "cursor": cursor},
+        headers=auth_headers(make_user(UserRole.ADMIN))
+    )
+    assert response.status_code == 400
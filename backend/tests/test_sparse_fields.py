@@ -0,0 +1,70 @@
+from datetime import datetime
+import pytest
+from models.user import UserRole
+from models.content import Content
+from models.report import Report
+from models.subscription import Subscription, SubscriptionStatus
+from models.subscription_plan import SubscriptionPlan
+from schemas.content import CONTENT_LIST_FIELDS
+from schemas.report import REPORT_LIST_FIELDS
+from schemas.subscription import SUBSCRIPTION_LIST_FIELDS
+from tests.helpers import auth_headers
+
+WHITELISTS = [
+    (Content, CONTENT_LIST_FIELDS),
+    (Report, REPORT_LIST_FIELDS),
+    (Subscription, SUBSCRIPTION_LIST_FIELDS),
+]
+
+
+@pytest.mark.parametrize("model, allowed", WHITELISTS)
+def test_whitelists_name_only_columns(model, allowed):
+    assert set(allowed) <= set(model.__table__.columns.keys())
+
+
+@pytest.fixture
+def seeded(db, make_user):
+    admin = make_user(UserRole.ADMIN)
+    plan = SubscriptionPlan(name="Pro", price=10, features="{}")
+    db.add(plan)
+    db.flush()
+    content = Content(title="Video", file_url="-", creator_id=admin.id)
+    db.add(content)
+    db.flush()
+    db.add_all([
+        Report(name="Weekly", agency_id=admin.id, content_id=content.id),
+        Subscription(user_id=admin.id, plan_id=plan.id, status=SubscriptionStatus.ACTIVE, started_at=datetime.utcnow()),
+    ])
+    db.commit()
+    return {"admin": admin, "content": content}
+
+
+@pytest.mark.parametrize("path, allowed", [
+    ("/api/v1/content/my-content", CONTENT_LIST_FIELDS),
+    ("/api/v1/content/", CONTENT_LIST_FIELDS),
+    ("/api/v1/reports/my-reports", REPORT_LIST_FIELDS),
+    ("/api/v1/reports/", REPORT_LIST_FIELDS),
+    ("/api/v1/reports/content/{content_id}", REPORT_LIST_FIELDS),
+    ("/api/v1/subscriptions/", SUBSCRIPTION_LIST_FIELDS),
+])
+def test_every_whitelisted_field_can_be_requested(client, seeded, path, allowed):
+    url = path.format(content_id=seeded["content"].id)
+    headers = auth_headers(seeded["admin"])
+
+    for field in allowed:
+        response = client.get(url, params={"fields": field}, headers=headers)
+        assert response.status_code == 200, (field, response.text)
+        items = response.json()["data"]["items"]
+        assert items and all(set(item) == {field} for item in items)
+
+    response = client.get(url, params={"fields": ",".join(allowed)}, headers=headers)
+    assert response.status_code == 200
+    assert set(response.json()["data"]["items"][0]) == set(allowed)
+
+
+@pytest.mark.parametrize("fields", ["description", "id,password_hash", ","])
+def test_unknown_fields_are_rejected(client, seeded, fields):
+    response = client.get(
+        "/api/v1/content/my-content", params={"fields": fields}, headers=auth_headers(seeded["admin"])
+    )
+    assert response.status_code == 400
@@ -0,0 +1,120 @@
+import asyncio
+import hashlib
+import os
+import pytest
+from core.config import settings
+from models.content import Content
+from models.content_upload import ContentUpload
+from models.user import UserRole
+from services import upload_service
+from services.storage_service import LocalStorageBackend, StorageBackend, get_storage_backend
+from tests.helpers import auth_headers
+
+
+async def stream_of(*chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return LocalStorageBackend(str(tmp_path), "/media")
+
+
+@pytest.fixture(autouse=True)
+def no_metadata_workers(monkeypatch):
+    monkeypatch.setattr(upload_service, "schedule_metadata_extraction", lambda *args, **kwargs: None)
+
+
+def test_storage_backend_is_abstract():
+    with pytest.raises(TypeError):
+        StorageBackend()
+
+
+def test_local_backend_round_trip(storage):
+    storage.write_chunk("content/1/a/video.mp4", b"hello ", 0)
+    storage.write_chunk("content/1/a/video.mp4", b"world", 6)
+
+    assert storage.size("content/1/a/video.mp4") == 11
+    assert storage.exists("content/1/a/video.mp4")
+    with storage.open_read("content/1/a/video.mp4") as f:
+        assert f.read() == b"hello world"
+    assert storage.url("content/1/a/video.mp4") == "/media/content/1/a/video.mp4"
+
+    storage.write_chunk("content/1/a/video.mp4", b"HELLO", 0)  # Rewrites truncate
+    assert storage.size("content/1/a/video.mp4") == 5
+
+    storage.delete("content/1/a/video.mp4")
+    storage.delete("content/1/a/video.mp4")
+    assert storage.size("content/1/a/video.mp4") is None
+
+
+def test_local_backend_rejects_keys_outside_the_root(storage):
+    with pytest.raises(ValueError):
+        storage.path("../outside.mp4")
+
+
+def test_save_stream_writes_in_chunks_and_hashes(storage, monkeypatch):
+    monkeypatch.setattr(settings, "UPLOAD_CHUNK_SIZE", 4)
+    data = os.urandom(23)
+
+    stored = asyncio.run(storage.save_stream("k/file.bin", stream_of(data[:5], data[5:17], data[17:])))
+
+    assert stored == {"size": 23, "checksum": hashlib.sha256(data).hexdigest()}
+    assert storage.checksum("k/file.bin") == hashlib.sha256(data).hexdigest()
+    assert storage.hash_prefix("k/file.bin", 10).hexdigest() == hashlib.sha256(data[:10]).hexdigest()
+
+
+def test_save_stream_enforces_max_size(storage):
+    with pytest.raises(ValueError):
+        asyncio.run(storage.save_stream("k/file.bin", stream_of(b"x" * 10), max_size=9))
+
+
+def start_upload(client, headers, size):
+    response = client.post(
+        "/api/v1/content/uploads", json={"title": "Big", "filename": "big.mov", "total_size": size}, headers=headers
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def put_chunk(client, headers, upload_id, chunk, start, total):
+    return client.put(
+        f"/api/v1/content/uploads/{upload_id}",
+        content=chunk,
+        headers={**headers, "Content-Range": f"bytes {start}-{start + len(chunk) - 1}/{total}"}
+    )
+
+
+def test_resumable_upload_hashes_each_byte_once(client, db, make_user, monkeypatch):
+    headers = auth_headers(make_user(UserRole.CREATOR))
+    data = os.urandom(3 * 1024 + 17)
+    upload_id = start_upload(client, headers, len(data))
+
+    reads = []
+    original = LocalStorageBackend.iter_chunks
+    monkeypatch.setattr(LocalStorageBackend, "iter_chunks", lambda self, *a, **k: reads.append(a) or original(self, *a, **k))
+
+    for start in range(0, len(data), 1024):
+        response = put_chunk(client, headers, upload_id, data[start:start + 1024], start, len(data))
+        assert response.status_code == 200, response.text
+
+    upload = response.json()
+    assert upload["status"] == "completed"
+    assert reads == []  # Never re-read from storage
+    content = db.get(Content, upload["content_id"])
+    with get_storage_backend().open_read(content.storage_key) as f:
+        assert f.read() == data
+
+
+def test_resumable_upload_checksum_survives_a_lost_hash_state(client, db, make_user):
+    headers = auth_headers(make_user(UserRole.CREATOR))
+    data = os.urandom(2048)
+    upload_id = start_upload(client, headers, len(data))
+
+    assert put_chunk(client, headers, upload_id, data[:1000], 0, len(data)).status_code == 200
+    upload_service._running_hashes.clear()  # e.g. the next chunk lands on another worker
+    response = put_chunk(client, headers, upload_id, data[1000:], 1000, len(data))
+
+    assert response.json()["status"] == "completed"
+    assert db.get(ContentUpload, upload_id).checksum == hashlib.sha256(data).hexdigest()
@@ -0,0 +1,68 @@
+import pytest
+from models.user import UserRole
+from models.subscription import Subscription, SubscriptionStatus
+from models.subscription_plan import SubscriptionPlan
+from schemas.subscription import SubscriptionCreate
+from services import payment_service
+from services.payment_service import PaymentService
+from services.subscription_service import SubscriptionService
+from tests.helpers import run_in_parallel
+
+
+@pytest.fixture
+def user_and_plan(db, make_user):
+    user = make_user(UserRole.CREATOR)
+    plan = SubscriptionPlan(name="Pro", price=10, features="{}")
+    db.add(plan)
+    db.commit()
+    return user.id, plan.id
+
+
+def active_subscriptions(db, user_id):
+    db.expire_all()
+    return db.query(Subscription).filter(
+        Subscription.user_id == user_id, Subscription.status == SubscriptionStatus.ACTIVE
+    ).all()
+
+
+def test_parallel_creates_leave_one_active_subscription(db, user_and_plan):
+    user_id, plan_id = user_and_plan
+    create = lambda session: SubscriptionService(session).create_subscription(
+        SubscriptionCreate(user_id=user_id, plan_id=plan_id), user_id
+    )
+
+    outcomes = run_in_parallel(create, create, create)
+
+    assert sum(isinstance(outcome, Subscription) for outcome in outcomes) == 1
+    assert all(getattr(outcome, "status_code", None) == 400 for outcome in outcomes if not isinstance(outcome, Subscription))
+    assert len(active_subscriptions(db, user_id)) == 1
+
+
+def test_parallel_checkouts_cancel_the_losing_stripe_subscription(db, user_and_plan, monkeypatch):
+    user_id, plan_id = user_and_plan
+    deleted = []
+    monkeypatch.setattr(payment_service.stripe.Subscription, "delete", lambda stripe_id: deleted.append(stripe_id))
+
+    def checkout(stripe_id):
+        session = {"metadata": {"user_id": str(user_id), "plan_id": str(plan_id)}, "subscription": stripe_id}
+        return lambda db_session: PaymentService(db_session).handle_checkout_completed(session)
+
+    outcomes = run_in_parallel(checkout("sub_first"), checkout("sub_second"))
+
+    assert outcomes == [None, None]
+    active = active_subscriptions(db, user_id)
+    assert len(active) == 1
+    assert deleted == [{"sub_first", "sub_second"}.difference({active[0].stripe_subscription_id}).pop()]
+
+
+def test_redelivered_checkout_is_not_canceled(db, user_and_plan, monkeypatch):
+    user_id, plan_id = user_and_plan
+    deleted = []
+    monkeypatch.setattr(payment_service.stripe.Subscription, "delete", lambda stripe_id: deleted.append(stripe_id))
+    session = {"metadata": {"user_id": str(user_id), "plan_id": str(plan_id)}, "subscription": "sub_once"}
+
+    PaymentService(db).handle_checkout_completed(session)
+    PaymentService(db).handle_checkout_completed(session)
+
+    assert len(active_subscriptions(db, user_id)) == 1
+    assert deleted == []
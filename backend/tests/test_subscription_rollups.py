@@ -0,0 +1,48 @@
+from datetime import date, timedelta
+from decimal import Decimal
+from models.subscription_plan import SubscriptionPlan
+from models.subscription_rollup import SubscriptionDailyRollup
+from services.subscription_rollup_service import SubscriptionRollupService
+
+START = date(2024, 3, 1)
+END = date(2024, 3, 7)
+
+
+def test_daily_metrics_cover_every_day_and_plan(db):
+    steady = SubscriptionPlan(name="Steady", price=Decimal("10.00"))
+    churning = SubscriptionPlan(name="Churning", price=Decimal("25.00"))
+    quiet = SubscriptionPlan(name="Never sold", price=Decimal("5.00"))
+    db.add_all([steady, churning, quiet])
+    db.flush()
+    db.add_all([
+        # Activity before the window seeds the running totals
+        SubscriptionDailyRollup(day=START - timedelta(days=40), plan_id=steady.id, activations=50, mrr_delta=500),
+        SubscriptionDailyRollup(day=START - timedelta(days=3), plan_id=churning.id, activations=2, mrr_delta=50),
+        # Inside the window, with quiet days around it
+        SubscriptionDailyRollup(day=date(2024, 3, 4), plan_id=churning.id, cancellations=1, mrr_delta=-25),
+        # After the window, ignored
+        SubscriptionDailyRollup(day=END + timedelta(days=1), plan_id=steady.id, activations=7, mrr_delta=70),
+    ])
+    db.commit()
+
+    metrics = SubscriptionRollupService(db).get_daily_metrics(START, END)
+
+    days = [(START + timedelta(days=offset)).isoformat() for offset in range(7)]
+    plans = sorted([steady.id, churning.id, quiet.id])
+    assert [(row["day"], row["plan_id"]) for row in metrics] == [(day, plan) for day in days for plan in plans]
+
+    by_key = {(row["day"], row["plan_id"]): row for row in metrics}
+    for day in days:
+        assert by_key[day, steady.id]["active_subscribers"] == 50
+        assert by_key[day, steady.id]["mrr"] == 500.0
+        assert by_key[day, quiet.id]["active_subscribers"] == 0
+        assert by_key[day, quiet.id]["mrr"] == 0.0
+
+        before_cancel = day < "2024-03-04"
+        churned = by_key[day, churning.id]
+        assert churned["active_subscribers"] == (2 if before_cancel else 1)
+        assert churned["mrr"] == (50.0 if before_cancel else 25.0)
+        assert churned["cancellations"] == (1 if day == "2024-03-04" else 0)
+        assert churned["activations"] == 0
+
+    assert by_key["2024-03-04", churning.id]["churn_rate"] == 0.5